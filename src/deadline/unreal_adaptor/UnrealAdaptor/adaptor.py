@@ -5,9 +5,11 @@ from __future__ import annotations
 import os
 import re
 import sys
+import json
 import time
 import logging
 import threading
+from dataclasses import asdict
 from typing import Callable
 
 from deadline.client.api import get_deadline_cloud_library_telemetry_client, TelemetryClient
@@ -15,15 +17,35 @@ from openjd.adaptor_runtime._version import version as openjd_adaptor_version
 from openjd.adaptor_runtime_client import Action
 from openjd.adaptor_runtime.process import LoggingSubprocess
 from openjd.adaptor_runtime.adaptors import Adaptor, SemanticVersion
-from openjd.adaptor_runtime.app_handlers import RegexCallback, RegexHandler
-from openjd.adaptor_runtime.application_ipc import ActionsQueue, AdaptorServer
+from openjd.adaptor_runtime.app_handlers import RegexCallback
+from openjd.adaptor_runtime.application_ipc import ActionsQueue
 from openjd.adaptor_runtime.adaptors.configuration import AdaptorConfiguration
 
 from .._version import version as adaptor_version
+from .adaptor_server import AdaptorServer
+from .asset_registry_cache import AssetRegistryCache
 from .common import DataValidation, add_module_to_pythonpath
+from .ddc import DerivedDataCacheStats, LocalDerivedDataCache
+from .log_policy import UnrealLogArchive, UnrealLogPolicy
+from .memory_guard import MemoryGuard
+from .process_stats import (
+    ProcessTreeStats,
+    get_cpu_time,
+    get_memory_usage,
+    get_process_tree_stats,
+)
+from .progress import ProgressCoalescer
+from .regex_handler import PrefilteredRegexHandler
+from .script_pool import ScriptProcessPool
+from .startup_profiler import StartupProfiler
+from .task_metrics import TaskMetrics, TaskMetricsSampler
+from .watchdog import StallWatchdog
 
 logger = logging.getLogger(__name__)
 
+# Logger of the Unreal stdout and stderr lines forwarded to the worker log
+unreal_output_logger = logging.getLogger(f"{__name__}.unreal_output")
+
 
 class UnrealNotRunningError(Exception):
     """Error that is raised when attempting to use Unreal while it is not running"""
@@ -31,7 +53,68 @@ class UnrealNotRunningError(Exception):
     pass
 
 
-class UnrealSubprocessWithLogs(LoggingSubprocess): ...
+class UnrealSubprocessWithLogs(LoggingSubprocess):
+    """
+    LoggingSubprocess that notifies the given callback as soon as the Unreal process exits,
+    so the adaptor does not have to poll the process state.
+    """
+
+    def __init__(self, *args, on_exit: Callable[[], None] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._on_exit = on_exit
+        self._exit_watcher_thread = threading.Thread(
+            target=self._watch_exit, name="UnrealSubprocessExitWatcher", daemon=True
+        )
+        self._exit_watcher_thread.start()
+
+    def _watch_exit(self) -> None:
+        """Block until the Unreal process exits and notify the exit callback"""
+        self._process.wait()
+        if self._on_exit is not None:
+            self._on_exit()
+
+
+class UnrealActionsQueue(ActionsQueue):
+    """
+    ActionsQueue that notifies the given callback when the action is dequeued by the UnrealClient
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._dequeue_callbacks: dict[int, Callable[[Action], None]] = {}
+
+    def enqueue_action(
+        self,
+        a: Action,
+        front: bool = False,
+        on_dequeue: Callable[[Action], None] | None = None,
+    ) -> None:
+        """
+        Enqueue the action to the end (or to the front) of the queue.
+
+        :param a: The action to be enqueued
+        :param front: Whether we want to append to the front of the queue
+        :param on_dequeue: Callback to call with the action when the UnrealClient dequeues it
+        """
+        if on_dequeue is not None:
+            self._dequeue_callbacks[id(a)] = on_dequeue
+        super().enqueue_action(a, front=front)
+
+    def dequeue_action(self) -> Action | None:
+        action = super().dequeue_action()
+        if action is not None:
+            on_dequeue = self._dequeue_callbacks.pop(id(action), None)
+            if on_dequeue is not None:
+                on_dequeue(action)
+        return action
+
+    def clear(self) -> None:
+        """
+        Remove all the actions and their callbacks from the queue
+        """
+        self._actions_queue.clear()
+        self._dequeue_callbacks.clear()
 
 
 class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
@@ -43,6 +126,16 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
     _SERVER_END_TIMEOUT_SECONDS = 30
     _UNREAL_START_TIMEOUT_SECONDS = 86400
     _UNREAL_END_TIMEOUT_SECONDS = 30
+    _TASK_STATE_CHECK_INTERVAL_SECONDS = 1
+    _PROGRESS_REPORT_INTERVAL_SECONDS = 1.0
+    _PROGRESS_REPORT_MIN_DELTA = 1.0
+    _STARTUP_REPORT_FILE_NAME = "unreal_adaptor_startup_timings.json"
+    _WATCHDOG_STARTUP_TIMEOUT_SECONDS = 1800
+    _WATCHDOG_ASSET_LOADING_TIMEOUT_SECONDS = 1800
+    _WATCHDOG_FRAME_TIMEOUT_SECONDS = 3600
+    _WATCHDOG_CHECK_INTERVAL_SECONDS = 10
+    _MEMORY_SAMPLE_INTERVAL_SECONDS = 30
+    _TASK_METRICS_SAMPLE_INTERVAL_SECONDS = 5
 
     _server: AdaptorServer | None = None
 
@@ -50,7 +143,7 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
 
     _unreal_client: UnrealSubprocessWithLogs | None = None
 
-    _action_queue = ActionsQueue()
+    _action_queue = UnrealActionsQueue()
 
     _is_rendering: bool = False
 
@@ -60,11 +153,74 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
 
     _telemetry_client: TelemetryClient | None = None
 
+    _log_policy: UnrealLogPolicy | None = None
+
+    _log_archive: UnrealLogArchive | None = None
+
+    _watchdog: StallWatchdog | None = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.data_validation = DataValidation()
 
+        # Set by the stdout callbacks, client_loaded action and by the Unreal process exit
+        # to wake up the waiting for Unreal start and on_run
+        self._unreal_state_event = threading.Event()
+
+        self._server_ready_event = threading.Event()
+        self._client_loaded_event = threading.Event()
+
+        # Set when the UnrealClient announces the structured events. The regex callbacks
+        # stay active as the fallback for the events that are lost
+        self._client_events = False
+
+        # Set by the first completion of the current task, either the complete event
+        # or the complete log line, and reset by on_run, so the task is completed once
+        self._task_completed = False
+
+        # Id of the current task, incremented by on_run and sent with the set_handler action.
+        # The client tags the step handler events with it and logs it when the task starts,
+        # the stdout reader lags behind, so it keeps the id of the task it reads the log of.
+        # The events and the log lines of the other tasks are ignored
+        self._task_id = 0
+        self._log_task_id = 0
+
+        # Times the session startup phases until the first run_script
+        self._startup_profiler = StartupProfiler()
+
+        # Samples the editor memory, the editor is restarted between the tasks
+        # when it exceeds the ceiling. Ceiling is set from the init_data in on_start
+        self._memory_guard = MemoryGuard(memory_usage=self._get_unreal_memory_usage)
+        self._recycle_count = 0
+
+        # Worker local DerivedDataCache persisting between the sessions, set from the init_data
+        # in on_start. Hit and miss statistics are parsed from the editor log
+        self._ddc: LocalDerivedDataCache | None = None
+        self._ddc_stats = DerivedDataCacheStats()
+
+        # Worker local cache of the project asset registry state, set from the init_data
+        # in on_start. Restored before the editor starts and refreshed after its clean shutdown
+        self._asset_registry_cache: AssetRegistryCache | None = None
+
+        # Executes the custom scripts of the steps that don't need Unreal Editor,
+        # set from the init_data in on_start. The editor is not started when it is set
+        self._script_pool: ScriptProcessPool | None = None
+
+        # Samples the resources used by the Unreal process tree per task.
+        # Sample interval and the Prometheus textfile are set from the init_data in on_start
+        self._task_metrics_sampler = TaskMetricsSampler(
+            process_stats=self._get_unreal_process_tree_stats
+        )
+
+        # Unreal logs the progress every frame, report it to the worker agent at a bounded rate.
+        # Rate limits are overridden from the init_data in on_start
+        self._progress_coalescer = ProgressCoalescer(
+            report=self._report_progress,
+            min_interval=self._PROGRESS_REPORT_INTERVAL_SECONDS,
+            min_delta=self._PROGRESS_REPORT_MIN_DELTA,
+        )
+
     @property
     def integration_data_interface_version(self) -> SemanticVersion:
         return SemanticVersion(major=0, minor=1)  # pragma: no cover
@@ -97,6 +253,15 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         """
         return self._unreal_client is not None and self._unreal_client.is_running
 
+    @property
+    def _unreal_client_loaded(self) -> bool:
+        """Property which indicates that the UnrealClient took the client_loaded action
+
+        :return: True if the UnrealClient is loaded, false otherwise
+        :rtype: bool
+        """
+        return self._client_loaded_event.is_set()
+
     @property
     def _unreal_is_rendering(self) -> bool:
         """Property which indicates if unreal is rendering
@@ -135,18 +300,14 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
 
     def _wait_for_adaptor_server_socket(self) -> str:
         """
-        Performs a busy wait for the socket path that the adaptor server is running on, then
-        returns it.
+        Waits for the adaptor server to be bound to its socket, then returns the socket path.
 
         :raises RuntimeError: If the server does not finish initializing
 
         :return: The socket path the adaptor server is running on.
         :rtype: str
         """
-        is_not_timed_out = self.get_timer(self._SERVER_START_TIMEOUT_SECONDS)
-
-        while (self._server is None or self._server.server_path is None) and is_not_timed_out():
-            time.sleep(0.01)
+        self._server_ready_event.wait(timeout=self._SERVER_START_TIMEOUT_SECONDS)
 
         if self._server is not None and self._server.server_path is not None:
             return self._server.server_path
@@ -157,28 +318,31 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
 
     def _wait_for_unreal_started(self):
         """
-        Performs a busy wait for the starting of the Unreal Engine with the UnrealClient script
+        Waits for the starting of the Unreal Engine with the UnrealClient script. The wait ends as
+        soon as the UnrealClient takes the client_loaded action, Unreal reports an error or exits.
 
         :raises RuntimeError: Raised when the UnrealClient encountered an error during initialization
         :raises TimeoutError: Raised when the UnrealClient doesn't complete the initial actions before timeout reached
         """
+        start_time = time.monotonic()
+        timeout_time = start_time + self._UNREAL_START_TIMEOUT_SECONDS
         is_not_timed_out = self.get_timer(self._UNREAL_START_TIMEOUT_SECONDS)
         while (
             self._unreal_is_running
             and not self._has_exception
-            and len(self._action_queue)
-            > 0  # for now the initializing actions in the action queue, defined by
-            # _populate_client_loaded_action() method.
-            # So we wait for them to be done or for time is out.
+            and not self._unreal_client_loaded
             and is_not_timed_out()
         ):
-            time.sleep(0.1)
+            self._unreal_state_event.wait(
+                timeout=max(
+                    0, min(self._TASK_STATE_CHECK_INTERVAL_SECONDS, timeout_time - time.monotonic())
+                )
+            )
+            self._unreal_state_event.clear()
 
-        self._get_deadline_telemetry_client().record_event(
-            event_type="com.amazon.rum.deadline.adaptor.runtime.start", event_details={}
-        )
+        self._startup_profiler.record_phase("unreal_start", time.monotonic() - start_time)
 
-        if len(self._action_queue) > 0:  # if for some reason, all the actions are not complete
+        if not self._unreal_client_loaded:  # if for some reason, the client is not loaded
             if is_not_timed_out():  # and timeout is not reached
                 raise RuntimeError(  # <- we catch some exception - self._has_exception is True
                     "Unreal encountered an error and was not able to complete initialization actions."
@@ -192,9 +356,12 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
     def _start_unreal_server(self) -> None:
         """
         Starts a server with the given ActionsQueue, attaches the server to the adaptor and serves
-        forever in a blocking call.
+        forever in a blocking call. Signals the server is ready as soon as it is bound to the socket.
         """
-        self._server = AdaptorServer(self._action_queue, self)
+        try:
+            self._server = AdaptorServer(self._action_queue, self)
+        finally:
+            self._server_ready_event.set()
         self._server.serve_forever()
 
     def _start_unreal_server_thread(self) -> None:
@@ -204,11 +371,14 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         on after the server has finished starting.
         """
 
+        start_time = time.monotonic()
+        self._server_ready_event.clear()
         self._server_thread = threading.Thread(
             target=self._start_unreal_server, name="UnrealAdaptorServerThread"
         )
         self._server_thread.start()
         os.environ["UNREAL_ADAPTOR_SOCKET_PATH"] = self._wait_for_adaptor_server_socket()
+        self._startup_profiler.record_phase("adaptor_server_start", time.monotonic() - start_time)
 
     def _get_regex_callbacks(self) -> list[RegexCallback]:
         """
@@ -220,6 +390,9 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         callbacks = []
 
         from deadline.unreal_adaptor.UnrealClient.step_handlers import get_step_handler_class
+        from deadline.unreal_adaptor.UnrealClient.step_handlers.base_step_handler import (
+            BaseStepHandler,
+        )
 
         for handler_name in ["render", "custom"]:
             handler_class = get_step_handler_class(handler_name)
@@ -236,8 +409,52 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
 
             callbacks.append(RegexCallback(handler_class.regex_pattern_error(), self._handle_error))
 
+        callbacks.append(
+            RegexCallback([BaseStepHandler.regex_pattern_task_started()], self._handle_task_started)
+        )
+
         return callbacks
 
+    def _get_regex_keywords(self) -> list[str]:
+        """
+        Returns a list of keywords built from UnrealClient handler regex keywords.
+        Log lines that contain none of them are not matched against the regex callbacks.
+        If any handler has no keywords, the list is empty and every line is matched.
+
+        :return: List of keywords
+        :rtype: list[str]
+        """
+
+        from deadline.unreal_adaptor.UnrealClient.step_handlers import get_step_handler_class
+
+        keywords: list[str] = []
+        for handler_name in ["render", "custom"]:
+            handler_keywords = get_step_handler_class(handler_name).regex_keywords()
+            if not handler_keywords:
+                return []
+            keywords.extend(handler_keywords)
+        # Task started messages of the UnrealClient
+        keywords.append("Step Handler: Task")
+
+        return list(dict.fromkeys(keywords))
+
+    def _handle_task_started(self, match: re.Match) -> None:
+        """
+        Callback for stdout that indicates the UnrealClient started the task.
+        The log lines that follow belong to that task.
+
+        :param match: re.Match object from the regex pattern that was matched the message
+        :type match: re.Match
+        """
+        self._log_task_id = int(match.groups()[0])
+
+    def _is_current_task_log(self) -> bool:
+        """
+        :return: True if the stdout reader is reading the log of the current task
+        :rtype: bool
+        """
+        return self._log_task_id == self._task_id
+
     def _handle_complete(self, match: re.Match) -> None:
         """
         Callback for stdout that indicate completeness of a render. Updates progress to 100
@@ -245,8 +462,32 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         :param match: re.Match object from the regex pattern that was matched the message
         :type match: re.Match
         """
+        if not self._is_current_task_log():
+            return
+        self._complete_task()
+
+    def _complete_task(self) -> None:
+        """
+        Marks the current task as complete, updates progress to 100 and wakes up the task.
+        The task is completed by the complete event or the complete log line, whichever
+        comes first, the other one is ignored.
+        """
+        if self._task_completed:
+            return
+        self._task_completed = True
         self._unreal_is_rendering = False
-        self.update_status(progress=100)
+        self._progress_coalescer.update(ProgressCoalescer.COMPLETE_PROGRESS)
+        self._set_watchdog_phase(None)
+        self._unreal_state_event.set()
+
+    def _report_progress(self, progress: float) -> None:
+        """
+        Sends the progress coalesced by the progress coalescer to the worker agent.
+
+        :param progress: Progress value in percents
+        :type progress: float
+        """
+        self.update_status(progress=progress)
 
     def _handle_progress(self, match: re.Match) -> None:
         """
@@ -255,8 +496,13 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         :param match: re.Match object from the regex pattern that was matched the message
         :type match: re.Match
         """
-        progress = int(float(match.groups()[0]))
-        self.update_status(progress=progress)
+        if not self._is_current_task_log():
+            return
+        progress = float(match.groups()[0])
+        if self._watchdog is not None:
+            self._watchdog.observe_progress(progress)
+
+        self._progress_coalescer.update(int(progress))
 
     def _handle_error(self, match: re.Match) -> None:
         """
@@ -267,7 +513,89 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
 
         :raises RuntimeError: Always raises a runtime error to halt the adaptor.
         """
-        self._exc_info = RuntimeError(f"Unreal Encountered an Error: {match.group(0)}")
+        if not self._is_current_task_log():
+            return
+        # The patterns match from the error marker, the message is the whole line
+        self._fail_task(match.string)
+
+    def _fail_task(self, message: str) -> None:
+        """
+        Stores the error that halts the adaptor and wakes up the task
+
+        :param message: Error message
+        :type message: str
+        """
+        self._exc_info = RuntimeError(f"Unreal Encountered an Error: {message}")
+        # Let the worker agent know how far the task got before the error
+        self._progress_coalescer.flush()
+        self._set_watchdog_phase(None)
+        self._unreal_state_event.set()
+
+    def handle_client_event(self, event: dict) -> None:
+        """
+        Handles the structured event sent by the UnrealClient over the adaptor server.
+        Events duplicate the messages in the Unreal log, that are parsed by the regex callbacks
+        as a fallback.
+
+        :param event: Event dictionary: {"type": "client_loaded"},
+            {"type": "timing", "phase": "asset_registry_wait", "duration": 1.5},
+            {"type": "progress", "progress": 42.0, "frame": 10, ...},
+            {"type": "chunk_complete", "chunk": 3, "chunks_done": 1, "chunks_total": 4},
+            {"type": "complete"} or {"type": "error", "message": "..."}.
+            Step handler events have the "task_id" of the task they belong to
+        :type event: dict
+
+        :raises ValueError: If the event type or data is not valid
+        """
+        event_type = event.get("type")
+        task_id = event.get("task_id")
+        if task_id is not None and task_id != self._task_id:
+            logger.debug(f"Ignored the {event_type} event of the task {task_id}")
+            return
+        if event_type == "client_loaded":
+            logger.info("UnrealClient sends the structured events")
+            self._client_events = True
+            if not self._client_loaded_event.is_set():
+                self._mark_client_loaded()
+        elif event_type == "timing":
+            try:
+                self._startup_profiler.record_phase(str(event["phase"]), float(event["duration"]))
+            except (KeyError, TypeError, ValueError):
+                raise ValueError(f"Timing event without valid phase and duration: {event}")
+        elif event_type == "progress":
+            try:
+                progress = float(event["progress"])
+            except (KeyError, TypeError, ValueError):
+                raise ValueError(f"Progress event without valid progress: {event}")
+            logger.debug(
+                f"Progress {progress}%: frame {event.get('frame')}/{event.get('total_frames')}, "
+                f"shot {event.get('shot')}, elapsed {event.get('elapsed')} seconds"
+            )
+            if self._watchdog is not None:
+                self._watchdog.observe_progress(progress)
+            if isinstance(event.get("frame"), int):
+                self._task_metrics_sampler.observe_frame(str(event.get("shot")), event["frame"])
+            self._progress_coalescer.update(int(progress))
+        elif event_type == "chunk_complete":
+            status_message = (
+                f"Rendered chunk {event.get('chunk')} "
+                f"({event.get('chunks_done')}/{event.get('chunks_total')})"
+            )
+            logger.info(status_message)
+            self.update_status(status_message=status_message)
+        elif event_type == "complete":
+            self._complete_task()
+        elif event_type == "error":
+            self._fail_task(event.get("message", ""))
+        else:
+            raise ValueError(f"Unknown client event type: {event_type}")
+
+    def _handle_unreal_exit(self) -> None:
+        """
+        Callback for the Unreal process exit. Wakes up the task that is waiting for the result.
+        """
+        logger.info("Unreal process exited")
+        self._unreal_state_event.set()
 
     def _start_unreal_client(self) -> None:
         """
@@ -281,6 +609,14 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         unreal_exe = "UnrealEditor-Cmd"
         unreal_project_path = self.init_data.get("project_path", "")
 
+        # UnrealClient requests the next action on the background thread with this interval
+        # when the adaptor has no action, and immediately after the action is performed
+        client_poll_interval = self.init_data.get("client_poll_interval")
+        if client_poll_interval is not None:
+            from deadline.unreal_adaptor.UnrealClient.action_poller import ActionPoller
+
+            os.environ[ActionPoller.POLL_INTERVAL_ENV] = str(client_poll_interval)
+
         # First, read args from file since it can be too long to pass
         # them to Job parameter (1024 chars limit)
         extra_cmd_str = ""
@@ -317,6 +653,17 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         args = [unreal_exe, unreal_project_path]
         args.extend(log_args)
         args.extend(extra_cmd_args)
+        ddc_args = self._prepare_ddc()
+        if DerivedDataCacheStats.LOG_CMDS_ARG in ddc_args and any(
+            arg.lower().startswith("-logcmds=") for arg in extra_cmd_args
+        ):
+            logger.warning(
+                "-LogCmds of the extra command line arguments takes precedence, add "
+                '"LogDerivedDataCache Verbose" to it to get the DerivedDataCache statistics'
+            )
+        args.extend(ddc_args)
+
+        self._restore_asset_registry_cache()
         args = [arg for arg in args if arg]  # Remove empty strings
         args = list(dict.fromkeys(args))  # Remove duplicates
 
@@ -330,19 +677,342 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
 
         logger.info(f"Starting Unreal Engine with args: {args}")
 
-        regexhandler = RegexHandler(self._get_regex_callbacks())
-        self._unreal_client = UnrealSubprocessWithLogs(
-            args=args,
-            stdout_handler=regexhandler,
-            stderr_handler=regexhandler,
+        self._start_log_policy()
+
+        # Regex callbacks get every line from their own logger, the log policy filters
+        # only the lines forwarded to the worker log
+        regexhandler = PrefilteredRegexHandler(
+            self._get_regex_callbacks(),
+            keywords=self._get_regex_keywords(),
+            line_observer=self._observe_unreal_line,
+        )
+        with self._startup_profiler.phase("unreal_spawn"):
+            self._unreal_client = UnrealSubprocessWithLogs(
+                args=args,
+                logger=unreal_output_logger,
+                stdout_handler=regexhandler,
+                stderr_handler=regexhandler,
+                on_exit=self._handle_unreal_exit,
+            )
+        self._startup_profiler.mark_spawn()
+
+        self._start_watchdog()
+        self._task_metrics_sampler.start()
+
+    def _start_log_policy(self) -> None:
+        """
+        Applies the log_policy from the init_data to the Unreal output forwarded to the worker log
+        and opens the raw output archive if the archive_path is given.
+        Relative archive_path is resolved against the session working directory.
+
+        :raises ValueError: If the log_policy has the unknown Unreal log verbosity
+        """
+        log_policy = self.init_data.get("log_policy")
+        if not log_policy:
+            return
+
+        self._log_policy = UnrealLogPolicy.from_init_data(log_policy)
+        unreal_output_logger.addFilter(self._log_policy)
+
+        archive_path = log_policy.get("archive_path")
+        if archive_path:
+            archive_path = os.path.join(os.getcwd(), archive_path)
+            logger.info(f"Archiving the full Unreal output to {archive_path}")
+            self._log_archive = UnrealLogArchive(archive_path)
+
+    def _stop_log_policy(self) -> None:
+        """
+        Logs the count of the suppressed Unreal output lines, removes the log policy
+        and closes the raw output archive.
+        """
+        if self._log_policy is not None:
+            logger.info(self._log_policy.summary())
+            unreal_output_logger.removeFilter(self._log_policy)
+            self._log_policy = None
+
+        if self._log_archive is not None:
+            self._log_archive.close()
+            logger.info(f"Full Unreal output is archived to {self._log_archive.path}")
+            self._log_archive = None
+
+    def _start_watchdog(self) -> None:
+        """
+        Starts the watchdog of the spawned Unreal process in the startup phase.
+        Thresholds are read from the watchdog of the init_data, 0 disables the phase check.
+        """
+        watchdog_settings = self.init_data.get("watchdog", {})
+        unreal_client = self._unreal_client
+
+        self._watchdog = StallWatchdog(
+            on_stall=self._handle_stall,
+            thresholds={
+                StallWatchdog.STARTUP: watchdog_settings.get(
+                    "startup_timeout", self._WATCHDOG_STARTUP_TIMEOUT_SECONDS
+                ),
+                StallWatchdog.ASSET_LOADING: watchdog_settings.get(
+                    "asset_loading_timeout", self._WATCHDOG_ASSET_LOADING_TIMEOUT_SECONDS
+                ),
+                StallWatchdog.RENDERING: watchdog_settings.get(
+                    "frame_timeout", self._WATCHDOG_FRAME_TIMEOUT_SECONDS
+                ),
+            },
+            check_interval=watchdog_settings.get(
+                "check_interval", self._WATCHDOG_CHECK_INTERVAL_SECONDS
+            ),
+            cpu_time=lambda: get_cpu_time(unreal_client.pid) if unreal_client else None,
+        )
+        self._watchdog.set_phase(StallWatchdog.STARTUP)
+        self._watchdog.start()
+
+    def _set_watchdog_phase(self, phase: str | None) -> None:
+        """
+        Sets the watchdog phase if the watchdog is running
+
+        :param phase: StallWatchdog phase or None to pause the checks
+        :type phase: str | None
+        """
+        if self._watchdog is not None:
+            self._watchdog.set_phase(phase)
+
+    def _get_unreal_memory_usage(self) -> int | None:
+        """
+        :return: Memory used by the Unreal process and its children in bytes
+            or None if Unreal is not running
+        :rtype: int | None
+        """
+        if self._unreal_client is None:
+            return None
+        return get_memory_usage(self._unreal_client.pid)
+
+    def _get_unreal_process_tree_stats(self) -> ProcessTreeStats | None:
+        """
+        :return: Resources used by the Unreal process and its children
+            or None if Unreal is not running
+        :rtype: ProcessTreeStats | None
+        """
+        if self._unreal_client is None:
+            return None
+        return get_process_tree_stats(self._unreal_client.pid)
+
+    def _report_task_metrics(self, task_metrics: TaskMetrics) -> None:
+        """
+        Logs the resources used by the task, the summary line for the reader and
+        the JSON line for the log processing
+
+        :param task_metrics: Resources used by the task
+        :type task_metrics: TaskMetrics
+        """
+        logger.info(
+            f"Task resources: wall time {task_metrics.wall_time:.1f} s, "
+            f"CPU time {task_metrics.cpu_time:.1f} s, "
+            f"peak memory {MemoryGuard.to_mb(task_metrics.peak_rss)} MB, "
+            f"read {MemoryGuard.to_mb(task_metrics.read_bytes)} MB, "
+            f"written {MemoryGuard.to_mb(task_metrics.write_bytes)} MB, "
+            f"frames rendered {task_metrics.frames_rendered}"
+        )
+        logger.debug(f"Task metrics: {json.dumps(asdict(task_metrics))}")
+
+    def _recycle_if_memory_exceeded(self) -> None:
+        """
+        Restarts the Unreal Editor with on_cleanup and on_start if it uses more memory than
+        the memory_guard ceiling of the init_data. Called at the task boundary, before the task
+        starts, so the task gets the fresh editor instead of failing with out of memory.
+        """
+        if not self._memory_guard.is_exceeded():
+            return
+
+        self._recycle_count += 1
+        memory_usage_mb = MemoryGuard.to_mb(self._memory_guard.last_usage)
+        max_memory_mb = MemoryGuard.to_mb(self._memory_guard.max_memory)
+        logger.info(
+            f"Unreal Editor uses {memory_usage_mb} MB, more than the {max_memory_mb} MB ceiling. "
+            f"Restarting the editor before the task (recycle {self._recycle_count} "
+            "in this session)"
+        )
+        self._get_deadline_telemetry_client().record_event(
+            event_type="com.amazon.rum.deadline.adaptor.runtime.recycle",
+            event_details={
+                "memory_usage_mb": memory_usage_mb,
+                "max_memory_mb": max_memory_mb,
+                "recycle_count": self._recycle_count,
+            },
+        )
+
+        self.on_cleanup()
+        self._reset_client_state()
+        self.on_start()
+
+    def _reset_client_state(self) -> None:
+        """
+        Forgets the state of the stopped UnrealClient, so the next one starts from scratch:
+        the actions left in the queue, e.g. the close sent by on_cleanup or the wait_result
+        of the interrupted task, are dropped instead of being replayed to the new client.
+        """
+        self._action_queue.clear()
+        self._client_events = False
+        self._client_loaded_event.clear()
+        self._unreal_state_event.clear()
+        self._progress_coalescer.reset()
+
+    def _handle_stall(self, reason: str, diagnostics: dict) -> None:
+        """
+        Callback of the watchdog that detected the stalled Unreal Editor. Logs the diagnostics,
+        fails the task and terminates the editor, so the waiting for Unreal start or
+        for the task result ends immediately.
+
+        :param reason: Reason of the stall
+        :type reason: str
+        :param diagnostics: Diagnostics collected by the watchdog
+        :type diagnostics: dict
+        """
+        recent_lines = diagnostics.pop("recent_lines", [])
+        logger.error(f"Unreal Editor stalled: {reason}")
+        logger.error(f"Watchdog diagnostics: {json.dumps(diagnostics)}")
+        logger.error("Last Unreal output lines:\n" + "\n".join(recent_lines))
+
+        self._get_deadline_telemetry_client().record_error(
+            {"reason": reason, "exception_scope": "watchdog", **diagnostics}, str(RuntimeError)
         )
 
+        self._fail_task(f"Unreal Editor stalled: {reason}")
+        if self._unreal_client is not None and self._unreal_is_running:
+            self._unreal_client.terminate(grace_time_s=0)
+
+    def _prepare_ddc(self) -> list[str]:
+        """
+        Prepares the worker local DerivedDataCache before the editor starts, evicting
+        the least recently used files over the size budget
+
+        :return: Editor command line arguments for the DerivedDataCache, empty if it is not
+            configured or the directory is not usable
+        :rtype: list[str]
+        """
+        if self._ddc is None:
+            return []
+        try:
+            with self._startup_profiler.phase("ddc_prepare"):
+                self._ddc.prepare()
+        except OSError as e:
+            logger.error(
+                f"Can't use the DerivedDataCache {self._ddc.path}, "
+                f"starting Unreal with the default one: {e}"
+            )
+            return []
+        return self._ddc.get_command_line_args()
+
+    def _restore_asset_registry_cache(self) -> None:
+        """
+        Restores the asset registry state of the project content before the editor starts
+        """
+        if self._asset_registry_cache is None:
+            return
+        try:
+            with self._startup_profiler.phase("asset_registry_restore"):
+                self._asset_registry_cache.restore()
+        except OSError as e:
+            logger.warning(f"Can't restore the asset registry cache: {e}")
+
+    def _store_asset_registry_cache(self) -> None:
+        """
+        Stores the asset registry state of the project content after the clean editor shutdown
+        """
+        if self._asset_registry_cache is None:
+            return
+        try:
+            self._asset_registry_cache.store()
+        except OSError as e:
+            logger.warning(f"Can't store the asset registry cache: {e}")
+
+    def _observe_unreal_line(self, line: str) -> None:
+        """
+        Observer of every Unreal stdout and stderr line, before any log policy is applied
+
+        :param line: Line of the Unreal output
+        :type line: str
+        """
+        self._startup_profiler.observe_line(line)
+        self._ddc_stats.observe_line(line)
+        if self._watchdog is not None:
+            self._watchdog.observe_line(line)
+        if self._log_archive is not None:
+            self._log_archive.write_line(line)
+
     def _populate_client_loaded_action(self) -> None:
         """
-        Populates the adaptor server's action queue with the specific action to check if UE initialized or not yet
+        Populates the adaptor server's action queue with the specific action to check if UE initialized or not yet.
+        The UnrealClient takes this action as soon as it starts polling the adaptor server.
+        The action asks the client to preload the level only if the preload is enabled in init_data.
         """
+        self._client_loaded_event.clear()
+        preload_data = self.init_data.get("preload", {})
+        preload = {}
+        if preload_data.get("enabled", False):
+            preload = {
+                key: path
+                for key, path in preload_data.items()
+                if key != "enabled" and isinstance(path, str) and path
+            }
+        self._action_queue.enqueue_action(
+            Action(name="client_loaded", args={"preload": preload} if preload else None),
+            on_dequeue=self._handle_client_loaded,
+        )
+
+    def _handle_client_loaded(self, action: Action) -> None:
+        """
+        Callback for the client_loaded action dequeued by the UnrealClient.
+        Wakes up the waiting for Unreal start. The preload, if requested, runs on the client
+        before it takes the next action, so the first run_script simply waits for it.
+        The client_loaded event sent after the preload is extra information only.
+
+        :param action: Dequeued client_loaded action
+        :type action: Action
+        """
+        if action.args and action.args.get("preload"):
+            logger.info("UnrealClient is preloading the level")
+        self._mark_client_loaded()
+
+    def _mark_client_loaded(self) -> None:
+        """
+        Ends the startup phase and wakes up the waiting for Unreal start
+        """
+        logger.info("UnrealClient loaded")
+        self._set_watchdog_phase(None)
+        self._client_loaded_event.set()
+        self._unreal_state_event.set()
+
+    def _handle_run_script_taken(self, action: Action) -> None:
+        """
+        Callback for the run_script action taken by the UnrealClient. Records the first run_script
+        startup milestone.
 
-        self._action_queue.enqueue_action(Action(name="client_loaded"))
+        :param action: The run_script action
+        :type action: Action
+        """
+        self._startup_profiler.mark("first_run_script")
+
+    def _report_startup_timings(self) -> None:
+        """
+        Finishes the startup profiling and reports the collected timings once per session:
+        to the log, to the telemetry and to the JSON file in the session working directory.
+        """
+        if not self._startup_profiler.started or self._startup_profiler.finished:
+            return
+
+        self._startup_profiler.finish()
+        startup_timings = self._startup_profiler.report()
+        logger.info(f"Unreal startup timings (seconds): {startup_timings}")
+
+        self._get_deadline_telemetry_client().record_event(
+            event_type="com.amazon.rum.deadline.adaptor.runtime.start",
+            event_details={"startup_timings": startup_timings},
+        )
+
+        report_path = os.path.join(os.getcwd(), self._STARTUP_REPORT_FILE_NAME)
+        try:
+            with open(report_path, "w") as f:
+                json.dump(startup_timings, f, indent=4)
+        except OSError as e:
+            logger.warning(f"Could not write the startup timings to {report_path}: {e}")
 
     def _get_deadline_telemetry_client(self):
         """
@@ -373,6 +1043,48 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
 
         self.data_validation.validate_init_data(self.init_data)
 
+        self._script_pool = ScriptProcessPool.from_init_data(self.init_data)
+        if self._script_pool is not None:
+            self.update_status(progress=0, status_message="Starting Python script pool")
+            self._script_pool.start()
+            return
+
+        self._startup_profiler.start()
+
+        self._progress_coalescer = ProgressCoalescer(
+            report=self._report_progress,
+            min_interval=self.init_data.get(
+                "progress_report_interval", self._PROGRESS_REPORT_INTERVAL_SECONDS
+            ),
+            min_delta=self.init_data.get(
+                "progress_report_min_delta", self._PROGRESS_REPORT_MIN_DELTA
+            ),
+        )
+
+        memory_guard_settings = self.init_data.get("memory_guard", {})
+        max_memory_mb = memory_guard_settings.get("max_memory_mb")
+        self._memory_guard = MemoryGuard(
+            memory_usage=self._get_unreal_memory_usage,
+            max_memory=(
+                None if max_memory_mb is None else int(max_memory_mb * MemoryGuard.BYTES_IN_MB)
+            ),
+            sample_interval=memory_guard_settings.get(
+                "sample_interval", self._MEMORY_SAMPLE_INTERVAL_SECONDS
+            ),
+        )
+
+        self._ddc = LocalDerivedDataCache.from_init_data(self.init_data)
+        self._asset_registry_cache = AssetRegistryCache.from_init_data(self.init_data)
+
+        task_metrics_settings = self.init_data.get("task_metrics", {})
+        self._task_metrics_sampler = TaskMetricsSampler(
+            process_stats=self._get_unreal_process_tree_stats,
+            sample_interval=task_metrics_settings.get(
+                "sample_interval", self._TASK_METRICS_SAMPLE_INTERVAL_SECONDS
+            ),
+            textfile_path=task_metrics_settings.get("textfile_path"),
+        )
+
         # Notify worker agent about starting Unreal
         self.update_status(progress=0, status_message="Initializing Unreal Engine")
 
@@ -384,20 +1096,23 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         # Add the openjd and adaptor namespace directory to PYTHONPATH, so that adaptor_runtime_client
         # will be available directly to the adaptor client.
 
-        import openjd.adaptor_runtime_client
+        with self._startup_profiler.phase("pythonpath_setup"):
+            import openjd.adaptor_runtime_client
 
-        add_module_to_pythonpath(
-            os.path.dirname(os.path.dirname(openjd.adaptor_runtime_client.__file__))
-        )
-        add_module_to_pythonpath(
-            os.path.dirname(
+            add_module_to_pythonpath(
                 os.path.dirname(os.path.dirname(openjd.adaptor_runtime_client.__file__))
             )
-        )
+            add_module_to_pythonpath(
+                os.path.dirname(
+                    os.path.dirname(os.path.dirname(openjd.adaptor_runtime_client.__file__))
+                )
+            )
 
-        import deadline.unreal_adaptor
+            import deadline.unreal_adaptor
 
-        add_module_to_pythonpath(os.path.dirname(os.path.dirname(deadline.unreal_adaptor.__file__)))
+            add_module_to_pythonpath(
+                os.path.dirname(os.path.dirname(deadline.unreal_adaptor.__file__))
+            )
 
         self._start_unreal_client()
 
@@ -405,33 +1120,78 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
 
     def on_run(self, run_data: dict) -> None:
         """
-        This starts a render in Unreal for the given frame and performs a busy wait until the render completes.
+        This starts a render in Unreal for the given frame and waits until the render completes,
+        fails or Unreal exits.
 
         :param run_data: Dictionary containing Run Data
         :type run_data: dict
         """
+        if self._script_pool is not None:
+            self._run_script_without_editor(run_data)
+            return
+
         if not self._unreal_is_running:
             raise UnrealNotRunningError("Cannot render because Unreal is not running.")
 
         self.data_validation.validate_run_data(run_data)
 
+        self._recycle_if_memory_exceeded()
+        self._task_metrics_sampler.start_task()
+
+        if self._ddc_stats.hit_rate is not None:
+            # Cache requests since the previous task, e.g. of the editor startup
+            logger.info(self._ddc_stats.summary("before the task"))
+        self._ddc_stats.reset()
+
         # Set up the step handler
+        self._task_id += 1
         self._action_queue.enqueue_action(
-            Action("set_handler", {"handler": run_data.get("handler", "base")})
+            Action(
+                "set_handler",
+                {"handler": run_data.get("handler", "base"), "task_id": self._task_id},
+            )
         )
 
+        self._unreal_state_event.clear()
+        self._progress_coalescer.reset()
+        self._task_completed = False
+        self._set_watchdog_phase(StallWatchdog.ASSET_LOADING)
         self._unreal_is_rendering = True
-        self._action_queue.enqueue_action(Action("run_script", run_data))
+        self._action_queue.enqueue_action(
+            Action("run_script", run_data),
+            on_dequeue=None if self._startup_profiler.finished else self._handle_run_script_taken,
+        )
+
+        # Park the UnrealClient until the step handler has the result of run_script.
+        # The next request of the client stays open in the adaptor server until the close
+        # or the action of the next task is queued, so the amount of IPC requests per task
+        # doesn't depend on the render time
+        self._action_queue.enqueue_action(Action("wait_result", {}))
 
         while self._unreal_is_rendering and not self._has_exception:
-            time.sleep(1)
-            # Wait for:
-            #   1. set_handler to be executed
-            #   2. run_script to be executed (launch render process in separate thread by UE API)
-            # by UnrealClient and don't spam before
-            if len(self._action_queue) == 0:
-                logger.info("Enqueue wait result")
-                self._action_queue.enqueue_action(Action("wait_result", {}))
+            # Wake up immediately on complete/error/exit, otherwise recheck the state periodically
+            self._unreal_state_event.wait(timeout=self._TASK_STATE_CHECK_INTERVAL_SECONDS)
+            self._progress_coalescer.flush_if_due()
+            self._memory_guard.sample_if_due()
+
+        self._progress_coalescer.flush()
+        self._set_watchdog_phase(None)
+
+        self._report_startup_timings()
+
+        task_metrics = self._task_metrics_sampler.finish_task()
+        if task_metrics is not None:
+            self._report_task_metrics(task_metrics)
+
+        memory_usage = self._memory_guard.sample()
+        if memory_usage is not None:
+            logger.info(
+                f"Unreal Editor memory after the task: {MemoryGuard.to_mb(memory_usage)} MB, "
+                f"peak {MemoryGuard.to_mb(self._memory_guard.peak_usage)} MB"
+            )
+
+        if self._ddc is not None or self._ddc_stats.hit_rate is not None:
+            logger.info(self._ddc_stats.summary("task"))
 
         if (
             not self._unreal_is_running and self._unreal_client
@@ -447,6 +1207,40 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
                 f"Exit code {exit_code}"
             )
 
+    def _run_script_without_editor(self, run_data: dict) -> None:
+        """
+        Executes the custom script of the task in the script pool instead of Unreal Editor
+
+        :param run_data: Dictionary containing Run Data
+        :type run_data: dict
+
+        :raises RuntimeError: If the step handler is not the custom one or the script failed
+        """
+        assert self._script_pool is not None
+
+        self.data_validation.validate_run_data(run_data)
+
+        handler = run_data.get("handler", "base")
+        if handler != "custom":
+            raise RuntimeError(
+                f'Step handler "{handler}" requires Unreal Editor, '
+                "only the custom scripts can run without it"
+            )
+
+        self._progress_coalescer.reset()
+        try:
+            result = self._script_pool.run(
+                run_data.get("script_path", ""),
+                run_data.get("script_args", {}),
+                on_progress=self._progress_coalescer.update,
+            )
+        except Exception:
+            # Let the worker agent know how far the script got
+            self._progress_coalescer.flush()
+            raise
+        logger.info(f"Custom Step Executor: Complete: {result}")
+        self._progress_coalescer.update(ProgressCoalescer.COMPLETE_PROGRESS)
+
     def on_stop(self) -> None:
         """
         Execute stop action
@@ -458,8 +1252,15 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         Cleans up the adaptor by closing the unreal client and adaptor server.
         """
 
+        if self._script_pool is not None:
+            self._script_pool.stop()
+            return
+
         self._performing_cleanup = True
 
+        # Report what is collected if the session didn't get to the end of the first task
+        self._report_startup_timings()
+
         # Send "close" action to the UnrealClient
         self._action_queue.enqueue_action(Action("close"), front=True)
 
@@ -468,12 +1269,19 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         while self._unreal_is_running and is_not_timed_out():
             time.sleep(0.1)
 
+        graceful_shutdown = True
         if self._unreal_is_running and self._unreal_client:
             logger.error(
                 "Unreal did not complete cleanup actions and failed to gracefully shutdown. "
                 "Terminating."
             )
             self._unreal_client.terminate(0)
+            graceful_shutdown = False
+
+        # The editor writes the asset registry state on the exit, it is complete
+        # only after the clean shutdown
+        if graceful_shutdown and self._unreal_client is not None:
+            self._store_asset_registry_cache()
 
         # Terminate AdaptorServer instance
         if self._server:
@@ -485,6 +1293,14 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
             if self._server_thread.is_alive():
                 logger.error("Failed to shutdown the Unreal Adaptor server.")
 
+        if self._watchdog is not None:
+            self._watchdog.stop()
+            self._watchdog = None
+
+        self._task_metrics_sampler.stop()
+
+        self._stop_log_policy()
+
         self._performing_cleanup = False
 
     def on_cancel(self):
@@ -492,6 +1308,11 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         Cancels the current render if Unreal is rendering.
         """
         logger.info("CANCEL REQUESTED")
+        if self._script_pool is not None:
+            # Interrupt the custom script running without the editor
+            self._script_pool.cancel()
+            return
+
         if not self._unreal_client or not self._unreal_is_running:
             logger.info("Nothing to cancel because Unreal is not running")
             return
@@ -0,0 +1,126 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import sys
+import json
+from http import HTTPStatus
+from typing import Any
+
+
+#: Path of the requests with the structured events sent by the UnrealClient:
+#: PUT /event?event=<json>. Events are passed to the adaptor's handle_client_event method.
+EVENT_PATH = "/event"
+
+
+def handle_event_request(server: Any, query_string_params: dict) -> tuple[HTTPStatus, str]:
+    """
+    Parse the event from the request parameters and pass it to the server's adaptor
+
+    :param server: Adaptor server that received the request
+    :param query_string_params: Request parameters, {"event": ["<json>"]}
+    :type query_string_params: dict
+    :return: Response status and body
+    :rtype: tuple[HTTPStatus, str]
+    """
+    event_params = query_string_params.get("event")
+    if not event_params:
+        return HTTPStatus.BAD_REQUEST, "Missing the event parameter"
+
+    try:
+        event = json.loads(event_params[0])
+    except json.JSONDecodeError as e:
+        return HTTPStatus.BAD_REQUEST, f"Invalid event: {e}"
+
+    if not isinstance(event, dict) or "type" not in event:
+        return HTTPStatus.BAD_REQUEST, "Event must be an object with the type"
+
+    handle_client_event = getattr(server.adaptor, "handle_client_event", None)
+    if handle_client_event is None:
+        return HTTPStatus.NOT_IMPLEMENTED, "Adaptor doesn't handle the client events"
+
+    try:
+        handle_client_event(event)
+    except ValueError as e:
+        return HTTPStatus.BAD_REQUEST, str(e)
+
+    return HTTPStatus.OK, ""
+
+
+if sys.platform == "win32":  # pragma: no cover
+    from typing import cast
+
+    from pywintypes import HANDLE
+    from openjd.adaptor_runtime._named_pipe import ResourceRequestHandler
+    from openjd.adaptor_runtime._named_pipe.named_pipe_server import NamedPipeServer
+    from openjd.adaptor_runtime.application_ipc._win_adaptor_server import WinAdaptorServer
+    from openjd.adaptor_runtime.application_ipc._named_pipe_request_handler import (
+        WinAdaptorServerResourceRequestHandler,
+    )
+
+    class UnrealWinAdaptorServerResourceRequestHandler(WinAdaptorServerResourceRequestHandler):
+        """
+        Named pipe request handler that also accepts the /event requests
+        """
+
+        @property
+        def request_path_and_method_dict(self) -> dict[str, list[str]]:
+            path_and_methods = dict(super().request_path_and_method_dict)
+            path_and_methods[EVENT_PATH] = ["PUT"]
+            return path_and_methods
+
+        def handle_request(self, data: str):
+            request_dict = json.loads(data)
+            if request_dict["path"] != EVENT_PATH:
+                return super().handle_request(data)
+
+            if not self.validate_request_path_and_method(
+                request_dict["path"], request_dict["method"]
+            ):
+                return
+
+            if "params" in request_dict and request_dict["params"] != "null":
+                query_string_params = json.loads(request_dict["params"])
+            else:
+                query_string_params = {}
+
+            status, body = handle_event_request(self.server, query_string_params)
+            self.send_response(status, body)
+
+    class UnrealWinAdaptorServer(WinAdaptorServer):
+        """
+        Windows Adaptor server that also accepts the /event requests
+        """
+
+        def request_handler(
+            self, server: NamedPipeServer, pipe_handle: HANDLE
+        ) -> ResourceRequestHandler:
+            return UnrealWinAdaptorServerResourceRequestHandler(
+                cast("WinAdaptorServer", server), pipe_handle
+            )
+
+    AdaptorServer = UnrealWinAdaptorServer
+else:
+    from openjd.adaptor_runtime._http import HTTPResponse
+    from openjd.adaptor_runtime.application_ipc import AdaptorServer  # noqa: F401
+    from openjd.adaptor_runtime.application_ipc._http_request_handler import (
+        AdaptorResourceRequestHandler,
+    )
+
+    class EventEndpoint(AdaptorResourceRequestHandler):
+        """
+        Handler of the /event requests to the AdaptorServer. Registered automatically as a subclass
+        of the AdaptorResourceRequestHandler.
+        """
+
+        path = EVENT_PATH
+
+        def put(self) -> HTTPResponse:
+            """
+            PUT handler for the Event end point of the Adaptor Server
+
+            :return: A body and response code to send to the DCC Client
+            :rtype: HTTPResponse
+            """
+            status, body = handle_event_request(self.server, self.query_string_params)
+            return HTTPResponse(status, body=body)
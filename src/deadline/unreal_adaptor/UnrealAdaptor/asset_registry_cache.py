@@ -0,0 +1,221 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import glob
+import shutil
+import hashlib
+import logging
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class AssetRegistryCache:
+    """
+    Worker local cache of the asset registry state the editor saves to the project
+    Intermediate and Saved directories, so the sessions of the same project with
+    the unchanged content skip the full asset registry scan.
+
+    The cache entry is keyed by the project path and the content manifest hash.
+    The manifest is the relative path, the size and the modification time of every asset
+    in the project and plugins content. The entry is restored to the project before
+    the editor starts and refreshed from the project after the clean editor shutdown.
+    """
+
+    #: Asset registry state files, relative to the project directory
+    DEFAULT_FILES = [
+        "Intermediate/CachedAssetRegistry*.bin",
+        "Saved/CachedAssetRegistry*.bin",
+    ]
+
+    #: Directories of the project with the assets the asset registry scans
+    CONTENT_DIRS = ["Content", "Plugins"]
+
+    #: Extensions of the assets the asset registry scans
+    ASSET_EXTENSIONS = (".uasset", ".umap")
+
+    def __init__(
+        self,
+        cache_path: str,
+        project_path: str,
+        files: Optional[list[str]] = None,
+        max_entries: int = 3,
+    ):
+        """
+        :param cache_path: Directory of the cache, environment variables and ~ are expanded
+        :type cache_path: str
+        :param project_path: Path of the .uproject file
+        :type project_path: str
+        :param files: Glob patterns of the asset registry state files relative to the project
+                      directory, DEFAULT_FILES by default
+        :type files: Optional[list[str]]
+        :param max_entries: Number of the most recently used entries kept per project
+        :type max_entries: int
+        """
+        self.project_dir = os.path.dirname(os.path.abspath(project_path))
+        self.files = files or self.DEFAULT_FILES
+        self.max_entries = max_entries
+
+        project_name = os.path.splitext(os.path.basename(project_path))[0]
+        project_key = hashlib.sha256(os.path.normcase(self.project_dir).encode("utf-8"))
+        self.project_cache_path = os.path.join(
+            os.path.abspath(os.path.expandvars(os.path.expanduser(cache_path))),
+            f"{project_name}-{project_key.hexdigest()[:12]}",
+        )
+
+        self._restored_manifest_hash: Optional[str] = None
+
+    @classmethod
+    def from_init_data(cls, init_data: dict) -> Optional[AssetRegistryCache]:
+        """
+        :param init_data: Adaptor init_data with the optional asset_registry_cache object
+        :type init_data: dict
+
+        :return: AssetRegistryCache or None if it is not configured
+        :rtype: Optional[AssetRegistryCache]
+        """
+        cache_settings = init_data.get("asset_registry_cache")
+        if not cache_settings or not init_data.get("project_path"):
+            return None
+        return cls(
+            cache_path=cache_settings["path"],
+            project_path=init_data["project_path"],
+            files=cache_settings.get("files"),
+            max_entries=cache_settings.get("max_entries", 3),
+        )
+
+    def get_manifest_hash(self) -> str:
+        """
+        :return: Hash of the content manifest of the project
+        :rtype: str
+        """
+        manifest_hash = hashlib.sha256()
+        for content_dir in self.CONTENT_DIRS:
+            for relative_path, size, mtime_ns in sorted(
+                self._scan_assets(os.path.join(self.project_dir, content_dir))
+            ):
+                manifest_hash.update(f"{relative_path}|{size}|{mtime_ns}\n".encode("utf-8"))
+        return manifest_hash.hexdigest()
+
+    def restore(self) -> bool:
+        """
+        Copy the asset registry state of the current content from the cache to the project.
+        Should be called when the editor is not running.
+
+        :return: True if the cache entry was restored
+        :rtype: bool
+        """
+        manifest_hash = self.get_manifest_hash()
+        self._restored_manifest_hash = manifest_hash
+
+        entry_path = os.path.join(self.project_cache_path, manifest_hash)
+        if not os.path.isdir(entry_path):
+            logger.info(f"Asset registry cache miss for the content manifest {manifest_hash[:12]}")
+            return False
+
+        restored_files = 0
+        for root, _, names in os.walk(entry_path):
+            for name in names:
+                cached_file = os.path.join(root, name)
+                project_file = os.path.join(
+                    self.project_dir, os.path.relpath(cached_file, entry_path)
+                )
+                os.makedirs(os.path.dirname(project_file), exist_ok=True)
+                shutil.copy2(cached_file, project_file)
+                restored_files += 1
+
+        # Entry modification time is the last use for the eviction
+        os.utime(entry_path)
+        logger.info(
+            f"Asset registry cache hit for the content manifest {manifest_hash[:12]}, "
+            f"restored {restored_files} files to {self.project_dir}"
+        )
+        return True
+
+    def store(self) -> bool:
+        """
+        Copy the asset registry state from the project to the cache after the clean
+        editor shutdown. Nothing is stored if the content changed since restore was called,
+        as the state may not match the content manifest.
+
+        :return: True if the cache entry was stored
+        :rtype: bool
+        """
+        manifest_hash = self.get_manifest_hash()
+        if (
+            self._restored_manifest_hash is not None
+            and manifest_hash != self._restored_manifest_hash
+        ):
+            logger.info("Project content changed during the session, asset registry is not cached")
+            return False
+
+        project_files = [
+            path
+            for pattern in self.files
+            for path in glob.glob(os.path.join(self.project_dir, pattern))
+            if os.path.isfile(path)
+        ]
+        if not project_files:
+            logger.info(f"No asset registry state in {self.project_dir} to cache")
+            return False
+
+        entry_path = os.path.join(self.project_cache_path, manifest_hash)
+        temp_entry_path = f"{entry_path}.{os.getpid()}.tmp"
+        shutil.rmtree(temp_entry_path, ignore_errors=True)
+        for project_file in project_files:
+            cached_file = os.path.join(
+                temp_entry_path, os.path.relpath(project_file, self.project_dir)
+            )
+            os.makedirs(os.path.dirname(cached_file), exist_ok=True)
+            shutil.copy2(project_file, cached_file)
+
+        # Replace the entry with the complete copy, so the interrupted store is never restored
+        shutil.rmtree(entry_path, ignore_errors=True)
+        os.replace(temp_entry_path, entry_path)
+        logger.info(
+            f"Cached {len(project_files)} asset registry files "
+            f"for the content manifest {manifest_hash[:12]}"
+        )
+
+        self._evict_entries()
+        return True
+
+    def _evict_entries(self) -> None:
+        """
+        Remove the least recently used entries of the project over max_entries
+        """
+        entries = []
+        for entry in os.scandir(self.project_cache_path):
+            if entry.is_dir() and not entry.name.endswith(".tmp"):
+                entries.append((entry.stat().st_mtime, entry.path))
+        for _, entry_path in sorted(entries, reverse=True)[self.max_entries :]:
+            shutil.rmtree(entry_path, ignore_errors=True)
+
+    def _scan_assets(self, directory: str) -> list[tuple[str, int, int]]:
+        """
+        :return: Path relative to the project, size and modification time of every asset
+            in the directory
+        """
+        assets = []
+        to_visit = [directory]
+        while to_visit:
+            try:
+                entries = list(os.scandir(to_visit.pop()))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    to_visit.append(entry.path)
+                elif entry.name.lower().endswith(self.ASSET_EXTENSIONS):
+                    stat = entry.stat()
+                    assets.append(
+                        (
+                            os.path.relpath(entry.path, self.project_dir).replace("\\", "/"),
+                            stat.st_size,
+                            stat.st_mtime_ns,
+                        )
+                    )
+        return assets
@@ -0,0 +1,223 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import re
+import logging
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class LocalDerivedDataCache:
+    """
+    Worker local DerivedDataCache directory that persists between the sessions,
+    so the shaders and the cooked data built by one session are reused by the next ones.
+
+    The directory is bounded by the size budget: the least recently used files are evicted
+    before the editor starts, until the directory fits into the EVICTION_TARGET_RATIO
+    of the budget. The last use of the file is the later of its access and modification time.
+    """
+
+    BYTES_IN_GB = 1024 * 1024 * 1024
+
+    #: Share of the budget the directory is reduced to by the eviction, so the eviction
+    #: doesn't run every session once the directory reaches the budget
+    EVICTION_TARGET_RATIO = 0.9
+
+    def __init__(
+        self,
+        path: str,
+        max_size: Optional[int] = None,
+        graph: Optional[str] = None,
+        stats: bool = False,
+    ):
+        """
+        :param path: DerivedDataCache directory, environment variables and ~ are expanded
+        :type path: str
+        :param max_size: Size budget of the directory in bytes, None disables the eviction
+        :type max_size: Optional[int]
+        :param graph: Name of the DerivedDataCache graph passed to the editor with -ddc,
+                      e.g. NoZenLocalFallback to use the file system instead of Zen
+        :type graph: Optional[str]
+        :param stats: Whether the editor logs the cache requests the statistics are counted from
+        :type stats: bool
+        """
+        self.path = os.path.abspath(os.path.expandvars(os.path.expanduser(path)))
+        self.max_size = max_size
+        self.graph = graph
+        self.stats = stats
+
+    @classmethod
+    def from_init_data(cls, init_data: dict) -> Optional[LocalDerivedDataCache]:
+        """
+        :param init_data: Adaptor init_data with the optional ddc object
+        :type init_data: dict
+
+        :return: LocalDerivedDataCache or None if it is not configured
+        :rtype: Optional[LocalDerivedDataCache]
+        """
+        ddc_settings = init_data.get("ddc")
+        if not ddc_settings:
+            return None
+        max_size_gb = ddc_settings.get("max_size_gb")
+        return cls(
+            path=ddc_settings["path"],
+            max_size=None if max_size_gb is None else int(max_size_gb * cls.BYTES_IN_GB),
+            graph=ddc_settings.get("graph"),
+            stats=ddc_settings.get("stats", False),
+        )
+
+    def get_command_line_args(self) -> list[str]:
+        """
+        :return: Editor command line arguments pointing the local DerivedDataCache
+            at the directory and enabling the cache requests log if the stats are requested
+        :rtype: list[str]
+        """
+        args = [f"-LocalDataCachePath={self.path}"]
+        if self.graph:
+            args.append(f"-ddc={self.graph}")
+        if self.stats:
+            args.append(DerivedDataCacheStats.LOG_CMDS_ARG)
+        return args
+
+    def get_size(self) -> int:
+        """
+        :return: Size of the files in the directory in bytes
+        :rtype: int
+        """
+        return sum(size for _, size, _ in self._list_files())
+
+    def prepare(self) -> None:
+        """
+        Create the directory if it doesn't exist and evict the least recently used files
+        if it exceeds the size budget. Should be called when the editor is not running.
+        """
+        os.makedirs(self.path, exist_ok=True)
+
+        files = self._list_files()
+        size = sum(file_size for _, file_size, _ in files)
+        if self.max_size is None or size <= self.max_size:
+            logger.info(
+                f"DerivedDataCache {self.path}: {self._to_gb(size)} GB"
+                + ("" if self.max_size is None else f" of {self._to_gb(self.max_size)} GB")
+            )
+            return
+
+        target_size = self.max_size * self.EVICTION_TARGET_RATIO
+        evicted_files = 0
+        evicted_size = 0
+        for _, file_size, file_path in sorted(files):
+            if size - evicted_size <= target_size:
+                break
+            try:
+                os.remove(file_path)
+            except OSError as e:
+                logger.warning(f"Can't evict {file_path} from the DerivedDataCache: {e}")
+                continue
+            evicted_files += 1
+            evicted_size += file_size
+
+        self._remove_empty_dirs()
+
+        logger.info(
+            f"DerivedDataCache {self.path}: evicted {evicted_files} least recently used files "
+            f"({self._to_gb(evicted_size)} GB), {self._to_gb(size - evicted_size)} GB "
+            f"of {self._to_gb(self.max_size)} GB left"
+        )
+
+    def _list_files(self) -> list[tuple[float, int, str]]:
+        """
+        :return: Last use time, size and path of every file in the directory
+        """
+        files = []
+        for root, _, names in os.walk(self.path):
+            for name in names:
+                file_path = os.path.join(root, name)
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                files.append((max(stat.st_atime, stat.st_mtime), stat.st_size, file_path))
+        return files
+
+    def _remove_empty_dirs(self) -> None:
+        for root, dirs, names in os.walk(self.path, topdown=False):
+            if root != self.path and not dirs and not names:
+                try:
+                    os.rmdir(root)
+                except OSError:
+                    pass
+
+    @classmethod
+    def _to_gb(cls, value: float) -> float:
+        return round(value / cls.BYTES_IN_GB, 2)
+
+
+class DerivedDataCacheStats:
+    """
+    Counts the DerivedDataCache hits and misses reported in the editor log.
+
+    The editor reports every request to the cache stores as "Cache hit" or "Cache miss" line
+    of the LogDerivedDataCache category, at the Verbose verbosity in Unreal Engine 5,
+    so the statistics need -LogCmds="LogDerivedDataCache Verbose", added to the editor
+    command line by the "stats" option of the ddc init_data. The lines are observed before
+    the log policy, so they don't need to get to the worker log.
+    """
+
+    #: Editor command line argument enabling the log of the cache requests
+    LOG_CMDS_ARG = "-LogCmds=LogDerivedDataCache Verbose"
+
+    _REQUEST_RE = re.compile(r"LogDerivedDataCache:.*?\bcache (hit|miss)\b", re.IGNORECASE)
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def reset(self) -> None:
+        """
+        Forget the counted requests, so the next summary covers only the requests since the reset
+        """
+        self.hits = 0
+        self.misses = 0
+
+    def observe_line(self, line: str) -> None:
+        """
+        :param line: Line of the Unreal output
+        :type line: str
+        """
+        if "LogDerivedDataCache" not in line:
+            return
+        match = self._REQUEST_RE.search(line)
+        if match is None:
+            return
+        if match.group(1).lower() == "hit":
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        """
+        :return: Share of the hits in the requests or None if there were no requests
+        :rtype: Optional[float]
+        """
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else None
+
+    def summary(self, scope: str = "") -> str:
+        """
+        :param scope: What the statistics cover, e.g. "task"
+        :type scope: str
+
+        :return: Human readable summary of the statistics
+        :rtype: str
+        """
+        prefix = f"DerivedDataCache ({scope})" if scope else "DerivedDataCache"
+        if self.hit_rate is None:
+            return f"{prefix}: no cache requests in the editor log"
+        return (
+            f"{prefix}: {self.hits} hits, {self.misses} misses " f"(hit rate {self.hit_rate:.1%})"
+        )
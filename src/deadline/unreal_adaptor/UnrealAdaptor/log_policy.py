@@ -0,0 +1,237 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import re
+import gzip
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import IO, Callable, Optional
+
+# Registers the STDOUT and STDERR log levels of the Unreal output records
+import openjd.adaptor_runtime.process  # noqa: F401
+
+
+class UnrealLogPolicy(logging.Filter):
+    """
+    Logging filter that controls which Unreal output lines are forwarded to the worker log.
+
+    Only the records of the Unreal stdout and stderr are filtered, other records of the logger,
+    e.g. the command line of the Unreal process, always pass.
+
+    - Lines are filtered by the Unreal log category and verbosity, the same way as Unreal's
+      -LogCmds do. Each category has the verbosity, the lines with the higher verbosity are
+      dropped. "NoLogging" drops all the lines of the category except the errors.
+      Lines without the log category, e.g. the output of the Unreal crash handler, always pass.
+    - Repetitive lines are sampled: the first of the similar lines (same text except numbers)
+      passes, the next similar lines in the sample interval are suppressed. The next passed similar
+      line tells how many lines were suppressed.
+
+    Error and Fatal lines are never dropped, so the reason of the failure is always in the worker log.
+    """
+
+    #: Unreal log verbosities ordered from the least to the most verbose
+    VERBOSITIES = [
+        "NoLogging",
+        "Fatal",
+        "Error",
+        "Warning",
+        "Display",
+        "Log",
+        "Verbose",
+        "VeryVerbose",
+    ]
+
+    #: Verbosity of the Unreal log lines without the explicit verbosity
+    DEFAULT_LINE_VERBOSITY = "Log"
+
+    #: Lines of this verbosity and less verbose are never dropped
+    ALWAYS_PASS_VERBOSITY = "Error"
+
+    #: Maximum number of the similar lines groups tracked by the sampling
+    SAMPLE_KEYS_LIMIT = 10000
+
+    # [2024.01.01-12.00.00:000][  0]LogCategory: Verbosity: Message
+    _LINE_RE = re.compile(
+        r"^(?:\[[^\]]*\]\[\s*\d+\])?(?P<category>\w+): (?:(?P<verbosity>"
+        r"Fatal|Error|Warning|Display|Log|Verbose|VeryVerbose): )?"
+    )
+    _NUMBERS_RE = re.compile(r"\d+")
+    _TIMESTAMP_RE = re.compile(r"^\[[^\]]*\]\[\s*\d+\]")
+
+    def __init__(
+        self,
+        verbosity: str = "VeryVerbose",
+        category_verbosity: Optional[dict[str, str]] = None,
+        sample_interval: float = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param verbosity: Verbosity of the categories not listed in the category_verbosity
+        :type verbosity: str
+        :param category_verbosity: Verbosity by the Unreal log category
+        :type category_verbosity: Optional[dict[str, str]]
+        :param sample_interval: Time in seconds the similar lines are suppressed after the passed one.
+                                0 disables the sampling.
+        :type sample_interval: float
+        :param clock: Callable returning the current time in seconds
+        :type clock: Callable[[], float]
+
+        :raises ValueError: If the verbosity is unknown
+        """
+        super().__init__()
+
+        self._verbosity = self._verbosity_level(verbosity)
+        self._category_verbosity = {
+            category: self._verbosity_level(level)
+            for category, level in (category_verbosity or {}).items()
+        }
+        self._sample_interval = sample_interval
+        self._clock = clock
+        self._filtered_levels = {logging.getLevelName("STDOUT"), logging.getLevelName("STDERR")}
+
+        self._lock = threading.Lock()
+        # similar lines key -> [time the last line passed, suppressed lines count since then]
+        self._samples: OrderedDict[str, list] = OrderedDict()
+        self.dropped_lines = 0
+        self.sampled_lines = 0
+
+    @classmethod
+    def from_init_data(cls, log_policy: dict) -> UnrealLogPolicy:
+        """
+        Create the policy from the log_policy of the adaptor init_data
+
+        :param log_policy: log_policy of the init_data
+        :type log_policy: dict
+
+        :return: The log policy
+        :rtype: UnrealLogPolicy
+        """
+        return cls(
+            verbosity=log_policy.get("verbosity", "VeryVerbose"),
+            category_verbosity=log_policy.get("category_verbosity"),
+            sample_interval=log_policy.get("sample_interval", 0),
+        )
+
+    @classmethod
+    def _verbosity_level(cls, verbosity: str) -> int:
+        if verbosity not in cls.VERBOSITIES:
+            raise ValueError(
+                f"Unknown Unreal log verbosity: {verbosity}. Expected one of {cls.VERBOSITIES}"
+            )
+        return cls.VERBOSITIES.index(verbosity)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        :param record: Log record of the Unreal output line
+        :type record: logging.LogRecord
+
+        :return: True if the line should be logged, False otherwise
+        :rtype: bool
+        """
+        if record.levelno not in self._filtered_levels or not isinstance(record.msg, str):
+            return True
+
+        line = record.msg
+        match = self._LINE_RE.match(line)
+        if match is None:
+            return self._sample(record)
+
+        line_verbosity = self._verbosity_level(
+            match.group("verbosity") or self.DEFAULT_LINE_VERBOSITY
+        )
+        if line_verbosity <= self._verbosity_level(self.ALWAYS_PASS_VERBOSITY):
+            return True
+
+        category_verbosity = self._category_verbosity.get(match.group("category"), self._verbosity)
+        if line_verbosity > category_verbosity:
+            with self._lock:
+                self.dropped_lines += 1
+            return False
+
+        return self._sample(record)
+
+    def _sample(self, record: logging.LogRecord) -> bool:
+        """
+        Suppress the line if the similar line passed less than the sample interval ago.
+        The passed line is appended with the number of the similar lines suppressed before it.
+
+        :param record: Log record of the Unreal output line
+        :type record: logging.LogRecord
+
+        :return: True if the line should be logged, False otherwise
+        :rtype: bool
+        """
+        if not self._sample_interval:
+            return True
+
+        key = self._NUMBERS_RE.sub("#", self._TIMESTAMP_RE.sub("", record.msg))
+        now = self._clock()
+        with self._lock:
+            sample = self._samples.get(key)
+            if sample is not None and now - sample[0] < self._sample_interval:
+                sample[1] += 1
+                self.sampled_lines += 1
+                return False
+
+            if sample is not None and sample[1]:
+                record.msg = f"{record.msg} (suppressed {sample[1]} similar lines)"
+            self._samples[key] = [now, 0]
+            self._samples.move_to_end(key)
+            if len(self._samples) > self.SAMPLE_KEYS_LIMIT:
+                self._samples.popitem(last=False)
+            return True
+
+    def summary(self) -> str:
+        """
+        :return: Human readable count of the lines the policy didn't forward to the worker log
+        :rtype: str
+        """
+        with self._lock:
+            return (
+                f"Unreal log policy suppressed {self.dropped_lines + self.sampled_lines} lines: "
+                f"{self.dropped_lines} by the log category verbosity, "
+                f"{self.sampled_lines} similar lines by sampling"
+            )
+
+
+class UnrealLogArchive:
+    """
+    Writes the full raw Unreal output to the gzip file on the local disk,
+    regardless of the log policy.
+    """
+
+    #: Compression level of the archive, the fastest one, so the archive spends little CPU
+    #: on the long renders, the repetitive log lines are still compressed well
+    COMPRESS_LEVEL = 1
+
+    def __init__(self, path: str) -> None:
+        """
+        :param path: Path to the gzip file, the lines are appended if it exists
+        :type path: str
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._file: Optional[IO[str]] = gzip.open(
+            path, "at", encoding="utf-8", compresslevel=self.COMPRESS_LEVEL
+        )
+
+    def write_line(self, line: str) -> None:
+        """
+        :param line: Line of the Unreal output
+        :type line: str
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.write(line + "\n")
+
+    def close(self) -> None:
+        """
+        Close the archive file, lines written after that are ignored
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,101 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import time
+from typing import Callable, Optional
+
+
+class MemoryGuard:
+    """
+    Samples the memory used by the Unreal Editor and its child processes and tells when
+    it exceeds the ceiling.
+
+    The memory is sampled during the tasks at a bounded rate to track the peak,
+    and once more at the task boundary to decide whether the editor should be recycled
+    before the next task.
+    """
+
+    BYTES_IN_MB = 1024 * 1024
+
+    def __init__(
+        self,
+        memory_usage: Callable[[], Optional[int]],
+        max_memory: Optional[int] = None,
+        sample_interval: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param memory_usage: Callable returning the memory used by the editor in bytes
+                             or None if it is not known
+        :type memory_usage: Callable[[], Optional[int]]
+        :param max_memory: Memory ceiling in bytes, None disables the ceiling
+        :type max_memory: Optional[int]
+        :param sample_interval: Minimum time in seconds between the samples taken during the task
+        :type sample_interval: float
+        :param clock: Callable returning the current time in seconds
+        :type clock: Callable[[], float]
+        """
+        self._memory_usage = memory_usage
+        self.max_memory = max_memory
+        self._sample_interval = sample_interval
+        self._clock = clock
+
+        self._last_sample_time: Optional[float] = None
+        self.last_usage: Optional[int] = None
+        self.peak_usage: Optional[int] = None
+
+    def reset(self) -> None:
+        """
+        Forget the samples, e.g. after the editor restart
+        """
+        self._last_sample_time = None
+        self.last_usage = None
+        self.peak_usage = None
+
+    def sample(self) -> Optional[int]:
+        """
+        Sample the memory usage now
+
+        :return: Memory used by the editor in bytes or None if it is not known
+        :rtype: Optional[int]
+        """
+        self._last_sample_time = self._clock()
+        usage = self._memory_usage()
+        if usage is not None:
+            self.last_usage = usage
+            self.peak_usage = max(usage, self.peak_usage or 0)
+        return usage
+
+    def sample_if_due(self) -> None:
+        """
+        Sample the memory usage if the sample interval passed since the last sample
+        """
+        if (
+            self._last_sample_time is None
+            or self._clock() - self._last_sample_time >= self._sample_interval
+        ):
+            self.sample()
+
+    def is_exceeded(self) -> bool:
+        """
+        Sample the memory usage and compare it to the ceiling
+
+        :return: True if the editor uses more memory than the ceiling
+        :rtype: bool
+        """
+        if self.max_memory is None:
+            return False
+        usage = self.sample()
+        return usage is not None and usage > self.max_memory
+
+    @classmethod
+    def to_mb(cls, value: Optional[int]) -> Optional[float]:
+        """
+        :param value: Number of bytes
+        :type value: Optional[int]
+
+        :return: Number of megabytes rounded to 0.1 or None
+        :rtype: Optional[float]
+        """
+        return None if value is None else round(value / cls.BYTES_IN_MB, 1)
@@ -0,0 +1,343 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import sys
+import ctypes
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class ProcessTreeStats:
+    """
+    Resource usage of the process together with its live child processes
+    """
+
+    #: CPU time (user and system) in seconds
+    cpu_time: float
+    #: Resident memory in bytes
+    rss: int
+    #: Bytes read from the storage
+    read_bytes: int
+    #: Bytes written to the storage
+    write_bytes: int
+    #: Number of the processes in the tree
+    process_count: int
+
+
+def _get_descendants(pid: int, parents: dict[int, int]) -> list[int]:
+    """
+    Get all the descendant processes of the process
+
+    :param pid: Process id
+    :param parents: Parent process id by process id
+    :return: Process ids of the children, grandchildren etc.
+    """
+    children: dict[int, list[int]] = {}
+    for child_pid, parent_pid in parents.items():
+        if child_pid != parent_pid:
+            children.setdefault(parent_pid, []).append(child_pid)
+
+    descendants: dict[int, None] = {}
+    to_visit = list(children.get(pid, []))
+    while to_visit:
+        child_pid = to_visit.pop()
+        if child_pid in descendants:
+            continue
+        descendants[child_pid] = None
+        to_visit.extend(children.get(child_pid, []))
+    return list(descendants)
+
+
+if sys.platform == "win32":
+    from ctypes import wintypes
+
+    _PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    _TH32CS_SNAPPROCESS = 0x00000002
+    _INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+    class _PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    class _PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("cntUsage", wintypes.DWORD),
+            ("th32ProcessID", wintypes.DWORD),
+            ("th32DefaultHeapID", ctypes.c_void_p),
+            ("th32ModuleID", wintypes.DWORD),
+            ("cntThreads", wintypes.DWORD),
+            ("th32ParentProcessID", wintypes.DWORD),
+            ("pcPriClassBase", ctypes.c_long),
+            ("dwFlags", wintypes.DWORD),
+            ("szExeFile", wintypes.WCHAR * 260),
+        ]
+
+    def _get_windows_rss(pid: int) -> Optional[int]:
+        """
+        Get the working set size with GetProcessMemoryInfo
+        """
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, int(pid))
+        if not handle:
+            return None
+        try:
+            counters = _PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            if not ctypes.windll.psapi.GetProcessMemoryInfo(
+                handle, ctypes.byref(counters), counters.cb
+            ):
+                return None
+            return counters.WorkingSetSize
+        finally:
+            kernel32.CloseHandle(handle)
+
+    def _get_windows_children(pid: int) -> list[int]:
+        """
+        Get the descendant processes from the process snapshot
+        """
+        kernel32 = ctypes.windll.kernel32
+        kernel32.CreateToolhelp32Snapshot.restype = ctypes.c_void_p
+        snapshot = kernel32.CreateToolhelp32Snapshot(_TH32CS_SNAPPROCESS, 0)
+        if snapshot is None or snapshot == _INVALID_HANDLE_VALUE:
+            return []
+        parents: dict[int, int] = {}
+        try:
+            entry = _PROCESSENTRY32W()
+            entry.dwSize = ctypes.sizeof(entry)
+            has_entry = kernel32.Process32FirstW(ctypes.c_void_p(snapshot), ctypes.byref(entry))
+            while has_entry:
+                parents[entry.th32ProcessID] = entry.th32ParentProcessID
+                has_entry = kernel32.Process32NextW(ctypes.c_void_p(snapshot), ctypes.byref(entry))
+        finally:
+            kernel32.CloseHandle(ctypes.c_void_p(snapshot))
+        return _get_descendants(int(pid), parents)
+
+    class _IO_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("ReadOperationCount", ctypes.c_ulonglong),
+            ("WriteOperationCount", ctypes.c_ulonglong),
+            ("OtherOperationCount", ctypes.c_ulonglong),
+            ("ReadTransferCount", ctypes.c_ulonglong),
+            ("WriteTransferCount", ctypes.c_ulonglong),
+            ("OtherTransferCount", ctypes.c_ulonglong),
+        ]
+
+    def _get_windows_io_bytes(pid: int) -> Optional[tuple[int, int]]:
+        """
+        Get the read and written bytes with GetProcessIoCounters
+        """
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, int(pid))
+        if not handle:
+            return None
+        try:
+            counters = _IO_COUNTERS()
+            if not kernel32.GetProcessIoCounters(handle, ctypes.byref(counters)):
+                return None
+            return counters.ReadTransferCount, counters.WriteTransferCount
+        finally:
+            kernel32.CloseHandle(handle)
+
+    def _get_windows_cpu_time(pid: int) -> Optional[float]:
+        """
+        Get the CPU time with GetProcessTimes, FILETIME values are in 100 nanoseconds
+        """
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, int(pid))
+        if not handle:
+            return None
+        try:
+            creation_time, exit_time, kernel_time, user_time = (
+                wintypes.FILETIME() for _ in range(4)
+            )
+            if not kernel32.GetProcessTimes(
+                handle,
+                ctypes.byref(creation_time),
+                ctypes.byref(exit_time),
+                ctypes.byref(kernel_time),
+                ctypes.byref(user_time),
+            ):
+                return None
+            return sum(
+                (filetime.dwHighDateTime << 32 | filetime.dwLowDateTime) / 10_000_000
+                for filetime in (kernel_time, user_time)
+            )
+        finally:
+            kernel32.CloseHandle(handle)
+
+else:
+
+    def _get_proc_rss(pid: int) -> Optional[int]:
+        """
+        Read the resident memory from /proc/<pid>/statm, available on Linux only
+        """
+        with open(f"/proc/{int(pid)}/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+    def _get_proc_children(pid: int) -> list[int]:
+        """
+        Get the descendant processes from the parent process ids in /proc/<pid>/stat
+        """
+        parents: dict[int, int] = {}
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat", "r") as f:
+                    stat = f.read()
+            except OSError:
+                continue
+            parents[int(entry)] = int(stat[stat.rindex(")") + 2 :].split()[1])
+        return _get_descendants(int(pid), parents)
+
+    def _get_proc_io_bytes(pid: int) -> Optional[tuple[int, int]]:
+        """
+        Read the storage read and written bytes from /proc/<pid>/io, available on Linux only
+        """
+        counters: dict[str, int] = {}
+        with open(f"/proc/{int(pid)}/io", "r") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                counters[name.strip()] = int(value)
+        if "read_bytes" not in counters or "write_bytes" not in counters:
+            return None
+        return counters["read_bytes"], counters["write_bytes"]
+
+    def _get_proc_cpu_time(pid: int) -> Optional[float]:
+        """
+        Read the CPU time from /proc/<pid>/stat, available on Linux only
+        """
+        with open(f"/proc/{int(pid)}/stat", "r") as f:
+            stat = f.read()
+
+        # Process name in the second field may contain spaces, fields after it are space separated.
+        # utime and stime are the 14th and 15th fields
+        fields = stat[stat.rindex(")") + 2 :].split()
+        clock_ticks = os.sysconf("SC_CLK_TCK")
+        return (int(fields[11]) + int(fields[12])) / clock_ticks
+
+
+def get_cpu_time(pid: int) -> Optional[float]:
+    """
+    Get the CPU time (user and system) the process spent, without its children
+
+    :param pid: Process id
+    :type pid: int
+
+    :return: CPU time in seconds or None if it can't be read, e.g. the process exited
+    :rtype: Optional[float]
+    """
+    try:
+        if sys.platform == "win32":
+            return _get_windows_cpu_time(pid)
+        else:
+            return _get_proc_cpu_time(pid)
+    except (OSError, ValueError, IndexError, TypeError):
+        return None
+
+
+def get_memory_usage(pid: int, include_children: bool = True) -> Optional[int]:
+    """
+    Get the resident memory of the process, by default together with all its child processes,
+    e.g. the shader compile workers of the Unreal Editor
+
+    :param pid: Process id
+    :type pid: int
+    :param include_children: Add the memory of the child processes, recursively
+    :type include_children: bool
+
+    :return: Resident memory in bytes or None if it can't be read, e.g. the process exited
+    :rtype: Optional[int]
+    """
+    try:
+        if sys.platform == "win32":
+            get_rss, get_children = _get_windows_rss, _get_windows_children
+        else:
+            get_rss, get_children = _get_proc_rss, _get_proc_children
+
+        memory_usage = get_rss(pid)
+        if memory_usage is None:
+            return None
+        if include_children:
+            for child_pid in get_children(pid):
+                try:
+                    memory_usage += get_rss(child_pid) or 0
+                except (OSError, ValueError, IndexError):
+                    # Child process exited while reading
+                    pass
+        return memory_usage
+    except (OSError, ValueError, IndexError, TypeError):
+        return None
+
+
+def get_process_tree_stats(pid: int) -> Optional[ProcessTreeStats]:
+    """
+    Get the resource usage of the process and all its live child processes.
+    The child processes that exited are not counted.
+
+    :param pid: Process id
+    :type pid: int
+
+    :return: Resource usage or None if it can't be read, e.g. the process exited
+    :rtype: Optional[ProcessTreeStats]
+    """
+    if sys.platform == "win32":
+        get_rss, get_cpu, get_io, get_children = (
+            _get_windows_rss,
+            _get_windows_cpu_time,
+            _get_windows_io_bytes,
+            _get_windows_children,
+        )
+    else:
+        get_rss, get_cpu, get_io, get_children = (
+            _get_proc_rss,
+            _get_proc_cpu_time,
+            _get_proc_io_bytes,
+            _get_proc_children,
+        )
+
+    try:
+        child_pids = get_children(pid)
+    except (OSError, ValueError, IndexError, TypeError):
+        return None
+
+    stats = ProcessTreeStats(cpu_time=0.0, rss=0, read_bytes=0, write_bytes=0, process_count=0)
+    for process_pid in [pid, *child_pids]:
+        try:
+            rss = get_rss(process_pid)
+            cpu_time = get_cpu(process_pid)
+        except (OSError, ValueError, IndexError, TypeError):
+            rss = None
+        try:
+            io_bytes = get_io(process_pid)
+        except (OSError, ValueError, IndexError, TypeError):
+            # I/O counters of the process owned by another user are not readable
+            io_bytes = None
+        if rss is None:
+            if process_pid == pid:
+                return None
+            # Child process exited while reading
+            continue
+
+        stats.process_count += 1
+        stats.rss += rss
+        stats.cpu_time += cpu_time or 0.0
+        if io_bytes is not None:
+            stats.read_bytes += io_bytes[0]
+            stats.write_bytes += io_bytes[1]
+    return stats
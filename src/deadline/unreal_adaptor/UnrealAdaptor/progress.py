@@ -0,0 +1,108 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import time
+import threading
+from typing import Callable, Optional
+
+
+class ProgressCoalescer:
+    """
+    Rate limits the progress reported to the worker agent.
+
+    Unreal reports the render progress every engine frame, while the worker agent needs
+    at most one update per second. Progress values are reported only when both
+    the minimum interval passed since the last report and the value changed at least
+    by the minimum delta. The last suppressed value is kept pending and can be reported
+    later with :meth:`flush_if_due` or :meth:`flush`. 100% is always reported immediately.
+    """
+
+    COMPLETE_PROGRESS = 100.0
+
+    def __init__(
+        self,
+        report: Callable[[float], None],
+        min_interval: float = 1.0,
+        min_delta: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param report: Callable that sends the progress value to the worker agent
+        :type report: Callable[[float], None]
+        :param min_interval: Minimum time in seconds between two reports
+        :type min_interval: float
+        :param min_delta: Minimum difference between two reported progress values
+        :type min_delta: float
+        :param clock: Callable returning the current time in seconds
+        :type clock: Callable[[], float]
+        """
+        self._report = report
+        self._min_interval = min_interval
+        self._min_delta = min_delta
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._last_reported: Optional[float] = None
+        self._last_report_time: Optional[float] = None
+        self._pending: Optional[float] = None
+
+    def reset(self) -> None:
+        """
+        Forget the reported and pending progress, e.g. before starting the next task
+        """
+        with self._lock:
+            self._last_reported = None
+            self._last_report_time = None
+            self._pending = None
+
+    def update(self, progress: float) -> None:
+        """
+        Report the given progress if the rate limits allow it, keep it pending otherwise
+
+        :param progress: Progress value in percents
+        :type progress: float
+        """
+        with self._lock:
+            if progress == self._last_reported:
+                self._pending = None
+                return
+
+            if progress >= self.COMPLETE_PROGRESS:
+                self._report_locked(progress)
+                return
+
+            self._pending = progress
+            if self._is_due_locked() and self._has_delta_locked(progress):
+                self._report_locked(progress)
+
+    def flush_if_due(self) -> None:
+        """
+        Report the pending progress if the minimum interval passed since the last report
+        """
+        with self._lock:
+            if self._pending is not None and self._is_due_locked():
+                self._report_locked(self._pending)
+
+    def flush(self) -> None:
+        """
+        Report the pending progress immediately, e.g. when the task finished or failed
+        """
+        with self._lock:
+            if self._pending is not None:
+                self._report_locked(self._pending)
+
+    def _is_due_locked(self) -> bool:
+        return (
+            self._last_report_time is None
+            or self._clock() - self._last_report_time >= self._min_interval
+        )
+
+    def _has_delta_locked(self, progress: float) -> bool:
+        return self._last_reported is None or abs(progress - self._last_reported) >= self._min_delta
+
+    def _report_locked(self, progress: float) -> None:
+        self._report(progress)
+        self._last_reported = progress
+        self._last_report_time = self._clock()
+        self._pending = None
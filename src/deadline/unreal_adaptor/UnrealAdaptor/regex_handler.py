@@ -0,0 +1,116 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import logging
+import re
+from typing import Callable, Optional, Sequence
+
+from openjd.adaptor_runtime.app_handlers import RegexCallback, RegexHandler
+
+
+class PrefilteredRegexHandler(RegexHandler):
+    """
+    RegexHandler that dispatches each logged line in a single pass.
+
+    Unreal Engine writes thousands of log lines per second while loading and rendering,
+    and only a handful of them are interesting to the adaptor. Instead of running every
+    pattern of every callback against every line, this handler:
+
+    1. Rejects the line with plain substring checks if it contains none of the keywords
+    2. Runs one combined pattern (alternation of all callback patterns) against the rest
+    3. Dispatches the matched line the same way as the default RegexHandler, so every
+       callback with a matching pattern is called with the same re.Match, once per line
+
+    Callback patterns must be compiled without flags, so they can be combined.
+    """
+
+    def __init__(
+        self,
+        regex_callbacks: Sequence[RegexCallback],
+        keywords: Optional[Sequence[str]] = None,
+        level: int = logging.NOTSET,
+        line_observer: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """
+        :param regex_callbacks: RegexCallbacks to dispatch the logged lines to
+        :type regex_callbacks: Sequence[RegexCallback]
+        :param keywords: Substrings of which at least one is contained by any line matched
+            by the callback patterns. If empty or None, the prefilter is disabled.
+        :type keywords: Optional[Sequence[str]]
+        :param level: Minimum level of message that will be handled
+        :type level: int
+        :param line_observer: Callable that is called with every logged line before
+            the prefilter, e.g. to profile the Unreal startup. Must be cheap.
+        :type line_observer: Optional[Callable[[str], None]]
+        """
+        super().__init__(regex_callbacks, level)
+
+        self.line_observer = line_observer
+
+        self._keywords: tuple[str, ...] = tuple(dict.fromkeys(keywords or []))
+
+        # Unique patterns of all the callbacks, in the order of the callbacks
+        patterns = list(
+            dict.fromkeys(
+                regex.pattern
+                for regex_callback in self.regex_callbacks
+                for regex in regex_callback.regex_list
+            )
+        )
+
+        self._combined_pattern: Optional[re.Pattern[str]] = None
+        if patterns:
+            self._combined_pattern = re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+    def _passes_prefilter(self, msg: str) -> bool:
+        """
+        Check if the given message contains at least one of the keywords
+
+        :param msg: Logged message
+        :type msg: str
+        :return: True if the message should be matched against the combined pattern
+        :rtype: bool
+        """
+        if not self._keywords:
+            return True
+        for keyword in self._keywords:
+            if keyword in msg:
+                return True
+        return False
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Method which is called by the logger when a string is logged to a logger
+        this handler has been added to.
+
+        :param record: The log record of the logged string
+        :type record: logging.LogRecord
+        """
+        msg = record.msg
+        if not isinstance(msg, str):
+            return
+
+        if self.line_observer is not None:
+            self.line_observer(msg)
+
+        if self._combined_pattern is None or not self._passes_prefilter(msg):
+            return
+
+        if self._combined_pattern.search(msg) is None:
+            return
+
+        # Matched lines are rare, dispatch them like the default RegexHandler, but call
+        # the callback shared by several RegexCallbacks only once per line
+        called_callbacks: list[Callable[[re.Match], None]] = []
+        matched = False
+        for regex_callback in self.regex_callbacks:
+            if matched and regex_callback.only_run_if_first_matched:
+                continue
+            match = regex_callback.get_match(msg)
+            if match is not None and regex_callback.callback not in called_callbacks:
+                called_callbacks.append(regex_callback.callback)
+                regex_callback.callback(match)
+            if match is not None and regex_callback.exit_if_matched:
+                break
+            matched = matched or match is not None
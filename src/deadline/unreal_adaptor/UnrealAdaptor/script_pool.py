@@ -0,0 +1,175 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import logging
+import threading
+import multiprocessing
+import multiprocessing.pool
+from typing import Any, Callable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+def init_worker(events: Any) -> None:
+    """
+    Send the step handler events of the pool process, e.g. the progress reported by the script
+    context, to the adaptor process through the queue. Module level, so the pool can pickle it.
+
+    :param events: multiprocessing.SimpleQueue read by the adaptor process
+    :type events: Any
+    """
+    from deadline.unreal_adaptor.UnrealClient.step_handlers.base_step_handler import (
+        BaseStepHandler,
+    )
+
+    BaseStepHandler.event_sender = events.put
+
+
+def run_script(script_path: str, script_args: dict) -> str:
+    """
+    Execute the main() of the custom script in the pool process. Module level,
+    so the pool can pickle it.
+
+    :param script_path: Path of the custom script
+    :type script_path: str
+    :param script_args: Keyword arguments of the main()
+    :type script_args: dict
+
+    :return: String representation of the main() result
+    :rtype: str
+    """
+    from deadline.unreal_adaptor.UnrealClient.step_handlers.unreal_custom_step_handler import (
+        UnrealCustomStepHandler,
+    )
+
+    script_module = UnrealCustomStepHandler.validate_script(script_path)
+    return str(UnrealCustomStepHandler.execute_script(script_module, script_args))
+
+
+class ScriptProcessPool:
+    """
+    Pool of the Python processes executing the custom scripts that don't need Unreal Editor,
+    so the steps of such scripts don't wait for the editor to start and don't hold its memory.
+
+    The script is executed the same way the custom step handler executes it in the editor:
+    the module is imported from the script path and its main() is called with the script
+    arguments. The processes are kept for the session, so the modules imported by one task
+    and the script context of the process are reused by the next ones. The progress reported
+    by the script is passed to the adaptor process, cancel terminates the processes.
+    """
+
+    #: Time in seconds between the checks of the script result, progress and cancel
+    WAIT_INTERVAL = 0.1
+
+    def __init__(self, workers: int = 1):
+        """
+        :param workers: Number of the pool processes
+        :type workers: int
+        """
+        self.workers = workers
+        self._pool: Optional[multiprocessing.pool.Pool] = None
+        self._events: Any = None
+        self._cancel_event = threading.Event()
+
+    @classmethod
+    def from_init_data(cls, init_data: dict) -> Optional[ScriptProcessPool]:
+        """
+        :param init_data: Adaptor init_data with the optional requires_editor flag
+            and script_pool object
+        :type init_data: dict
+
+        :return: ScriptProcessPool or None if the session needs Unreal Editor
+        :rtype: Optional[ScriptProcessPool]
+        """
+        if init_data.get("requires_editor", True):
+            return None
+        return cls(workers=init_data.get("script_pool", {}).get("workers", 1))
+
+    def start(self) -> None:
+        """
+        Start the pool processes
+        """
+        if self._pool is None:
+            # Processes are spawned on every platform, like on Windows, so they don't inherit
+            # the locks held by the adaptor threads
+            context = multiprocessing.get_context("spawn")
+            # Events are written before the result, so they are read before run returns
+            self._events = context.SimpleQueue()
+            self._pool = context.Pool(
+                processes=self.workers, initializer=init_worker, initargs=(self._events,)
+            )
+
+    def run(
+        self,
+        script_path: str,
+        script_args: Optional[dict] = None,
+        on_progress: Optional[Callable[[float], None]] = None,
+    ) -> str:
+        """
+        Execute the main() of the custom script in the pool and wait for the result
+
+        :param script_path: Path of the custom script
+        :type script_path: str
+        :param script_args: Keyword arguments of the main()
+        :type script_args: Optional[dict]
+        :param on_progress: Callable receiving the progress in percents reported by the script
+        :type on_progress: Optional[Callable[[float], None]]
+
+        :raises RuntimeError: If the script failed or it was cancelled
+
+        :return: String representation of the main() result
+        :rtype: str
+        """
+        self._cancel_event.clear()
+        self.start()
+        assert self._pool is not None
+        # Progress sent late by the previous script
+        self._dispatch_events(None)
+        result = self._pool.apply_async(run_script, (script_path, script_args or {}))
+
+        while not result.ready():
+            result.wait(self.WAIT_INTERVAL)
+            self._dispatch_events(on_progress)
+            if self._cancel_event.is_set():
+                raise RuntimeError(f"Execution of the script {script_path} was cancelled")
+        self._dispatch_events(on_progress)
+
+        try:
+            return result.get()
+        except Exception as e:
+            raise RuntimeError(
+                f"Error occured while executing the given script {script_path}: {e}"
+            ) from e
+
+    def cancel(self) -> None:
+        """
+        Terminate the pool processes, the script in progress is interrupted and run raises.
+        The pool is started again by the next run.
+        """
+        self._cancel_event.set()
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.terminate()
+
+    def stop(self) -> None:
+        """
+        Stop the pool processes
+        """
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    def _dispatch_events(self, on_progress: Optional[Callable[[float], None]]) -> None:
+        """
+        Pass the progress events sent by the pool processes to the callback
+
+        :param on_progress: Callable receiving the progress in percents
+        :type on_progress: Optional[Callable[[float], None]]
+        """
+        while self._events is not None and not self._events.empty():
+            event = self._events.get()
+            if on_progress is not None and event.get("type") == "progress":
+                on_progress(float(event["progress"]))
@@ -0,0 +1,158 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import time
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+
+class StartupProfiler:
+    """
+    Collects the timings of the session startup, from the on_start call to the first run_script.
+
+    Timings are collected as:
+
+    - phases: durations in seconds of the startup steps, e.g. the adaptor server start or
+      the time from the Unreal spawn to its first stdout line
+    - milestones: seconds from the session start until something happened for the first time,
+      e.g. the first run_script
+    - log_markers: seconds between the first and the last Unreal log line of the category,
+      e.g. shader compilation, and the count of such lines
+    """
+
+    #: Unreal log categories which lines are used to estimate the duration of the startup work
+    LOG_MARKERS: dict[str, tuple[str, ...]] = {
+        "shader_compilation": ("LogShaderCompilers",),
+        "ddc": ("LogDerivedDataCache", "LogZenServiceInstance"),
+    }
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        :param clock: Callable returning the current time in seconds
+        :type clock: Callable[[], float]
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self._start_time: Optional[float] = None
+        self._spawn_time: Optional[float] = None
+        self._finished = False
+
+        self.phases: dict[str, float] = {}
+        self.milestones: dict[str, float] = {}
+        # [first line time, last line time, lines count] per log marker
+        self._log_markers: dict[str, list] = {}
+
+    @property
+    def started(self) -> bool:
+        return self._start_time is not None
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    def start(self) -> None:
+        """
+        Start the profiling, all the milestones are counted from this moment
+        """
+        with self._lock:
+            self._start_time = self._clock()
+            self._spawn_time = None
+            self._finished = False
+            self.phases.clear()
+            self.milestones.clear()
+            self._log_markers.clear()
+
+    def finish(self) -> None:
+        """
+        Stop collecting the timings, nothing is recorded after that
+        """
+        with self._lock:
+            self._finished = True
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Context manager that records the duration of the code block as the phase
+
+        :param name: Name of the phase
+        :type name: str
+        """
+        start_time = self._clock()
+        try:
+            yield
+        finally:
+            self.record_phase(name, self._clock() - start_time)
+
+    def record_phase(self, name: str, duration: float) -> None:
+        """
+        Record the phase duration, if the phase isn't recorded yet
+
+        :param name: Name of the phase
+        :type name: str
+        :param duration: Duration of the phase in seconds
+        :type duration: float
+        """
+        with self._lock:
+            if not self._finished and name not in self.phases:
+                self.phases[name] = duration
+
+    def mark_spawn(self) -> None:
+        """
+        Record the moment the Unreal process was spawned, the first stdout line is counted from it
+        """
+        with self._lock:
+            self._spawn_time = self._clock()
+
+    def mark(self, name: str) -> None:
+        """
+        Record the time from the profiling start to now as the milestone,
+        if the milestone isn't recorded yet
+
+        :param name: Name of the milestone
+        :type name: str
+        """
+        with self._lock:
+            if self._finished or self._start_time is None or name in self.milestones:
+                return
+            self.milestones[name] = self._clock() - self._start_time
+
+    def observe_line(self, line: str) -> None:
+        """
+        Observe the Unreal stdout line to record the first line and the log markers
+
+        :param line: Line of the Unreal stdout
+        :type line: str
+        """
+        if self._finished:
+            return
+
+        now = self._clock()
+        with self._lock:
+            if "first_stdout_line" not in self.phases and self._spawn_time is not None:
+                self.phases["first_stdout_line"] = now - self._spawn_time
+
+            for name, markers in self.LOG_MARKERS.items():
+                for marker in markers:
+                    if marker in line:
+                        window = self._log_markers.setdefault(name, [now, now, 0])
+                        window[1] = now
+                        window[2] += 1
+                        break
+
+    def report(self) -> dict:
+        """
+        :return: All the collected timings
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "phases": dict(self.phases),
+                "milestones": dict(self.milestones),
+                "log_markers": {
+                    name: {"seconds": last - first, "lines": count}
+                    for name, (first, last, count) in self._log_markers.items()
+                },
+            }
@@ -0,0 +1,259 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import time
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from .process_stats import ProcessTreeStats
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TaskMetrics:
+    """
+    Resources used by the Unreal process tree during one task
+    """
+
+    #: Wall time of the task in seconds
+    wall_time: float
+    #: CPU time (user and system) in seconds
+    cpu_time: float
+    #: Peak resident memory in bytes
+    peak_rss: int
+    #: Bytes read from the storage
+    read_bytes: int
+    #: Bytes written to the storage
+    write_bytes: int
+    #: Number of the frames rendered
+    frames_rendered: int
+
+
+class TaskMetricsSampler:
+    """
+    Samples the resource usage of the Unreal process tree on the background thread
+    and summarizes it per task.
+
+    CPU time and I/O bytes of the task are the difference between the samples at the task start
+    and at the task end, peak memory is the maximum of the samples during the task.
+    If the textfile path is set, the metrics are written to it after every sample
+    in the Prometheus text format, for the node exporter textfile collector.
+    """
+
+    #: Prometheus metrics written to the textfile: name, type and help
+    TEXTFILE_METRICS = [
+        ("unreal_adaptor_task_running", "gauge", "1 while the task is running"),
+        ("unreal_adaptor_tasks_completed_total", "counter", "Tasks completed in the session"),
+        ("unreal_adaptor_task_wall_seconds", "gauge", "Wall time of the current or last task"),
+        ("unreal_adaptor_task_cpu_seconds", "gauge", "CPU time of the current or last task"),
+        (
+            "unreal_adaptor_task_peak_rss_bytes",
+            "gauge",
+            "Peak resident memory of the current or last task",
+        ),
+        ("unreal_adaptor_task_read_bytes", "gauge", "Bytes read by the current or last task"),
+        ("unreal_adaptor_task_write_bytes", "gauge", "Bytes written by the current or last task"),
+        (
+            "unreal_adaptor_task_frames_rendered",
+            "gauge",
+            "Frames rendered by the current or last task",
+        ),
+        ("unreal_adaptor_rss_bytes", "gauge", "Resident memory of the Unreal process tree"),
+        ("unreal_adaptor_processes", "gauge", "Number of the processes in the Unreal process tree"),
+    ]
+
+    def __init__(
+        self,
+        process_stats: Callable[[], Optional[ProcessTreeStats]],
+        sample_interval: float = 5.0,
+        textfile_path: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param process_stats: Callable returning the resource usage of the Unreal process tree
+                              or None if it is not known
+        :type process_stats: Callable[[], Optional[ProcessTreeStats]]
+        :param sample_interval: Time in seconds between the samples
+        :type sample_interval: float
+        :param textfile_path: Path of the Prometheus textfile, None disables the textfile
+        :type textfile_path: Optional[str]
+        :param clock: Callable returning the current time in seconds
+        :type clock: Callable[[], float]
+        """
+        self._process_stats = process_stats
+        self._sample_interval = sample_interval
+        self._textfile_path = textfile_path
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._last_stats: Optional[ProcessTreeStats] = None
+        self._task_start_time: Optional[float] = None
+        self._task_start_stats: Optional[ProcessTreeStats] = None
+        self._task_peak_rss = 0
+        self._task_frames: set[tuple[Optional[str], int]] = set()
+        self._last_task_metrics: Optional[TaskMetrics] = None
+        self.tasks_completed = 0
+
+    def start(self) -> None:
+        """
+        Start the background thread sampling the resource usage
+        """
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="UnrealTaskMetricsSampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background thread
+        """
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self._sample_interval + 1)
+        self._thread = None
+
+    def sample(self) -> Optional[ProcessTreeStats]:
+        """
+        Sample the resource usage now and update the textfile
+
+        :return: Resource usage of the Unreal process tree or None if it is not known
+        :rtype: Optional[ProcessTreeStats]
+        """
+        stats = self._process_stats()
+        with self._lock:
+            if stats is not None:
+                self._last_stats = stats
+                if self._task_start_time is not None:
+                    self._task_peak_rss = max(self._task_peak_rss, stats.rss)
+        self.write_textfile()
+        return stats
+
+    def start_task(self) -> None:
+        """
+        Start counting the resources of the task
+        """
+        stats = self.sample()
+        with self._lock:
+            self._task_start_time = self._clock()
+            self._task_start_stats = stats
+            self._task_peak_rss = stats.rss if stats is not None else 0
+            self._task_frames = set()
+
+    def observe_frame(self, shot: Optional[str], frame: int) -> None:
+        """
+        Count the frame as rendered by the task, the same frame of the shot is counted once
+
+        :param shot: Name of the shot, frame numbers start over in each shot
+        :type shot: Optional[str]
+        :param frame: Frame number
+        :type frame: int
+        """
+        with self._lock:
+            if self._task_start_time is not None:
+                self._task_frames.add((shot, frame))
+
+    def finish_task(self) -> Optional[TaskMetrics]:
+        """
+        Stop counting the resources of the task
+
+        :return: Resources used by the task or None if no task was started
+        :rtype: Optional[TaskMetrics]
+        """
+        self.sample()
+        with self._lock:
+            metrics = self._get_task_metrics()
+            if metrics is None:
+                return None
+            self._last_task_metrics = metrics
+            self._task_start_time = None
+            self._task_start_stats = None
+            self.tasks_completed += 1
+        self.write_textfile()
+        return metrics
+
+    def write_textfile(self) -> None:
+        """
+        Write the metrics to the Prometheus textfile if it is set. The file is replaced
+        atomically, so the collector never reads the partially written file.
+        """
+        if not self._textfile_path:
+            return
+
+        with self._lock:
+            task_running = self._task_start_time is not None
+            task_metrics = self._get_task_metrics() if task_running else self._last_task_metrics
+            values: dict[str, float] = {
+                "unreal_adaptor_task_running": int(task_running),
+                "unreal_adaptor_tasks_completed_total": self.tasks_completed,
+            }
+            if task_metrics is not None:
+                values.update(
+                    {
+                        "unreal_adaptor_task_wall_seconds": task_metrics.wall_time,
+                        "unreal_adaptor_task_cpu_seconds": task_metrics.cpu_time,
+                        "unreal_adaptor_task_peak_rss_bytes": task_metrics.peak_rss,
+                        "unreal_adaptor_task_read_bytes": task_metrics.read_bytes,
+                        "unreal_adaptor_task_write_bytes": task_metrics.write_bytes,
+                        "unreal_adaptor_task_frames_rendered": task_metrics.frames_rendered,
+                    }
+                )
+            if self._last_stats is not None:
+                values["unreal_adaptor_rss_bytes"] = self._last_stats.rss
+                values["unreal_adaptor_processes"] = self._last_stats.process_count
+
+        lines = []
+        for name, metric_type, description in self.TEXTFILE_METRICS:
+            if name not in values:
+                continue
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            lines.append(f"{name} {values[name]}")
+
+        temp_path = f"{self._textfile_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            os.replace(temp_path, self._textfile_path)
+        except OSError as e:
+            logger.warning(f"Can't write the task metrics to {self._textfile_path}: {e}")
+
+    def _get_task_metrics(self) -> Optional[TaskMetrics]:
+        """
+        Get the resources used by the running task, the lock should be held by the caller
+        """
+        if self._task_start_time is None:
+            return None
+        start_stats = self._task_start_stats
+        end_stats = self._last_stats
+        if start_stats is None or end_stats is None:
+            cpu_time, read_bytes, write_bytes = 0.0, 0, 0
+        else:
+            # Child processes that exited during the task are not counted in the end sample,
+            # don't report the negative usage
+            cpu_time = max(end_stats.cpu_time - start_stats.cpu_time, 0.0)
+            read_bytes = max(end_stats.read_bytes - start_stats.read_bytes, 0)
+            write_bytes = max(end_stats.write_bytes - start_stats.write_bytes, 0)
+        return TaskMetrics(
+            wall_time=self._clock() - self._task_start_time,
+            cpu_time=cpu_time,
+            peak_rss=self._task_peak_rss,
+            read_bytes=read_bytes,
+            write_bytes=write_bytes,
+            frames_rendered=len(self._task_frames),
+        )
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._sample_interval):
+            self.sample()
@@ -0,0 +1,201 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import time
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+
+class StallWatchdog:
+    """
+    Detects the Unreal Editor that stopped doing anything, e.g. deadlocked.
+
+    The watchdog tracks the last Unreal output line, the last progress change and
+    the CPU time of the Unreal process, and checks them periodically on the background thread
+    against the threshold of the current phase:
+
+    - startup: from the Unreal spawn until the UnrealClient is loaded
+    - asset_loading: from the task start until its first progress
+    - rendering: from the first progress until the task is finished
+
+    During the startup and the asset loading the editor is stalled when it doesn't print anything
+    and doesn't use the CPU for the threshold. During the rendering the threshold is the time
+    of one frame, the editor is stalled when the progress doesn't change for the threshold.
+    The stall is reported to the on_stall callback once, with the diagnostics.
+    """
+
+    STARTUP = "startup"
+    ASSET_LOADING = "asset_loading"
+    RENDERING = "rendering"
+
+    #: CPU time in seconds the process should spend between the checks to be counted as active
+    CPU_ACTIVITY_SECONDS = 1.0
+
+    #: Number of the last Unreal output lines included in the diagnostics
+    RECENT_LINES_COUNT = 50
+
+    def __init__(
+        self,
+        on_stall: Callable[[str, dict], None],
+        thresholds: dict[str, float],
+        check_interval: float = 10.0,
+        cpu_time: Callable[[], Optional[float]] = lambda: None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param on_stall: Callable that gets the stall reason and the diagnostics
+        :type on_stall: Callable[[str, dict], None]
+        :param thresholds: Seconds without the activity after which the editor is stalled,
+                           by phase. Phases without the threshold or with 0 are not checked
+        :type thresholds: dict[str, float]
+        :param check_interval: Time in seconds between the checks
+        :type check_interval: float
+        :param cpu_time: Callable returning the CPU time of the Unreal process in seconds
+                         or None if it is not known
+        :type cpu_time: Callable[[], Optional[float]]
+        :param clock: Callable returning the current time in seconds
+        :type clock: Callable[[], float]
+        """
+        self._on_stall = on_stall
+        self._thresholds = thresholds
+        self._check_interval = check_interval
+        self._cpu_time = cpu_time
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        now = self._clock()
+        self._phase: Optional[str] = None
+        self._phase_start_time = now
+        self._last_line_time = now
+        self._recent_lines: deque[str] = deque(maxlen=self.RECENT_LINES_COUNT)
+        self._last_progress: Optional[float] = None
+        self._last_progress_time = now
+        self._last_cpu_time: Optional[float] = None
+        self._last_cpu_activity_time = now
+
+    @property
+    def phase(self) -> Optional[str]:
+        return self._phase
+
+    def start(self) -> None:
+        """
+        Start the background thread checking for the stall
+        """
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="UnrealStallWatchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background thread
+        """
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self._check_interval + 1)
+        self._thread = None
+
+    def set_phase(self, phase: Optional[str]) -> None:
+        """
+        Set the current phase, None stops the checks until the next phase
+
+        :param phase: STARTUP, ASSET_LOADING, RENDERING or None
+        :type phase: Optional[str]
+        """
+        with self._lock:
+            self._phase = phase
+            self._phase_start_time = self._clock()
+            self._last_progress = None
+
+    def observe_line(self, line: str) -> None:
+        """
+        :param line: Line of the Unreal output
+        :type line: str
+        """
+        self._last_line_time = self._clock()
+        self._recent_lines.append(line)
+
+    def observe_progress(self, progress: float) -> None:
+        """
+        Record the progress change. The first progress of the task ends the asset loading.
+
+        :param progress: Task progress
+        :type progress: float
+        """
+        with self._lock:
+            if progress == self._last_progress:
+                return
+            now = self._clock()
+            self._last_progress = progress
+            self._last_progress_time = now
+            if self._phase == self.ASSET_LOADING:
+                self._phase = self.RENDERING
+                self._phase_start_time = now
+
+    def check(self) -> Optional[str]:
+        """
+        Check the activity against the threshold of the current phase
+
+        :return: Reason of the stall or None if the editor is not stalled
+        :rtype: Optional[str]
+        """
+        cpu_time = self._cpu_time()
+        now = self._clock()
+        with self._lock:
+            if cpu_time is not None and (
+                self._last_cpu_time is None
+                or cpu_time - self._last_cpu_time >= self.CPU_ACTIVITY_SECONDS
+            ):
+                self._last_cpu_time = cpu_time
+                self._last_cpu_activity_time = now
+
+            threshold = self._thresholds.get(self._phase) if self._phase else None
+            if not threshold:
+                return None
+
+            if self._phase == self.RENDERING:
+                activity = "progress"
+                last_activity_time = self._last_progress_time
+            else:
+                activity = "output or CPU activity"
+                last_activity_time = max(self._last_line_time, self._last_cpu_activity_time)
+
+            idle_time = now - max(last_activity_time, self._phase_start_time)
+            if idle_time < threshold:
+                return None
+
+            return (
+                f"no {activity} for {idle_time:.0f} seconds during the {self._phase} phase "
+                f"(threshold is {threshold} seconds)"
+            )
+
+    def diagnostics(self) -> dict:
+        """
+        :return: State of the watchdog and the last Unreal output lines
+        :rtype: dict
+        """
+        now = self._clock()
+        with self._lock:
+            return {
+                "phase": self._phase,
+                "seconds_in_phase": now - self._phase_start_time,
+                "seconds_since_last_line": now - self._last_line_time,
+                "seconds_since_last_progress": now - self._last_progress_time,
+                "seconds_since_last_cpu_activity": now - self._last_cpu_activity_time,
+                "last_progress": self._last_progress,
+                "cpu_time": self._last_cpu_time,
+                "recent_lines": list(self._recent_lines),
+            }
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._check_interval):
+            reason = self.check()
+            if reason is not None:
+                self._on_stall(reason, self.diagnostics())
+                return
@@ -0,0 +1,128 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+import os
+import sys
+import queue
+import threading
+from http import HTTPStatus
+from typing import Any, Callable, Optional
+
+
+class ActionPoller:
+    """
+    Requests the next action from the adaptor on the background thread, so the game thread
+    is never blocked by the IPC requests, and hands the received actions to the game thread
+    through the thread-safe queue.
+
+    One action is requested at a time: after the action is received, the poller pauses
+    until the game thread performed it and called resume, then polls again immediately.
+    When the adaptor has no action, the poller waits for the poll interval before the next
+    request. The adaptor server answers the request only when it has an action, so while
+    the client waits for the result of the step handler, one request stays open until
+    the close or the action of the next task is queued.
+    """
+
+    #: Environment variable with the poll interval in seconds, set by the adaptor
+    POLL_INTERVAL_ENV = "UNREAL_CLIENT_POLL_INTERVAL"
+
+    #: Default time in seconds between the requests when the adaptor has no action
+    DEFAULT_POLL_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        request_next_action: Callable[[], tuple[int, str, Any]],
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        """
+        :param request_next_action: Callable requesting the next action from the adaptor,
+            returns the status code, the status reason and the action or None
+        :type request_next_action: Callable[[], tuple[int, str, Any]]
+        :param poll_interval: Time in seconds between the requests when there is no action
+        :type poll_interval: float
+        """
+        self._request_next_action = request_next_action
+        self.poll_interval = poll_interval
+
+        self._actions: queue.Queue = queue.Queue()
+        # Set when the poller may request the next action
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def get_poll_interval(cls) -> float:
+        """
+        :return: Poll interval from the environment or the default one if it is not valid
+        :rtype: float
+        """
+        try:
+            poll_interval = float(os.environ.get(cls.POLL_INTERVAL_ENV, ""))
+        except (TypeError, ValueError):
+            return cls.DEFAULT_POLL_INTERVAL
+        return poll_interval if poll_interval > 0 else cls.DEFAULT_POLL_INTERVAL
+
+    def start(self) -> None:
+        """
+        Start the polling thread
+        """
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="UnrealClientPoller", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the polling thread, the request in progress is finished
+
+        :param timeout: Maximum time in seconds to wait for the thread
+        :type timeout: Optional[float]
+        """
+        self._stop_event.set()
+        self._resume_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def resume(self) -> None:
+        """
+        Request the next action immediately
+        """
+        self._resume_event.set()
+
+    def get_action(self) -> Any:
+        """
+        :return: Received action or None if there is no action ready, never blocks
+        :rtype: Any
+        """
+        try:
+            return self._actions.get_nowait()
+        except queue.Empty:
+            return None
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self._resume_event.wait()
+            if self._stop_event.is_set():
+                break
+
+            try:
+                status, reason, action = self._request_next_action()
+            except Exception as e:
+                status, reason, action = None, str(e), None
+
+            if status == HTTPStatus.OK and action is not None:
+                # The game thread resumes the polling after it performed the action
+                self._resume_event.clear()
+                self._actions.put(action)
+                continue
+
+            if status != HTTPStatus.OK:
+                print(
+                    f"ERROR: An error was raised when trying to connect to the server: {status} "
+                    f"{reason}",
+                    file=sys.stderr,
+                    flush=True,
+                )
+            self._stop_event.wait(self.poll_interval)
@@ -0,0 +1,88 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+from deadline.unreal_logger import get_logger
+
+
+logger = get_logger()
+
+
+class ClientEventSender:
+    """
+    Sends the structured step handler events (progress, complete, error) to the adaptor
+    from the background thread, so the game thread is never blocked by the IPC requests.
+
+    Events are sent in the order they were added. Progress event that is not sent yet is
+    replaced by the newer one, so slow IPC never delays the complete and error events.
+    """
+
+    PROGRESS_EVENT_TYPE = "progress"
+
+    def __init__(self, send_request: Callable[[dict], None]) -> None:
+        """
+        :param send_request: Callable that sends the single event to the adaptor
+        :type send_request: Callable[[dict], None]
+        """
+        self._send_request = send_request
+        self._events: deque = deque()
+        self._sending = False
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def send(self, event: dict) -> None:
+        """
+        Add the event to the sending queue and return immediately
+
+        :param event: Event dictionary with the "type" key
+        :type event: dict
+        """
+        with self._condition:
+            if (
+                event.get("type") == self.PROGRESS_EVENT_TYPE
+                and self._events
+                and self._events[-1].get("type") == self.PROGRESS_EVENT_TYPE
+            ):
+                self._events[-1] = event
+            else:
+                self._events.append(event)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="UnrealClientEventSender", daemon=True
+                )
+                self._thread.start()
+
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all the added events are sent
+
+        :param timeout: Maximum time in seconds to wait, wait forever if None
+        :type timeout: Optional[float]
+        :return: True if all the events are sent, False on timeout
+        :rtype: bool
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._events and not self._sending, timeout=timeout
+            )
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: len(self._events) > 0)
+                event = self._events.popleft()
+                self._sending = True
+
+            try:
+                self._send_request(event)
+            except Exception as e:
+                logger.warning(f"Failed to send the {event.get('type')} event to the adaptor: {e}")
+            finally:
+                with self._condition:
+                    self._sending = False
+                    self._condition.notify_all()
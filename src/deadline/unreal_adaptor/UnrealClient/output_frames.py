@@ -0,0 +1,170 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import re
+from typing import Iterable, Optional
+
+
+class OutputFrameScanner:
+    """
+    Finds the frames already rendered to the output directory of the Movie Render Queue job.
+
+    The output path format is the output directory joined with the file name format
+    of the MoviePipelineOutputSetting, e.g. "C:/Render/{sequence_name}/{sequence_name}.{frame_number}".
+    The known format arguments are substituted, the frame number is captured and the other
+    tokens, e.g. {render_pass}, match any file name part. The frame is rendered if it has
+    at least one valid file and no invalid ones: the file is valid if it is not empty
+    and starts with the header of its image format.
+    """
+
+    #: Format token of the frame number in the display rate of the level sequence
+    FRAME_NUMBER_TOKEN = "frame_number"
+
+    #: Headers of the image formats by the file extension. Files of the other formats
+    #: are only checked for the non-zero size
+    FRAME_HEADERS = {
+        ".exr": b"\x76\x2f\x31\x01",
+        ".png": b"\x89PNG\r\n\x1a\n",
+        ".jpg": b"\xff\xd8\xff",
+        ".jpeg": b"\xff\xd8\xff",
+        ".bmp": b"BM",
+    }
+
+    _TOKEN_RE = re.compile(r"\{([A-Za-z0-9_]+)\}")
+
+    def __init__(self, output_path_format: str, format_args: Optional[dict[str, str]] = None):
+        """
+        :param output_path_format: Format of the output file path without the extension
+        :type output_path_format: str
+        :param format_args: Values of the known format tokens, e.g. {"job_name": "Shot010"}
+        :type format_args: Optional[dict[str, str]]
+        """
+        self.output_path_format = output_path_format.replace("\\", "/")
+        self.format_args = format_args or {}
+        self.pattern = self._build_pattern()
+
+    def _build_pattern(self) -> Optional[re.Pattern]:
+        """
+        :return: Pattern of the output file path with the "frame" group or None
+            if the format has no frame number token
+        """
+        if "{" + self.FRAME_NUMBER_TOKEN + "}" not in self.output_path_format:
+            return None
+
+        pattern_parts = []
+        frame_captured = False
+        position = 0
+        for match in self._TOKEN_RE.finditer(self.output_path_format):
+            pattern_parts.append(re.escape(self.output_path_format[position : match.start()]))
+            token = match.group(1)
+            if token == self.FRAME_NUMBER_TOKEN:
+                pattern_parts.append("(?P=frame)" if frame_captured else r"(?P<frame>-?\d+)")
+                frame_captured = True
+            elif token in self.format_args:
+                pattern_parts.append(re.escape(self.format_args[token].replace("\\", "/")))
+            else:
+                pattern_parts.append(r"[^/]*")
+            position = match.end()
+        pattern_parts.append(re.escape(self.output_path_format[position:]))
+        # Movie Render Queue adds the extension to the file name format
+        pattern_parts.append(r"\.[^/.]+")
+
+        return re.compile("".join(pattern_parts), re.IGNORECASE if os.name == "nt" else 0)
+
+    def get_root_directory(self) -> str:
+        """
+        :return: The deepest directory of the output path without the unknown tokens
+        :rtype: str
+        """
+        root = self.output_path_format
+        for match in self._TOKEN_RE.finditer(self.output_path_format):
+            if match.group(1) not in self.format_args:
+                root = self.output_path_format[: match.start()]
+                break
+        for token, value in self.format_args.items():
+            root = root.replace("{" + token + "}", value.replace("\\", "/"))
+        return os.path.dirname(root)
+
+    @classmethod
+    def is_valid_frame_file(cls, path: str) -> bool:
+        """
+        :param path: Path of the frame file
+        :type path: str
+
+        :return: True if the file is not empty and starts with the header of its image format
+        :rtype: bool
+        """
+        header = cls.FRAME_HEADERS.get(os.path.splitext(path)[1].lower(), b"")
+        try:
+            with open(path, "rb") as f:
+                data = f.read(max(len(header), 1))
+        except OSError:
+            return False
+        return len(data) > 0 and data.startswith(header)
+
+    def scan(self) -> set[int]:
+        """
+        :return: Numbers of the frames rendered to the output directory
+        :rtype: set[int]
+        """
+        if self.pattern is None:
+            return set()
+
+        valid_frames = set()
+        invalid_frames = set()
+        for root, _, names in os.walk(self.get_root_directory()):
+            for name in names:
+                path = os.path.join(root, name).replace("\\", "/")
+                match = self.pattern.fullmatch(path)
+                if match is None:
+                    continue
+                frame = int(match.group("frame"))
+                if self.is_valid_frame_file(path):
+                    valid_frames.add(frame)
+                else:
+                    invalid_frames.add(frame)
+        return valid_frames - invalid_frames
+
+    @staticmethod
+    def get_missing_frames(start_frame: int, end_frame: int, frames: Iterable[int]) -> list[int]:
+        """
+        :param start_frame: First frame of the range
+        :type start_frame: int
+        :param end_frame: Frame after the last frame of the range
+        :type end_frame: int
+        :param frames: Numbers of the rendered frames
+        :type frames: Iterable[int]
+
+        :return: Numbers of the frames of the range that are not rendered
+        :rtype: list[int]
+        """
+        frames = set(frames)
+        return [frame for frame in range(start_frame, end_frame) if frame not in frames]
+
+    @staticmethod
+    def get_frame_ranges(
+        frames: Iterable[int], max_ranges: Optional[int] = None
+    ) -> list[tuple[int, int]]:
+        """
+        :param frames: Frame numbers, e.g. the frames that are not rendered
+        :type frames: Iterable[int]
+        :param max_ranges: Maximum number of the ranges, the ranges with the shortest
+            separations are merged until there are no more of them
+        :type max_ranges: Optional[int]
+
+        :return: Ordered contiguous [start, end) ranges of the frames
+        :rtype: list[tuple[int, int]]
+        """
+        ranges: list[tuple[int, int]] = []
+        for frame in sorted(set(frames)):
+            if ranges and ranges[-1][1] == frame:
+                ranges[-1] = (ranges[-1][0], frame + 1)
+            else:
+                ranges.append((frame, frame + 1))
+
+        while max_ranges is not None and len(ranges) > max(max_ranges, 1):
+            index = min(range(len(ranges) - 1), key=lambda i: ranges[i + 1][0] - ranges[i][1])
+            ranges[index : index + 2] = [(ranges[index][0], ranges[index + 1][1])]
+        return ranges
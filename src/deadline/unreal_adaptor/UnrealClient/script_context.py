@@ -0,0 +1,186 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import time
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Hashable, Iterator, Optional
+
+
+class ScriptContext:
+    """
+    Context of the custom scripts that lives for the whole session, so the tasks
+    of the custom step can reuse the assets and the values prepared by the previous tasks.
+
+    The script gets the context if its main() has the "context" parameter, e.g.
+    ``def main(context, level_path): level = context.load_asset(level_path)``.
+    The cache keeps the MAX_ENTRIES most recently used values, the loaded assets
+    are checked to be still valid before they are reused.
+    """
+
+    #: Default number of the values kept in the cache
+    MAX_ENTRIES = 128
+
+    def __init__(
+        self,
+        report_progress: Optional[Callable[[float], None]] = None,
+        max_entries: int = MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param report_progress: Callable reporting the task progress in percents to the adaptor
+        :type report_progress: Optional[Callable[[float], None]]
+        :param max_entries: Number of the most recently used values kept in the cache
+        :type max_entries: int
+        :param clock: Callable returning the current time in seconds
+        :type clock: Callable[[], float]
+        """
+        self.max_entries = max_entries
+        self._report_progress = report_progress
+        self._clock = clock
+
+        self._lock = threading.RLock()
+        self._cache: OrderedDict[Hashable, Any] = OrderedDict()
+        # Number of the measurements and total time in seconds by the timer name
+        self._timings: dict[str, tuple[int, float]] = {}
+
+        #: Number of the tasks run with this context, including the current one
+        self.tasks_count = 0
+        #: Number of the cache lookups that found the value
+        self.hits = 0
+        #: Number of the cache lookups that didn't find the value
+        self.misses = 0
+
+    def start_task(self) -> None:
+        """
+        Count the new task of the session
+        """
+        self.tasks_count += 1
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        :param key: Key of the value
+        :type key: Hashable
+        :param default: Value returned if the key is not in the cache
+        :type default: Any
+
+        :return: Cached value or the default
+        :rtype: Any
+        """
+        with self._lock:
+            if key not in self._cache:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Cache the value, the least recently used values over max_entries are evicted
+
+        :param key: Key of the value
+        :type key: Hashable
+        :param value: Value to cache
+        :type value: Any
+        """
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def get_or_create(
+        self,
+        key: Hashable,
+        factory: Callable[[], Any],
+        is_valid: Callable[[Any], bool] = lambda value: True,
+    ) -> Any:
+        """
+        :param key: Key of the value
+        :type key: Hashable
+        :param factory: Callable creating the value if it is not cached or not valid
+        :type factory: Callable[[], Any]
+        :param is_valid: Callable checking the cached value can be reused
+        :type is_valid: Callable[[Any], bool]
+
+        :return: Cached or created value
+        :rtype: Any
+        """
+        with self._lock:
+            if key in self._cache and is_valid(self._cache[key]):
+                self.hits += 1
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            self.misses += 1
+            value = factory()
+            self.set(key, value)
+            return value
+
+    def load_asset(self, asset_path: str) -> Any:
+        """
+        Load the asset, e.g. the level, the data table or the blueprint, or get it from the cache
+        if it is loaded by the previous tasks and wasn't garbage collected since then
+
+        :param asset_path: Path of the asset, e.g. "/Game/Maps/Main"
+        :type asset_path: str
+
+        :raises RuntimeError: If the asset can't be loaded
+
+        :return: Loaded unreal.Object
+        :rtype: Any
+        """
+        import unreal
+
+        def _load() -> Any:
+            asset = unreal.EditorAssetLibrary.load_asset(asset_path)
+            if asset is None:
+                raise RuntimeError(f"Can't load the asset {asset_path}")
+            return asset
+
+        return self.get_or_create(
+            ("asset", asset_path), _load, is_valid=unreal.SystemLibrary.is_valid
+        )
+
+    def clear(self) -> None:
+        """
+        Remove all the values from the cache
+        """
+        with self._lock:
+            self._cache.clear()
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """
+        Measure the time of the code block and add it to the timings of the session,
+        e.g. ``with context.timer("load_level"): ...``
+
+        :param name: Name of the measured operation
+        :type name: str
+        """
+        start_time = self._clock()
+        try:
+            yield
+        finally:
+            elapsed = self._clock() - start_time
+            with self._lock:
+                count, total = self._timings.get(name, (0, 0.0))
+                self._timings[name] = (count + 1, total + elapsed)
+
+    def get_timings(self) -> dict[str, tuple[int, float]]:
+        """
+        :return: Number of the measurements and total time in seconds by the timer name
+        :rtype: dict[str, tuple[int, float]]
+        """
+        with self._lock:
+            return dict(self._timings)
+
+    def report_progress(self, progress: float) -> None:
+        """
+        :param progress: Progress of the current task in percents
+        :type progress: float
+        """
+        if self._report_progress is not None:
+            self._report_progress(min(max(float(progress), 0.0), 100.0))
@@ -0,0 +1,109 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import sys
+import hashlib
+import threading
+import importlib.util
+from types import ModuleType
+
+
+class ScriptLoader:
+    """
+    Loads the custom scripts as modules from their file specs and keeps them for the next tasks.
+
+    The module is keyed by the absolute path of the script, so the scripts with the same name
+    in different directories are different modules, and is loaded again only when the size
+    or the modification time of the file changes. The module is registered in sys.modules under
+    the name unique for the path. The script directory is on sys.path only while the module
+    executes, so the sibling modules imported at the top of the script are found,
+    but sys.path doesn't grow with every task.
+    """
+
+    #: Prefix of the names of the script modules in sys.modules
+    MODULE_NAME_PREFIX = "deadline_custom_script"
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # Size, modification time and module of the loaded scripts by the path
+        self._modules: dict[str, tuple[int, int, ModuleType]] = {}
+
+        #: Number of the load calls that returned the module loaded before
+        self.hits = 0
+        #: Number of the modules loaded from the files
+        self.loads = 0
+
+    def load(self, script_path: str) -> ModuleType:
+        """
+        :param script_path: Path of the custom script
+        :type script_path: str
+
+        :raises FileNotFoundError: If the script does not exist or it is not a file
+
+        :return: Module of the script, loaded again if the file changed since the previous call
+        :rtype: ModuleType
+        """
+        path = os.path.normcase(os.path.abspath(script_path))
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stat = None
+        if stat is None or not os.path.isfile(path):
+            raise FileNotFoundError(f"Script {script_path} does not exist or it is not a file")
+
+        with self._lock:
+            cached = self._modules.get(path)
+            if cached is not None and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+                self.hits += 1
+                return cached[2]
+
+            module = self._load_module(path)
+            self._modules[path] = (stat.st_size, stat.st_mtime_ns, module)
+            self.loads += 1
+            return module
+
+    def get_module_name(self, script_path: str) -> str:
+        """
+        :param script_path: Path of the custom script
+        :type script_path: str
+
+        :return: Name of the script module in sys.modules
+        :rtype: str
+        """
+        path = os.path.normcase(os.path.abspath(script_path))
+        path_key = hashlib.sha256(path.encode("utf-8")).hexdigest()[:12]
+        stem = os.path.splitext(os.path.basename(path))[0]
+        return f"{self.MODULE_NAME_PREFIX}_{path_key}_{stem}"
+
+    def clear(self) -> None:
+        """
+        Forget the loaded modules and remove them from sys.modules
+        """
+        with self._lock:
+            for path in self._modules:
+                sys.modules.pop(self.get_module_name(path), None)
+            self._modules.clear()
+
+    def _load_module(self, path: str) -> ModuleType:
+        module_name = self.get_module_name(path)
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Can't load the script {path} as a Python module")
+
+        module = importlib.util.module_from_spec(spec)
+        script_dir = os.path.dirname(path)
+        sys.modules[module_name] = module
+        sys.path.insert(0, script_dir)
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+        finally:
+            try:
+                sys.path.remove(script_dir)
+            except ValueError:
+                pass
+        return module
@@ -1,11 +1,18 @@
 #  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
 import re
-from typing import Optional
+from typing import Callable, Optional
 from abc import abstractmethod, ABC
 
 
 class BaseStepHandler(ABC):
+    #: Callable that sends the structured events to the adaptor, set by the UnrealClient
+    event_sender: Optional[Callable[[dict], None]] = None
+
+    #: Message logged when the handler of the task is set, the adaptor matches the log lines
+    #: that follow it to that task
+    TASK_STARTED_MESSAGE = "Step Handler: Task {task_id} started"
+
     def __init__(self):
         self.action_dict = dict(run_script=self.run_script, wait_result=self.wait_result)
 
@@ -32,6 +39,36 @@ class BaseStepHandler(ABC):
         """
         raise NotImplementedError("Abstract method, need to be implemented")  # pragma: no cover
 
+    @staticmethod
+    def send_event(event_type: str, **kwargs) -> None:
+        """
+        Send the structured event to the adaptor, if the UnrealClient set the event sender.
+        Step handlers still log the same messages, the adaptor parses them if the events
+        can't be sent.
+
+        :param event_type: Type of the event: "progress", "complete" or "error"
+        :param kwargs: Event data, e.g. progress, frame, shot, elapsed for the progress event
+        """
+        if BaseStepHandler.event_sender is not None:
+            BaseStepHandler.event_sender(dict(type=event_type, **kwargs))
+
+    @staticmethod
+    def regex_pattern_task_started() -> re.Pattern:
+        """
+        :return: Pattern of the task started message with the task id group
+        """
+        return re.compile("Step Handler: Task ([0-9]+) started")
+
+    def is_result_ready(self) -> bool:
+        """
+        :return: boolean indicating the result of the run_script is ready.
+
+        The UnrealClient doesn't perform the next action from the adaptor after the wait_result,
+        except for the close, until this method returns True. Step handlers that run the script asynchronously
+        should override it, by default the result is ready when run_script returns.
+        """
+        return True
+
     @staticmethod
     @abstractmethod
     def regex_pattern_progress() -> list[re.Pattern]:
@@ -49,3 +86,13 @@ class BaseStepHandler(ABC):
     def regex_pattern_error() -> list[re.Pattern]:
         """Returns a list of regex Patterns that match the errors messages"""
         raise NotImplementedError("Abstract method, need to be implemented")  # pragma: no cover
+
+    @staticmethod
+    def regex_keywords() -> list[str]:
+        """
+        Returns a list of substrings, one of which is contained by any message matched
+        by the progress, complete and error regex Patterns.
+        Used by the adaptor to skip regex matching of the irrelevant Unreal log lines.
+        Empty list, the default, disables the skipping.
+        """
+        return []
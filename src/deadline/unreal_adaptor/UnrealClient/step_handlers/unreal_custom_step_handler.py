@@ -1,15 +1,14 @@
 #  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
 import re
-import sys
 import inspect
-import importlib
 import traceback
-from pathlib import Path
 from typing import Optional
 from types import ModuleType
 
 from .base_step_handler import BaseStepHandler
+from deadline.unreal_adaptor.UnrealClient.script_loader import ScriptLoader
+from deadline.unreal_adaptor.UnrealClient.script_context import ScriptContext
 from deadline.unreal_logger import get_logger
 
 
@@ -17,17 +16,27 @@ logger = get_logger()
 
 
 class UnrealCustomStepHandler(BaseStepHandler):
+    #: Loads the scripts once per session and again only when they change
+    script_loader = ScriptLoader()
+
+    #: Context passed to the scripts of the session, created by the first script that takes it
+    session_context: Optional[ScriptContext] = None
+
     @staticmethod
     def regex_pattern_progress() -> list[re.Pattern]:
-        return [re.compile(".*Custom Step Executor: Progress: ([0-9.]+)")]
+        return [re.compile("Custom Step Executor: Progress: ([0-9.]+)")]
 
     @staticmethod
     def regex_pattern_complete() -> list[re.Pattern]:
-        return [re.compile(".*Custom Step Executor: Complete")]
+        return [re.compile("Custom Step Executor: Complete")]
 
     @staticmethod
     def regex_pattern_error() -> list[re.Pattern]:
-        return [re.compile(".*Exception:.*|.*Custom Step Executor: Error:.*")]
+        return [re.compile("Exception:.*|Custom Step Executor: Error:.*")]
+
+    @staticmethod
+    def regex_keywords() -> list[str]:
+        return ["Custom Step Executor", "Exception:"]
 
     @staticmethod
     def validate_script(script_path: str) -> ModuleType:
@@ -38,13 +47,7 @@ class UnrealCustomStepHandler(BaseStepHandler):
         :return: If script is valid, returns its as module, None otherwise
         """
 
-        _script_path = Path(script_path)
-
-        if not _script_path.exists() or not _script_path.is_file():
-            raise FileNotFoundError(f"Script {script_path} does not exist or it is not a file")
-
-        sys.path.append(str(_script_path.parent))
-        script_module = importlib.import_module(_script_path.stem)
+        script_module = UnrealCustomStepHandler.script_loader.load(script_path)
 
         has_main_method = False
 
@@ -58,6 +61,50 @@ class UnrealCustomStepHandler(BaseStepHandler):
 
         return script_module
 
+    @staticmethod
+    def report_progress(progress: float) -> None:
+        """
+        Report the progress of the custom script task to the adaptor
+
+        :param progress: Progress of the task in percents
+        """
+        logger.info(f"Custom Step Executor: Progress: {progress}")
+        BaseStepHandler.send_event("progress", progress=progress)
+
+    @staticmethod
+    def get_session_context() -> ScriptContext:
+        """
+        :return: Context of the custom scripts of the session
+        """
+        if UnrealCustomStepHandler.session_context is None:
+            UnrealCustomStepHandler.session_context = ScriptContext(
+                report_progress=UnrealCustomStepHandler.report_progress
+            )
+        return UnrealCustomStepHandler.session_context
+
+    @staticmethod
+    def execute_script(script_module: ModuleType, script_args: dict):
+        """
+        Call the main() of the script with the given arguments. The session context is passed
+        as the "context" argument if the main() has such parameter and the arguments don't.
+
+        :param script_module: Module of the script returned by validate_script
+        :param script_args: Keyword arguments of the main()
+        :return: Result of the main()
+        """
+        context_parameter = inspect.signature(script_module.main).parameters.get("context")
+        if (
+            context_parameter is None
+            or context_parameter.kind
+            in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+            or "context" in script_args
+        ):
+            return script_module.main(**script_args)
+
+        context = UnrealCustomStepHandler.get_session_context()
+        context.start_task()
+        return script_module.main(context=context, **script_args)
+
     def run_script(self, args: dict) -> bool:
         """
         Executing a script using the provided arguments.
@@ -69,15 +116,15 @@ class UnrealCustomStepHandler(BaseStepHandler):
         try:
             script_module = UnrealCustomStepHandler.validate_script(script_path=args["script_path"])
             script_args = args.get("script_args", {})
-            result = script_module.main(**script_args)
+            result = UnrealCustomStepHandler.execute_script(script_module, script_args)
             logger.info(f"Custom Step Executor: Complete: {result}")
+            BaseStepHandler.send_event("complete")
             return True
         except Exception as e:
-            logger.info(
-                f"Custom Step Executor: Error: "
-                f'Error occured while executing the given script {args.get("script_path")}: {str(e)}\n'
-            )
+            message = f'Error occured while executing the given script {args.get("script_path")}: {str(e)}'
+            logger.info(f"Custom Step Executor: Error: {message}\n")
             logger.info(traceback.format_exc())
+            BaseStepHandler.send_event("error", message=message)
             return False
 
     def wait_result(self, args: Optional[dict] = None) -> None:  # pragma: no cover
@@ -89,5 +136,4 @@ class UnrealCustomStepHandler(BaseStepHandler):
         :meth:`deadline.unreal_adaptor.UnrealClient.step_handlers.unreal_custom_step_handler.UnrealCustomStepHandler.run_script()`.
         """
 
-        logger.info("Render wait start")
-        logger.info("Render wait finish")
+        logger.info("Custom step wait start")
@@ -1,6 +1,8 @@
 #  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
+import os
 import re
+import time
 from pathlib import Path
 
 try:
@@ -11,10 +13,11 @@ except Exception:
     )
     unreal = None
 
-from typing import Optional
+from typing import Hashable, Iterable, Optional
 
 from .base_step_handler import BaseStepHandler
 from deadline.unreal_logger import get_logger
+from deadline.unreal_adaptor.UnrealClient.output_frames import OutputFrameScanner
 
 
 logger = get_logger()
@@ -26,6 +29,9 @@ if unreal:
     class RemoteRenderMoviePipelineEditorExecutor(unreal.MoviePipelinePIEExecutor):
         totalFrameRange = unreal.uproperty(int)  # Total frame range of the job's level sequence
         currentFrame = unreal.uproperty(int)  # Current frame handler that will be updating later
+        jobName = unreal.uproperty(str)  # Name of the rendering job, sent with the progress
+        shotNames = unreal.uproperty(str)  # Names of the shots enabled in the job to render
+        startTime = unreal.uproperty(float)  # Time when the execution started, in seconds
 
         def _post_init(self):
             """
@@ -34,6 +40,9 @@ if unreal:
             """
             self.totalFrameRange = 0
             self.currentFrame = 0
+            self.jobName = ""
+            self.shotNames = ""
+            self.startTime = 0.0
 
         @unreal.ufunction(override=True)
         def execute(self, queue: unreal.MoviePipelineQueue):
@@ -47,26 +56,32 @@ if unreal:
             :return: None
             """
 
-            # get the single job from queue
             jobs = queue.get_jobs()
             if len(jobs) == 0:
                 logger.error(f"Render Executor: Error: {queue} has 0 jobs")
 
             job = jobs[0]
+            self.jobName = job.job_name
+            self.shotNames = ", ".join(shot.outer_name for shot in job.shot_info if shot.enabled)
+            self.startTime = time.monotonic()
 
-            # get output settings block
-            output_settings = job.get_configuration().find_or_add_setting_by_class(
-                unreal.MoviePipelineOutputSetting
-            )
-
-            # if user override frame range, use overriden values
-            if output_settings.use_custom_playback_range:
-                self.totalFrameRange = (
-                    output_settings.custom_end_frame - output_settings.custom_start_frame
+            # The resumed job is split to the jobs of the frame ranges that are not rendered,
+            # the progress is computed against the frames of all of them
+            self.totalFrameRange = 0
+            for job in jobs:
+                # get output settings block
+                output_settings = job.get_configuration().find_or_add_setting_by_class(
+                    unreal.MoviePipelineOutputSetting
                 )
 
-            # else use default frame range of the level sequence
-            else:
+                # if user override frame range, use overriden values
+                if output_settings.use_custom_playback_range:
+                    self.totalFrameRange += (
+                        output_settings.custom_end_frame - output_settings.custom_start_frame
+                    )
+                    continue
+
+                # else use default frame range of the level sequence
                 level_sequence = unreal.EditorAssetLibrary.load_asset(
                     unreal.SystemLibrary.conv_soft_object_reference_to_string(
                         unreal.SystemLibrary.conv_soft_obj_path_to_soft_obj_ref(job.sequence)
@@ -78,7 +93,7 @@ if unreal:
                         "exists and is valid"
                     )
 
-                self.totalFrameRange = (
+                self.totalFrameRange += (
                     level_sequence.get_playback_end() - level_sequence.get_playback_start()
                 )
 
@@ -110,31 +125,216 @@ if unreal:
                 # TODO refactor if possible, check shot/job finished callbacks
                 if progress <= 100:
                     logger.info(f"Render Executor: Progress: {progress}")
+                    BaseStepHandler.send_event(
+                        "progress",
+                        progress=progress,
+                        frame=self.currentFrame,
+                        total_frames=self.totalFrameRange,
+                        job=self.jobName,
+                        shot=self.shotNames,
+                        elapsed=time.monotonic() - self.startTime,
+                    )
 
 
 class UnrealRenderStepHandler(BaseStepHandler):
+    #: Indicates that the render executor launched by run_script is not finished yet
+    _render_in_progress: bool = False
+
+    #: Shots of each chunk rendered by the current run_script, as (job name, shot name),
+    #: that are not finished yet. Chunk is the chunk id or the shot name
+    _chunks_remaining_shots: dict[Hashable, set[tuple[str, str]]] = {}
+
+    #: Number of the chunks rendered by the current run_script
+    _chunks_count: int = 0
+
+    #: Key of the queue built in the MoviePipelineQueueSubsystem by the previous run_script
+    #: of the session, the next chunks with the same key reuse the queue
+    _queue_cache_key: Optional[tuple] = None
+
+    #: Enabled state of the shots of every job of the cached queue, as it was built,
+    #: before the shots of the chunk were enabled
+    _queue_cache_shots_enabled: list[list[bool]] = []
+
+    #: Custom playback range of the output settings of the cached queue jobs, as it was built,
+    #: by the job index, for the jobs which range was overridden by the frame range of the task
+    _queue_cache_playback_ranges: dict[int, tuple[bool, int, int]] = {}
+
+    #: Jobs added to the queue by the resume for the frame ranges after the first one,
+    #: deleted before the queue is reused
+    _resume_jobs: list = []
+
+    #: Maximum number of the frame ranges the resumed job is split to, each range is rendered
+    #: by its own job, the closest ranges are merged over it
+    RESUME_MAX_RANGES = 8
+
     @staticmethod
     def regex_pattern_progress() -> list[re.Pattern]:
-        return [re.compile(".*Render Executor: Progress: ([0-9.]+)")]
+        return [re.compile("Render Executor: Progress: ([0-9.]+)")]
 
     @staticmethod
     def regex_pattern_complete() -> list[re.Pattern]:
         return [
-            re.compile(".*Render Executor: Rendering is complete"),
-            re.compile(".* finished ([0-9]+) jobs in .*"),
+            re.compile("Render Executor: Rendering is complete"),
+            re.compile(" finished ([0-9]+) jobs in .*"),
         ]
 
     @staticmethod
     def regex_pattern_error() -> list[re.Pattern]:
-        return [re.compile(".*Exception:.*|.*Render Executor: Error:.*|.*LogPython: Error:.*")]
+        return [re.compile("Exception:.*|Render Executor: Error:.*|LogPython: Error:.*")]
+
+    @staticmethod
+    def regex_keywords() -> list[str]:
+        return ["Render Executor", " finished ", "Exception:", "LogPython: Error:"]
 
     @staticmethod
     def executor_failed_callback(executor, pipeline, is_fatal, error):
+        UnrealRenderStepHandler._render_in_progress = False
         logger.error(f"Render Executor: Error: {error}")
+        BaseStepHandler.send_event("error", message=str(error))
 
     @staticmethod
     def executor_finished_callback(movie_pipeline=None, results=None):
+        UnrealRenderStepHandler._render_in_progress = False
         logger.info("Render Executor: Rendering is complete")
+        BaseStepHandler.send_event("complete")
+
+    @staticmethod
+    def executor_shot_finished_callback(output_data):
+        """
+        Callback of the shot rendered by the executor. Reports the chunks which shots are all finished
+        """
+        for shot_data in output_data.shot_data:
+            UnrealRenderStepHandler.finish_chunks_shot(
+                job_name=output_data.job.job_name, shot_name=shot_data.shot.outer_name
+            )
+
+    @staticmethod
+    def set_chunks(chunks: dict[Hashable, set[tuple[str, str]]]) -> None:
+        """
+        Set the chunks to track the per chunk progress of the render
+
+        :param chunks: Shots of each chunk as (job name, shot name), by the chunk id or shot name
+        """
+        UnrealRenderStepHandler._chunks_remaining_shots = {
+            chunk: set(shots) for chunk, shots in chunks.items() if shots
+        }
+        UnrealRenderStepHandler._chunks_count = len(UnrealRenderStepHandler._chunks_remaining_shots)
+
+    @staticmethod
+    def finish_chunks_shot(job_name: str, shot_name: str) -> None:
+        """
+        Mark the shot of the chunk as rendered. When all the shots of the chunk are rendered,
+        log and send the chunk complete event
+
+        :param job_name: Name of the job the shot belongs to
+        :param shot_name: Name of the rendered shot
+        """
+        chunks_remaining_shots = UnrealRenderStepHandler._chunks_remaining_shots
+        for chunk, shots in list(chunks_remaining_shots.items()):
+            shots.discard((job_name, shot_name))
+            if shots:
+                continue
+
+            del chunks_remaining_shots[chunk]
+            chunks_done = UnrealRenderStepHandler._chunks_count - len(chunks_remaining_shots)
+            logger.info(
+                f"Render Executor: Chunk {chunk} is complete "
+                f"({chunks_done}/{UnrealRenderStepHandler._chunks_count})"
+            )
+            BaseStepHandler.send_event(
+                "chunk_complete",
+                chunk=chunk,
+                chunks_done=chunks_done,
+                chunks_total=UnrealRenderStepHandler._chunks_count,
+            )
+
+    @staticmethod
+    def get_queue_cache_key(args: dict) -> Optional[tuple]:
+        """
+        Get the key of the queue the run_script arguments build. The manifest queue is keyed
+        by the manifest path and modification time, the job arguments queue by the asset paths.
+
+        :param args: run_script arguments
+        :return: Key of the queue or None if the queue can't be cached, e.g. the manifest
+            doesn't exist
+        """
+        if args.get("queue_manifest_path"):
+            queue_manifest_path = args["queue_manifest_path"].replace("\\", "/")
+            try:
+                manifest_mtime = os.stat(queue_manifest_path).st_mtime_ns
+            except OSError:
+                return None
+            return "queue_manifest", queue_manifest_path, manifest_mtime
+        return (
+            "job_args",
+            args.get("level_sequence_path", ""),
+            args.get("level_path", ""),
+            args.get("job_configuration_path", ""),
+        )
+
+    @staticmethod
+    def prepare_queue(movie_pipeline_queue_subsystem, args: dict) -> bool:
+        """
+        Build the unreal.MoviePipelineQueue from the run_script arguments or reuse the queue
+        built by the previous run_script of the session with the same key. The reused queue
+        gets the enabled shots and the playback ranges it was built with, so only the shots
+        and the frames of the chunk are changed.
+
+        :param movie_pipeline_queue_subsystem: The unreal.MoviePipelineQueueSubsystem instance
+        :param args: run_script arguments
+        :return: True if the cached queue was reused
+        """
+        cache_key = UnrealRenderStepHandler.get_queue_cache_key(args)
+        for resume_job in UnrealRenderStepHandler._resume_jobs:
+            movie_pipeline_queue_subsystem.get_queue().delete_job(resume_job)
+        UnrealRenderStepHandler._resume_jobs = []
+        jobs = list(movie_pipeline_queue_subsystem.get_queue().get_jobs())
+        shots_enabled = UnrealRenderStepHandler._queue_cache_shots_enabled
+        if (
+            cache_key is not None
+            and cache_key == UnrealRenderStepHandler._queue_cache_key
+            and [len(job.shot_info) for job in jobs] == [len(shots) for shots in shots_enabled]
+        ):
+            for job, job_shots_enabled in zip(jobs, shots_enabled):
+                # Render executor marks the rendered jobs as consumed
+                if hasattr(job, "set_consumed"):
+                    job.set_consumed(False)
+                for shot, enabled in zip(job.shot_info, job_shots_enabled):
+                    shot.enabled = enabled
+            playback_ranges = UnrealRenderStepHandler._queue_cache_playback_ranges
+            for job_index, (use_custom, start_frame, end_frame) in playback_ranges.items():
+                output_settings = (
+                    jobs[job_index]
+                    .get_configuration()
+                    .find_or_add_setting_by_class(unreal.MoviePipelineOutputSetting)
+                )
+                output_settings.use_custom_playback_range = use_custom
+                output_settings.custom_start_frame = start_frame
+                output_settings.custom_end_frame = end_frame
+            UnrealRenderStepHandler._queue_cache_playback_ranges = {}
+            return True
+
+        UnrealRenderStepHandler._queue_cache_key = None
+        UnrealRenderStepHandler._queue_cache_playback_ranges = {}
+        if args.get("queue_manifest_path"):
+            UnrealRenderStepHandler.create_queue_from_manifest(
+                movie_pipeline_queue_subsystem=movie_pipeline_queue_subsystem,
+                queue_manifest_path=args["queue_manifest_path"],
+            )
+        else:
+            UnrealRenderStepHandler.create_queue_from_job_args(
+                movie_pipeline_queue_subsystem=movie_pipeline_queue_subsystem,
+                level_sequence_path=args.get("level_sequence_path", ""),
+                level_path=args.get("level_path", ""),
+                job_configuration_path=args.get("job_configuration_path", ""),
+            )
+
+        UnrealRenderStepHandler._queue_cache_key = cache_key
+        UnrealRenderStepHandler._queue_cache_shots_enabled = [
+            [shot.enabled for shot in job.shot_info]
+            for job in movie_pipeline_queue_subsystem.get_queue().get_jobs()
+        ]
+        return False
 
     @staticmethod
     def create_queue_from_manifest(movie_pipeline_queue_subsystem, queue_manifest_path: str):
@@ -205,16 +405,243 @@ class UnrealRenderStepHandler(BaseStepHandler):
 
     @staticmethod
     def enable_shots_by_chunk(render_job, task_chunk_size: int, task_chunk_id: int):
+        UnrealRenderStepHandler.enable_shots_by_chunks(
+            render_job, task_chunk_size=task_chunk_size, task_chunk_ids=[task_chunk_id]
+        )
+
+    @staticmethod
+    def enable_shots_by_chunks(
+        render_job, task_chunk_size: int, task_chunk_ids: Iterable[int]
+    ) -> dict[Hashable, list[str]]:
+        """
+        Enable only the shots of the given chunks, so they are rendered in one executor pass
+
+        :param render_job: The unreal.MoviePipelineExecutorJob instance
+        :param task_chunk_size: Number of the enabled shots in the chunk
+        :param task_chunk_ids: Chunk ids to enable the shots of
+        :return: Names of the enabled shots by chunk id
+        """
         all_shots_to_render = [shot for shot in render_job.shot_info if shot.enabled]
-        shots_chunk = all_shots_to_render[
-            task_chunk_id * task_chunk_size : (task_chunk_id + 1) * task_chunk_size
-        ]
+        chunks = {
+            task_chunk_id: all_shots_to_render[
+                task_chunk_id * task_chunk_size : (task_chunk_id + 1) * task_chunk_size
+            ]
+            for task_chunk_id in task_chunk_ids
+        }
+        shots_chunks = [shot for shots_chunk in chunks.values() for shot in shots_chunk]
         for shot in render_job.shot_info:
-            if shot in shots_chunk:
+            if shot in shots_chunks:
                 shot.enabled = True
             else:
                 shot.enabled = False
-        logger.info(f"Shots in task: {[shot.outer_name for shot in shots_chunk]}")
+        logger.info(f"Shots in task: {[shot.outer_name for shot in shots_chunks]}")
+        return {
+            task_chunk_id: [shot.outer_name for shot in shots_chunk]
+            for task_chunk_id, shots_chunk in chunks.items()
+        }
+
+    @staticmethod
+    def enable_shots_by_names(render_job, shot_names: Iterable[str]) -> dict[Hashable, list[str]]:
+        """
+        Enable only the shots with the given names, so they are rendered in one executor pass
+
+        :param render_job: The unreal.MoviePipelineExecutorJob instance
+        :param shot_names: Names (outer_name) of the shots to enable
+        :return: Names of the enabled shots by shot name
+        """
+        shot_names = set(shot_names)
+        shots_chunks = [
+            shot for shot in render_job.shot_info if shot.enabled and shot.outer_name in shot_names
+        ]
+        for shot in render_job.shot_info:
+            shot.enabled = shot in shots_chunks
+        logger.info(f"Shots in task: {[shot.outer_name for shot in shots_chunks]}")
+        return {shot.outer_name: [shot.outer_name] for shot in shots_chunks}
+
+    @staticmethod
+    def set_frame_range(job_index: int, render_job, start_frame: int, end_frame: int) -> None:
+        """
+        Override the playback range of the job with the [start_frame, end_frame) frames,
+        so the enabled shots are rendered only within them and the render progress
+        is computed against them
+
+        :param job_index: Index of the job in the queue
+        :param render_job: The unreal.MoviePipelineExecutorJob instance
+        :param start_frame: First frame to render, in the display rate of the level sequence
+        :param end_frame: Frame after the last frame to render
+        """
+        output_settings = render_job.get_configuration().find_or_add_setting_by_class(
+            unreal.MoviePipelineOutputSetting
+        )
+        UnrealRenderStepHandler._queue_cache_playback_ranges.setdefault(
+            job_index,
+            (
+                output_settings.use_custom_playback_range,
+                output_settings.custom_start_frame,
+                output_settings.custom_end_frame,
+            ),
+        )
+        output_settings.use_custom_playback_range = True
+        output_settings.custom_start_frame = start_frame
+        output_settings.custom_end_frame = end_frame
+        logger.info(f"Frames in task: [{start_frame}, {end_frame})")
+
+    @staticmethod
+    def get_shot_frame_ranges(level_sequence) -> dict[str, tuple[int, int]]:
+        """
+        Get the frame ranges of the shots of the level sequence
+
+        :param level_sequence: The unreal.LevelSequence instance
+        :return: Start and end (exclusive) frames in the display rate of the level sequence
+            by the shot name
+        """
+        # Track lookup was renamed from the master tracks to the tracks in Unreal Engine 5.2
+        find_tracks = getattr(level_sequence, "find_tracks_by_type", None) or getattr(
+            level_sequence, "find_master_tracks_by_type"
+        )
+        shot_frame_ranges = {}
+        for track in find_tracks(unreal.MovieSceneCinematicShotTrack):
+            for section in track.get_sections():
+                if section.is_active():
+                    shot_frame_ranges[section.get_shot_display_name()] = (
+                        section.get_start_frame(),
+                        section.get_end_frame(),
+                    )
+        return shot_frame_ranges
+
+    @staticmethod
+    def get_output_frame_scanner(render_job, level_sequence, output_settings) -> OutputFrameScanner:
+        """
+        Get the scanner of the frames rendered to the output directory of the job
+
+        :param render_job: The unreal.MoviePipelineExecutorJob instance
+        :param level_sequence: The unreal.LevelSequence instance of the job
+        :param output_settings: The unreal.MoviePipelineOutputSetting instance of the job
+        :return: OutputFrameScanner of the job output path
+        """
+        level_path = unreal.SystemLibrary.conv_soft_object_reference_to_string(
+            unreal.SystemLibrary.conv_soft_obj_path_to_soft_obj_ref(render_job.map)
+        )
+        return OutputFrameScanner(
+            output_path_format=f"{output_settings.output_directory.path}/"
+            f"{output_settings.file_name_format}",
+            format_args={
+                "project_dir": os.path.abspath(unreal.Paths.project_dir()),
+                "job_name": render_job.job_name,
+                "sequence_name": level_sequence.get_name(),
+                "level_name": level_path.rsplit("/", 1)[-1].split(".")[0],
+            },
+        )
+
+    @staticmethod
+    def resume_from_existing_frames(pipeline_queue, job_index: int, render_job) -> bool:
+        """
+        Disable the enabled shots of the job which frames are all rendered to the output
+        directory and render only the frames that are not rendered: the playback range
+        of the job is narrowed to the first range of the missing frames, every next range
+        is rendered by the duplicate of the job with the shots of that range
+
+        :param pipeline_queue: The unreal.MoviePipelineQueue instance of the job
+        :param job_index: Index of the job in the queue
+        :param render_job: The unreal.MoviePipelineExecutorJob instance
+        :return: True if the job has the frames to render
+        """
+        output_settings = render_job.get_configuration().find_or_add_setting_by_class(
+            unreal.MoviePipelineOutputSetting
+        )
+        if output_settings.use_custom_frame_rate:
+            logger.info(f"Resume is skipped for {render_job.job_name}: custom frame rate is used")
+            return True
+
+        level_sequence = unreal.EditorAssetLibrary.load_asset(
+            unreal.SystemLibrary.conv_soft_object_reference_to_string(
+                unreal.SystemLibrary.conv_soft_obj_path_to_soft_obj_ref(render_job.sequence)
+            )
+        )
+        if level_sequence is None:
+            return True
+
+        scanner = UnrealRenderStepHandler.get_output_frame_scanner(
+            render_job, level_sequence, output_settings
+        )
+        if scanner.pattern is None:
+            logger.info(
+                f"Resume is skipped for {render_job.job_name}: "
+                f"output file name format has no {{{OutputFrameScanner.FRAME_NUMBER_TOKEN}}}"
+            )
+            return True
+        rendered_frames = {frame - output_settings.frame_number_offset for frame in scanner.scan()}
+
+        if output_settings.use_custom_playback_range:
+            playback_range = (output_settings.custom_start_frame, output_settings.custom_end_frame)
+        else:
+            playback_range = (
+                level_sequence.get_playback_start(),
+                level_sequence.get_playback_end(),
+            )
+        shot_frame_ranges = UnrealRenderStepHandler.get_shot_frame_ranges(level_sequence)
+
+        frames_count = 0
+        missing_frames: list[int] = []
+        # Frame ranges of the shots that have the frames to render, by the shot name
+        shots_to_render: dict[str, tuple[int, int]] = {}
+        for shot in render_job.shot_info:
+            if not shot.enabled:
+                continue
+            # The sequence without the shot track is rendered as a single shot
+            start_frame, end_frame = shot_frame_ranges.get(shot.outer_name, playback_range)
+            start_frame = max(start_frame, playback_range[0])
+            end_frame = min(end_frame, playback_range[1])
+            shot_missing_frames = OutputFrameScanner.get_missing_frames(
+                start_frame, end_frame, rendered_frames
+            )
+            frames_count += max(end_frame - start_frame, 0)
+            if shot_missing_frames:
+                missing_frames.extend(shot_missing_frames)
+                shots_to_render[shot.outer_name] = (start_frame, end_frame)
+            else:
+                shot.enabled = False
+                logger.info(f"Shot {shot.outer_name} is already rendered, skipped")
+
+        logger.info(
+            f"Resume {render_job.job_name}: {frames_count - len(missing_frames)} of "
+            f"{frames_count} frames are already rendered to {scanner.get_root_directory()}"
+        )
+        if not missing_frames:
+            return False
+
+        resume_ranges = OutputFrameScanner.get_frame_ranges(
+            missing_frames, max_ranges=UnrealRenderStepHandler.RESUME_MAX_RANGES
+        )
+        if resume_ranges == [playback_range]:
+            return True
+
+        for range_index, (start_frame, end_frame) in enumerate(resume_ranges):
+            if range_index == 0:
+                range_job = render_job
+            else:
+                range_job = pipeline_queue.duplicate_job(render_job)
+                UnrealRenderStepHandler._resume_jobs.append(range_job)
+            for shot in range_job.shot_info:
+                shot_range = shots_to_render.get(shot.outer_name)
+                shot.enabled = (
+                    shot_range is not None
+                    and shot_range[0] < end_frame
+                    and start_frame < shot_range[1]
+                )
+            if range_index == 0:
+                UnrealRenderStepHandler.set_frame_range(
+                    job_index, range_job, start_frame, end_frame
+                )
+            else:
+                range_output_settings = range_job.get_configuration().find_or_add_setting_by_class(
+                    unreal.MoviePipelineOutputSetting
+                )
+                range_output_settings.use_custom_playback_range = True
+                range_output_settings.custom_start_frame = start_frame
+                range_output_settings.custom_end_frame = end_frame
+                logger.info(f"Frames in task: [{start_frame}, {end_frame})")
+        return True
 
     def run_script(self, args: dict) -> bool:
         """
@@ -229,32 +656,73 @@ class UnrealRenderStepHandler(BaseStepHandler):
         )
 
         asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+        wait_start_time = time.monotonic()
         asset_registry.wait_for_completion()
+        wait_duration = time.monotonic() - wait_start_time
+        logger.info(f"Asset registry wait for completion took {wait_duration:.3f} seconds")
+        BaseStepHandler.send_event("timing", phase="asset_registry_wait", duration=wait_duration)
 
         subsystem = unreal.get_editor_subsystem(unreal.MoviePipelineQueueSubsystem)
 
-        if args.get("queue_manifest_path"):
-            UnrealRenderStepHandler.create_queue_from_manifest(
-                movie_pipeline_queue_subsystem=subsystem,
-                queue_manifest_path=args["queue_manifest_path"],
-            )
-        else:
-            UnrealRenderStepHandler.create_queue_from_job_args(
-                movie_pipeline_queue_subsystem=subsystem,
-                level_sequence_path=args.get("level_sequence_path", ""),
-                level_path=args.get("level_path", ""),
-                job_configuration_path=args.get("job_configuration_path", ""),
-            )
+        queue_setup_start_time = time.monotonic()
+        queue_reused = UnrealRenderStepHandler.prepare_queue(subsystem, args)
+
+        chunk_ids: Optional[list[int]] = args.get("chunk_ids")
+        if chunk_ids is None and "chunk_id" in args:
+            chunk_ids = [args["chunk_id"]]
 
-        if "chunk_size" in args and "chunk_id" in args:
-            chunk_size: int = args["chunk_size"]
-            chunk_id: int = args["chunk_id"]
-            for job in subsystem.get_queue().get_jobs():
-                UnrealRenderStepHandler.enable_shots_by_chunk(
+        shot_names: Optional[list[str]] = args.get("shot_names")
+        if shot_names is None and "shot_chunks" in args and chunk_ids is not None:
+            # Chunks balanced by frames: the shot names of every chunk and the chunk of the task
+            shot_names = [name for chunk_id in chunk_ids for name in args["shot_chunks"][chunk_id]]
+
+        chunks: dict[Hashable, set[tuple[str, str]]] = {}
+        for job in subsystem.get_queue().get_jobs():
+            if "chunk_size" in args and chunk_ids is not None:
+                job_chunks = UnrealRenderStepHandler.enable_shots_by_chunks(
                     render_job=job,
-                    task_chunk_size=chunk_size,
-                    task_chunk_id=chunk_id,
+                    task_chunk_size=args["chunk_size"],
+                    task_chunk_ids=chunk_ids,
+                )
+            elif shot_names:
+                job_chunks = UnrealRenderStepHandler.enable_shots_by_names(
+                    render_job=job, shot_names=shot_names
+                )
+            else:
+                continue
+
+            for chunk, chunk_shot_names in job_chunks.items():
+                chunks.setdefault(chunk, set()).update(
+                    (job.job_name, shot_name) for shot_name in chunk_shot_names
                 )
+        UnrealRenderStepHandler.set_chunks(chunks)
+
+        if args.get("frame_range"):
+            start_frame, end_frame = args["frame_range"]
+            for job_index, job in enumerate(subsystem.get_queue().get_jobs()):
+                if any(shot.enabled for shot in job.shot_info):
+                    UnrealRenderStepHandler.set_frame_range(job_index, job, start_frame, end_frame)
+
+        if args.get("resume"):
+            pipeline_queue = subsystem.get_queue()
+            jobs_to_render = [
+                UnrealRenderStepHandler.resume_from_existing_frames(pipeline_queue, job_index, job)
+                for job_index, job in enumerate(list(pipeline_queue.get_jobs()))
+                if any(shot.enabled for shot in job.shot_info)
+            ]
+            if not any(jobs_to_render):
+                logger.info("All frames of the task are already rendered")
+                UnrealRenderStepHandler.executor_finished_callback()
+                return True
+
+        queue_setup_duration = time.monotonic() - queue_setup_start_time
+        logger.info(
+            f"Render queue setup took {queue_setup_duration:.3f} seconds "
+            f"({'reused the session queue' if queue_reused else 'built the queue'})"
+        )
+        BaseStepHandler.send_event(
+            "timing", phase="queue_setup", duration=queue_setup_duration, cached=queue_reused
+        )
 
         for job in subsystem.get_queue().get_jobs():
             for shot in job.shot_info:
@@ -272,9 +740,19 @@ class UnrealRenderStepHandler(BaseStepHandler):
         executor.on_executor_finished_delegate.add_callable(
             UnrealRenderStepHandler.executor_finished_callback
         )
+        # Report the chunks of the batched task as soon as their shots are rendered
+        if hasattr(executor, "on_individual_shot_work_finished_delegate"):
+            executor.on_individual_shot_work_finished_delegate.add_callable(
+                UnrealRenderStepHandler.executor_shot_finished_callback
+            )
 
         # Render queue with the given executor
-        subsystem.render_queue_with_executor_instance(executor)
+        UnrealRenderStepHandler._render_in_progress = True
+        try:
+            subsystem.render_queue_with_executor_instance(executor)
+        except Exception:
+            UnrealRenderStepHandler._render_in_progress = False
+            raise
 
         return True
 
@@ -285,6 +763,14 @@ class UnrealRenderStepHandler(BaseStepHandler):
 
         It is responsible for waiting result of the
         :meth:`deadline.unreal_adaptor.UnrealClient.step_handlers.unreal_render_step_handler.UnrealRenderStepHandler.run_script()`.
+        The wait itself happens in the UnrealClient that doesn't perform the next action, except for the close, until
+        :meth:`deadline.unreal_adaptor.UnrealClient.step_handlers.unreal_render_step_handler.UnrealRenderStepHandler.is_result_ready()`
+        returns True.
         """
         logger.info("Render wait start")
-        logger.info("Render wait finish")
+
+    def is_result_ready(self) -> bool:
+        """
+        :return: boolean indicating the render executor launched by run_script is finished.
+        """
+        return not UnrealRenderStepHandler._render_in_progress
@@ -2,6 +2,8 @@
 
 import os
 import sys
+import json
+import time
 from http import HTTPStatus
 
 from typing import Optional
@@ -11,18 +13,18 @@ if "PYTHONPATH" in os.environ:
         if p not in sys.path:
             sys.path.insert(0, p.replace("\\", "/"))
 
-for p in sys.path:
-    print(p)
-
 from deadline.unreal_logger import get_logger  # noqa: E402
 from openjd.adaptor_runtime_client.win_client_interface import WinClientInterface  # noqa: E402
 from deadline.unreal_adaptor.UnrealClient.step_handlers.base_step_handler import (  # noqa: E402
     BaseStepHandler,
 )
 from deadline.unreal_adaptor.UnrealClient.step_handlers import get_step_handler_class  # noqa: E402
+from deadline.unreal_adaptor.UnrealClient.event_sender import ClientEventSender  # noqa: E402
+from deadline.unreal_adaptor.UnrealClient.action_poller import ActionPoller  # noqa: E402
 
 
 logger = get_logger()
+logger.debug(f"Unreal client sys.path: {sys.path}")
 
 
 class UnrealClient(WinClientInterface):
@@ -35,18 +37,140 @@ class UnrealClient(WinClientInterface):
         self.handler: BaseStepHandler
         self.actions.update({"set_handler": self.set_handler, "client_loaded": self.client_loaded})
 
-    def client_loaded(self, *args, **kwargs) -> None:
-        """Log the message that UnrealClient loaded"""
+        # Set by the wait_result action, the client doesn't perform the next action
+        # until the step handler has the result, except for the close
+        self._awaiting_result = False
+        # Action received while the client waits for the result, performed after it
+        self._deferred_action = None
+
+        # Step handlers send the progress, complete and error events through it
+        # in addition to logging them
+        self._event_sender = ClientEventSender(self._send_event_request)
+        BaseStepHandler.event_sender = self._send_task_event
+
+        # Id of the current task from the set_handler action, added to the step handler events
+        self._task_id: Optional[int] = None
+
+        # Requests the actions on the background thread, the game thread only performs them
+        self._action_poller = ActionPoller(
+            lambda: self._request_next_action(), ActionPoller.get_poll_interval()
+        )
+
+        # Assets loaded by client_loaded are referenced for the whole session,
+        # so they stay resident until the first run_script uses them
+        self._preloaded_assets: list = []
+
+    def _send_event_request(self, event: dict) -> None:
+        """
+        Send the structured step handler event to the adaptor
+
+        :param event: Event dictionary with the "type" key
+        """
+        response = self._send_request(
+            "PUT", "/event", query_string_params={"event": json.dumps(event)}
+        )
+        if response.status != HTTPStatus.OK:
+            raise RuntimeError(f"Adaptor responded with {response.status} {response.reason}")
+
+    def _send_task_event(self, event: dict) -> None:
+        """
+        Send the step handler event tagged with the id of the current task, so the adaptor
+        ignores the events of the previous task that arrive late
+
+        :param event: Event dictionary with the "type" key
+        """
+        if self._task_id is not None:
+            event = dict(event, task_id=self._task_id)
+        self._event_sender.send(event)
+
+    def client_loaded(self, args: Optional[dict] = None) -> None:
+        """
+        Preload the level, the level sequence and the job configuration if the adaptor
+        requested it and log the message that UnrealClient loaded
+
+        :param args: Action arguments, {"preload": {"level_path": ..., "level_sequence_path": ...,
+            "job_configuration_path": ...}}
+        """
+        preload = (args or {}).get("preload")
+        if preload:
+            start_time = time.monotonic()
+            try:
+                self.preload(preload)
+            except Exception as e:
+                message = f"Preload failed: {e}"
+                logger.error(message)
+                self._event_sender.send({"type": "error", "message": message})
+            else:
+                self._event_sender.send(
+                    {
+                        "type": "timing",
+                        "phase": "level_preload",
+                        "duration": time.monotonic() - start_time,
+                    }
+                )
+
         logger.info(f"{self.__class__.__name__} loaded")
+        # Let the adaptor know it can rely on the structured events instead of the log
+        self._event_sender.send({"type": "client_loaded"})
+
+    def preload(self, preload: dict) -> None:
+        """
+        Load the level in the editor and the level sequence and the job configuration assets
+        on the game thread, so the PIE startup of the first render reuses them.
+        The asset that fails to load is skipped, run_script will report it.
+
+        :param preload: Unreal paths of the level, the level sequence and the job configuration,
+            empty paths are skipped
+        """
+        import unreal
+
+        level_path = preload.get("level_path")
+        if level_path:
+            # Level is loaded by the package name, without the object name
+            level_package = level_path.split(".")[0]
+            logger.info(f"Preloading level {level_package}")
+            try:
+                level_editor_subsystem = unreal.get_editor_subsystem(unreal.LevelEditorSubsystem)
+                if not level_editor_subsystem.load_level(level_package):
+                    logger.warning(f"Failed to preload level {level_package}")
+            except Exception as e:
+                logger.warning(f"Failed to preload level {level_package}: {e}")
+
+        for key in ["level_sequence_path", "job_configuration_path"]:
+            asset_path = preload.get(key)
+            if not asset_path:
+                continue
+            logger.info(f"Preloading asset {asset_path}")
+            try:
+                asset = unreal.EditorAssetLibrary.load_asset(asset_path)
+            except Exception as e:
+                logger.warning(f"Failed to preload asset {asset_path}: {e}")
+                continue
+            if asset is None:
+                logger.warning(f"Failed to preload asset {asset_path}")
+                continue
+            self._preloaded_assets.append(asset)
 
     def set_handler(self, handler_dict: dict) -> None:
         """Set the current Step Handler"""
 
         handler_class = get_step_handler_class(handler_dict.get("handler", "base"))
+        self._task_id = handler_dict.get("task_id")
+        if self._task_id is not None:
+            logger.info(BaseStepHandler.TASK_STARTED_MESSAGE.format(task_id=self._task_id))
         self.handler = handler_class()
         # This is an abstract method in a base class and isn't callable but the actual handler will implement this as callable.
         # TODO: Properly type hint self.handler
         self.actions.update(self.handler.action_dict)  # type: ignore
+        self.actions["wait_result"] = self.wait_result
+
+    def wait_result(self, args: Optional[dict] = None) -> None:
+        """
+        Park the client until the current Step Handler has the result of the run_script.
+        The adaptor sends this action once per task instead of polling for the result.
+        """
+        self.handler.wait_result(args)
+        self._awaiting_result = True
 
     def close(self, args: Optional[dict] = None) -> None:
         """Close the Unreal Engine"""
@@ -64,25 +188,57 @@ class UnrealClient(WinClientInterface):
 
     def poll(self) -> None:
         """
-        This function will poll the server for the next task. If the server is in between Subtasks
-        (no actions in the queue), a backoff function will be called to add a delay between the
-        requests.
+        Perform the action received by the background poller, if there is one, and let
+        the poller request the next action immediately. Called by the game thread every tick,
+        never waits for the adaptor.
+
+        While the client waits for the result of the Step Handler, only the close action
+        is performed, the other actions wait for the result.
         """
-        status, reason, action = self._request_next_action()
-        if status == HTTPStatus.OK:
-            if action is not None:
-                print(
-                    f"Performing action: {action}",
-                    flush=True,
-                )
-                self._perform_action(action)
-        else:  # Any other status or reason
-            print(
-                f"ERROR: An error was raised when trying to connect to the server: {status} "
-                f"{reason}",
-                file=sys.stderr,
-                flush=True,
-            )
+        if self._awaiting_result:
+            if not self.handler.is_result_ready():
+                self._poll_close()
+                return
+            logger.info(f"{self.handler.__class__.__name__} result is ready")
+            self._awaiting_result = False
+
+        self._action_poller.start()
+        action = self._deferred_action or self._action_poller.get_action()
+        self._deferred_action = None
+        if action is None:
+            return
+
+        print(
+            f"Performing action: {action}",
+            flush=True,
+        )
+        try:
+            self._perform_action(action)
+        finally:
+            if action.name != "close":
+                self._action_poller.resume()
+
+    def _poll_close(self) -> None:
+        """
+        Perform the close action received while the client waits for the result,
+        defer any other action until the result is ready
+        """
+        action = self._action_poller.get_action()
+        if action is None:
+            return
+
+        if action.name != "close":
+            # The poller stays paused until the deferred action is performed
+            self._deferred_action = action
+            return
+
+        logger.info(f"Close requested before {self.handler.__class__.__name__} result is ready")
+        self._awaiting_result = False
+        print(
+            f"Performing action: {action}",
+            flush=True,
+        )
+        self._perform_action(action)
 
 
 def main():
@@ -108,20 +264,15 @@ def main():
         """
         Python implementation of the OnTickThreadExecutor class that runs the
         :meth:`deadline.unreal_adaptor.UnrealClient.unreal_client.UnrealClient.poll()`
+        every tick
         """
 
         client = UnrealClient(socket_path)
-        time_elapsed = unreal.uproperty(float)
-
-        def _post_init(self):
-            self.time_elapsed = 0
 
         @unreal.ufunction(override=True)
         def execute(self, delta_time: float):
-            self.time_elapsed += delta_time
-            if self.time_elapsed >= 1:
-                self.time_elapsed = 0
-                self.client.poll()
+            # Only performs the actions the background thread received, doesn't block the tick
+            self.client.poll()
 
 
 if __name__ == "__main__":  # pragma: no cover
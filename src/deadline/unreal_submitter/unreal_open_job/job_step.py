@@ -1,16 +1,23 @@
 #  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+import json
 import math
+import heapq
 import os
+import re
 import yaml
 import unreal
 from copy import deepcopy
 from dataclasses import dataclass
 from typing import Any, Optional
 
+from deadline.unreal_logger import get_logger
 from deadline.unreal_submitter.settings import DEFAULT_JOB_STEP_TEMPLATE_FILE_PATH
 from deadline.unreal_submitter.unreal_dependency_collector.common import os_abs_from_relative
 
 
+logger = get_logger()
+
+
 class HostRequirements:
     """OpenJob host requirements representation"""
 
@@ -122,6 +129,11 @@ class JobStep:
         queue_manifest_path,
         shots_count,
         task_chunk_size,
+        chunks_per_task=1,
+        shot_frame_ranges=None,
+        max_frames_per_task=0,
+        balance_chunks_by_frames=False,
+        resume_existing_frames=False,
     ):
         """
         Build JobStep, set its name and fill dependencies list
@@ -129,9 +141,25 @@ class JobStep:
         :param step_template: Step default template to use for this step
         :type step_template: dict
         :param step_settings: Deadline Cloud Step Setting object
+        :param chunks_per_task: Number of the shots chunks rendered by one task
+        :type chunks_per_task: int
+        :param shot_frame_ranges: Names, start and end frames of the shots to render
+        :type shot_frame_ranges: Optional[list[tuple[str, int, int]]]
+        :param max_frames_per_task: Number of the frames above which the shot is split
+                                    into the frame ranges rendered by separate tasks, 0 disables
+        :type max_frames_per_task: int
+        :param balance_chunks_by_frames: Whether to pack the shots into the chunks
+                                         with the equal number of frames
+        :type balance_chunks_by_frames: bool
+        :param resume_existing_frames: Whether to skip the frames already rendered
+                                       to the output directory
+        :type resume_existing_frames: bool
         """
         self._job_step = deepcopy(step_template)
 
+        #: Whether the tasks of this Step need Unreal Editor to run
+        self.requires_editor = True
+
         self._set_name(step_settings)
         self._fill_step_dependency_list(step_settings)
         self._fill_host_requirements(host_requirements)
@@ -187,6 +215,81 @@ class JobStep:
             return
         self._job_step["hostRequirements"] = HostRequirements(host_requirements).as_dict()
 
+    def add_step_environment(self, environment: dict):
+        """
+        Add the environment entered before the tasks of this Step run
+
+        :param environment: OpenJob environment
+        :type environment: dict
+        """
+        self._job_step.setdefault("stepEnvironments", []).append(environment)
+
+    def _append_run_data_line(self, line: str):
+        """
+        Append the line to the embedded run data file of this Step
+
+        :param line: Line of the run data to append
+        :type line: str
+        """
+        for embedded_file in self._job_step.get("script", {}).get("embeddedFiles", []):
+            if embedded_file.get("name") == "runData":
+                embedded_file["data"] = embedded_file["data"].rstrip("\n") + f"\n{line}\n"
+
+    def _replace_run_data_line(self, line: str, new_line: str):
+        """
+        Replace the line of the embedded run data file of this Step
+
+        :param line: Line of the run data to replace
+        :type line: str
+        :param new_line: Replacement of the line
+        :type new_line: str
+        :raises Exception: When the run data has no such line, so the replacement would leave
+                           the run data inconsistent with the task parameters
+        """
+        replaced = False
+        for embedded_file in self._job_step.get("script", {}).get("embeddedFiles", []):
+            if embedded_file.get("name") == "runData" and line in embedded_file["data"]:
+                embedded_file["data"] = embedded_file["data"].replace(line, new_line)
+                replaced = True
+        if not replaced:
+            raise Exception(
+                f"Run data of the step {self._job_step['name']} has no line {line.strip()!r}"
+            )
+
+    @staticmethod
+    def _run_data_string(parameter_name: str, indent: int = 0) -> str:
+        """
+        Return the run data value substituted with the raw value of the string task parameter.
+        The value is the YAML literal block scalar, so the quotes, backslashes and leading spaces
+        of the parameter value need no escaping and the parameter keeps the value as is.
+
+        :param parameter_name: Name of the string task parameter
+        :type parameter_name: str
+        :param indent: Indentation of the run data node the value belongs to
+        :type indent: int
+
+        :return: Run data value, e.g. "|2-\n  {{Task.Param.ShotName}}"
+        :rtype: str
+        """
+        return f"|2-\n{' ' * (indent + 2)}{{{{Task.Param.{parameter_name}}}}}"
+
+    def _check_run_data_strings(self, parameter_name: str, values: list[str]):
+        """
+        Check the values of the string task parameter can be substituted to the run data
+
+        :param parameter_name: Name of the string task parameter
+        :type parameter_name: str
+        :param values: Values of the parameter
+        :type values: list[str]
+        :raises Exception: When the value has the line breaks
+        """
+        for value in values:
+            if "\n" in value or "\r" in value:
+                raise Exception(
+                    f"{parameter_name} value {value!r} of the step {self._job_step['name']} "
+                    "can't have the line breaks"
+                )
+
     def get_step_input_files(self) -> list[str]:
         return []
 
@@ -200,6 +303,11 @@ class CustomScriptJobStep(JobStep):
     Represents a OpenJob Step for Custom Script executing
     """
 
+    _INT_RANGE_ITEM = r"-?\d+(\s*-\s*-?\d+(\s*:\s*\d+)?)?"
+
+    #: OpenJob integer range expression: comma separated numbers and ranges with optional step
+    INT_RANGE_RE = re.compile(rf"\s*{_INT_RANGE_ITEM}(\s*,\s*{_INT_RANGE_ITEM})*\s*")
+
     def __init__(
         self,
         step_template,
@@ -208,6 +316,11 @@ class CustomScriptJobStep(JobStep):
         queue_manifest_path,
         shots_count,
         task_chunk_size,
+        chunks_per_task=1,
+        shot_frame_ranges=None,
+        max_frames_per_task=0,
+        balance_chunks_by_frames=False,
+        resume_existing_frames=False,
     ):
         """
         Build JobStep, set its name, fill dependencies list and set script path parameter
@@ -219,9 +332,20 @@ class CustomScriptJobStep(JobStep):
             queue_manifest_path,
             shots_count,
             task_chunk_size,
+            chunks_per_task,
+            shot_frame_ranges,
+            max_frames_per_task,
+            balance_chunks_by_frames,
+            resume_existing_frames,
         )
 
+        self.requires_editor = step_settings.requires_editor
         self._set_script_path_parameter(os_abs_from_relative(step_settings.script.file_path))
+        self._set_task_argument_parameter(
+            step_settings.task_argument_name,
+            step_settings.task_int_range,
+            list(step_settings.task_values),
+        )
 
     def _set_script_path_parameter(self, script_path):
         """
@@ -237,6 +361,51 @@ class CustomScriptJobStep(JobStep):
 
         self._set_step_path_parameter(parameter_name="ScriptPath", path_value=script_path)
 
+    def _set_task_argument_parameter(
+        self, argument_name: str, int_range: str = "", values: Optional[list[str]] = None
+    ):
+        """
+        Add the "TaskArgument" parameter with the given values to the parameter space,
+        one task per value, and forward the value of the task to the main() of the script
+        as the keyword argument. The integer range has priority over the string values.
+
+        :param argument_name: Name of the main() keyword argument, empty disables the parameter
+        :type argument_name: str
+        :param int_range: OpenJob integer range expression, e.g. "1-100" or "1,5,10-20:2"
+        :type int_range: str
+        :param values: String values, e.g. shot names or asset paths
+        :type values: Optional[list[str]]
+        :raises Exception: When the argument name is set without the values,
+                           the integer range is not valid or the value has the line breaks
+        """
+        if not argument_name:
+            return
+
+        if int_range:
+            if not self.INT_RANGE_RE.fullmatch(int_range):
+                raise Exception(
+                    f'Task integer range "{int_range}" of the step {self._job_step["name"]} '
+                    'is not valid, expected the range expression like "1-100" or "1,5,10-20:2"'
+                )
+            parameter_definition: dict[str, Any] = {
+                "name": "TaskArgument",
+                "type": "INT",
+                "range": int_range,
+            }
+            run_data_value = "{{Task.Param.TaskArgument}}"
+        elif values:
+            self._check_run_data_strings("TaskArgument", values)
+            parameter_definition = {"name": "TaskArgument", "type": "STRING", "range": values}
+            run_data_value = self._run_data_string("TaskArgument", indent=2)
+        else:
+            raise Exception(
+                f'Task argument "{argument_name}" of the step {self._job_step["name"]} '
+                "has no integer range or values"
+            )
+
+        self._job_step["parameterSpace"]["taskParameterDefinitions"].append(parameter_definition)
+        self._append_run_data_line(f"script_args:\n  {json.dumps(argument_name)}: {run_data_value}")
+
     def get_step_input_files(self) -> list[str]:
         """
         Return the script paths from ScriptPath range attribute
@@ -274,6 +443,11 @@ class RenderJobStep(JobStep):
         queue_manifest_path,
         shots_count,
         task_chunk_size,
+        chunks_per_task=1,
+        shot_frame_ranges=None,
+        max_frames_per_task=0,
+        balance_chunks_by_frames=False,
+        resume_existing_frames=False,
     ):
         """
         Build JobStep, set its name, fill dependencies list and set queue manifest path parameter
@@ -285,10 +459,34 @@ class RenderJobStep(JobStep):
             queue_manifest_path,
             shots_count,
             task_chunk_size,
+            chunks_per_task,
+            shot_frame_ranges,
+            max_frames_per_task,
+            balance_chunks_by_frames,
+            resume_existing_frames,
         )
 
         self._set_queue_manifest_path_parameter(queue_manifest_path)
-        self._set_step_chunk_parameters(shots_count, task_chunk_size)
+        if max_frames_per_task > 0 and any(
+            end_frame - start_frame > max_frames_per_task
+            for _, start_frame, end_frame in shot_frame_ranges or []
+        ):
+            self._warn_ignored_chunk_settings(
+                "splits the shots longer than max frames per task",
+                chunks_per_task=chunks_per_task,
+                balance_chunks_by_frames=balance_chunks_by_frames,
+            )
+            self._set_step_frame_range_parameters(shot_frame_ranges, max_frames_per_task)
+        elif balance_chunks_by_frames and shot_frame_ranges:
+            self._warn_ignored_chunk_settings(
+                "balances the chunks by frames", chunks_per_task=chunks_per_task
+            )
+            self._set_step_balanced_chunk_parameters(shot_frame_ranges, task_chunk_size)
+        else:
+            self._set_step_chunk_parameters(shots_count, task_chunk_size, chunks_per_task)
+
+        if resume_existing_frames:
+            self._append_run_data_line("resume: true")
 
     def _set_name(self, step_settings):
         """
@@ -296,6 +494,30 @@ class RenderJobStep(JobStep):
         """
         self._job_step["name"] = "Render"
 
+    def _warn_ignored_chunk_settings(
+        self, mode: str, chunks_per_task: int = 1, balance_chunks_by_frames: bool = False
+    ):
+        """
+        Log the chunking settings that don't apply to the chosen chunking mode of the step
+
+        :param mode: Description of the chosen chunking mode
+        :type mode: str
+        :param chunks_per_task: Number of the chunks rendered by one task
+        :type chunks_per_task: int
+        :param balance_chunks_by_frames: Whether the chunks are balanced by frames
+        :type balance_chunks_by_frames: bool
+        """
+        ignored_settings = []
+        if chunks_per_task > 1:
+            ignored_settings.append(f"chunks per task ({chunks_per_task})")
+        if balance_chunks_by_frames:
+            ignored_settings.append("balance chunks by frames")
+        if ignored_settings:
+            logger.warning(
+                f"Step {self._job_step['name']} {mode}, "
+                f"so {' and '.join(ignored_settings)} is ignored"
+            )
+
     def _set_queue_manifest_path_parameter(self, queue_manifest_path):
         """
         Fill the necessary parameter "QueueManifestPath" with the given script path.
@@ -309,18 +531,189 @@ class RenderJobStep(JobStep):
             parameter_name="QueueManifestPath", path_value=queue_manifest_path
         )
 
-    def _set_step_chunk_parameters(self, shots_count: int, task_chunk_size: int):
+    def _set_step_chunk_parameters(
+        self, shots_count: int, task_chunk_size: int, chunks_per_task: int = 1
+    ):
+        """
+        Fill the "ChunkId" and "ChunkSize" parameters, one task per shots chunk.
+
+        If the chunks_per_task is more than 1, "ChunkId" is replaced with the "ChunkIds" string
+        parameter with the comma separated chunk ids and the run data gets the chunk_ids list,
+        so the task renders several chunks in one render pass.
+
+        :param shots_count: Number of the shots to render
+        :type shots_count: int
+        :param task_chunk_size: Number of the shots in the chunk
+        :type task_chunk_size: int
+        :param chunks_per_task: Number of the chunks rendered by one task
+        :type chunks_per_task: int
+        """
         task_chunk_ids_count = math.ceil(shots_count / task_chunk_size)
         task_chunk_ids = [i for i in range(task_chunk_ids_count)]
         task_chunk_id_param = {"name": "ChunkId", "type": "INT", "range": task_chunk_ids}
         task_chunk_size_param = {"name": "ChunkSize", "type": "INT", "range": [task_chunk_size]}
 
+        if chunks_per_task > 1:
+            task_chunk_id_param = {
+                "name": "ChunkIds",
+                "type": "STRING",
+                "range": [
+                    ",".join(str(i) for i in task_chunk_ids[start : start + chunks_per_task])
+                    for start in range(0, task_chunk_ids_count, chunks_per_task)
+                ],
+            }
+            self._replace_run_data_line(
+                "chunk_id: {{Task.Param.ChunkId}}", "chunk_ids: [{{Task.Param.ChunkIds}}]"
+            )
+
         for param_definition in self._job_step["parameterSpace"]["taskParameterDefinitions"]:
-            if param_definition["name"] == task_chunk_id_param["name"]:
+            if param_definition["name"] in ["ChunkId", "ChunkIds"]:
+                param_definition.clear()
                 param_definition.update(task_chunk_id_param)
             if param_definition["name"] == task_chunk_size_param["name"]:
                 param_definition.update(task_chunk_size_param)
 
+    @staticmethod
+    def balance_chunks(
+        shot_frame_ranges: list[tuple[str, int, int]], chunks_count: int
+    ) -> list[list[str]]:
+        """
+        Pack the shots into the chunks with roughly equal total number of frames.
+        The longest shots are placed first, each into the chunk with the least frames.
+
+        :param shot_frame_ranges: Names, start and end (exclusive) frames of the shots
+        :type shot_frame_ranges: list[tuple[str, int, int]]
+        :param chunks_count: Number of the chunks, limited by the number of the shots
+        :type chunks_count: int
+
+        :return: Names of the shots of each chunk, chunks and shots in the order of the shots
+        :rtype: list[list[str]]
+        """
+        chunks_count = max(min(chunks_count, len(shot_frame_ranges)), 1)
+        chunks_frames = [(0, chunk_index) for chunk_index in range(chunks_count)]
+        chunks_shots: list[list[int]] = [[] for _ in range(chunks_count)]
+
+        shots_by_length = sorted(
+            range(len(shot_frame_ranges)),
+            key=lambda i: shot_frame_ranges[i][2] - shot_frame_ranges[i][1],
+            reverse=True,
+        )
+        for shot_index in shots_by_length:
+            _, start_frame, end_frame = shot_frame_ranges[shot_index]
+            frames, chunk_index = heapq.heappop(chunks_frames)
+            chunks_shots[chunk_index].append(shot_index)
+            heapq.heappush(chunks_frames, (frames + end_frame - start_frame, chunk_index))
+
+        return [
+            [shot_frame_ranges[shot_index][0] for shot_index in shot_indexes]
+            for shot_indexes in sorted(sorted(shot_indexes) for shot_indexes in chunks_shots)
+            if shot_indexes
+        ]
+
+    def _set_step_balanced_chunk_parameters(
+        self, shot_frame_ranges: list[tuple[str, int, int]], task_chunk_size: int
+    ):
+        """
+        Replace the "ChunkId" and "ChunkSize" parameters with the "ChunkId" parameter of the chunks
+        of the shots packed by the number of frames, one task per chunk. The number of the chunks
+        is the same as in the fixed size chunking.
+
+        The run data gets the shot_chunks list with the shot names of every chunk, so the worker
+        renders the explicit shots of the task chunk. The names are written by the submitter,
+        not substituted from the task parameter, so they need no escaping in the parameter.
+
+        :param shot_frame_ranges: Names, start and end (exclusive) frames of the shots to render
+        :type shot_frame_ranges: list[tuple[str, int, int]]
+        :param task_chunk_size: Number of the shots in the chunk of the fixed size chunking
+        :type task_chunk_size: int
+        """
+        chunks = self.balance_chunks(
+            shot_frame_ranges, math.ceil(len(shot_frame_ranges) / task_chunk_size)
+        )
+
+        parameter_space = self._job_step["parameterSpace"]
+        parameter_space["taskParameterDefinitions"] = [
+            param_definition
+            for param_definition in parameter_space["taskParameterDefinitions"]
+            if param_definition["name"] not in ["ChunkId", "ChunkIds", "ChunkSize"]
+        ] + [{"name": "ChunkId", "type": "INT", "range": list(range(len(chunks)))}]
+
+        self._replace_run_data_line("chunk_size: {{Task.Param.ChunkSize}}\n", "")
+        # JSON list is the YAML flow sequence with the escaped names
+        self._append_run_data_line(f"shot_chunks: {json.dumps(chunks)}")
+
+    @staticmethod
+    def split_frame_ranges(
+        shot_frame_ranges: list[tuple[str, int, int]], max_frames_per_task: int
+    ) -> list[tuple[str, int, int]]:
+        """
+        Split the frame ranges of the shots longer than max_frames_per_task into
+        the even sub-ranges of at most max_frames_per_task frames
+
+        :param shot_frame_ranges: Names, start and end (exclusive) frames of the shots
+        :type shot_frame_ranges: list[tuple[str, int, int]]
+        :param max_frames_per_task: Maximum number of the frames in the sub-range
+        :type max_frames_per_task: int
+
+        :return: Names, start and end (exclusive) frames of the sub-ranges
+        :rtype: list[tuple[str, int, int]]
+        """
+        frame_ranges: list[tuple[str, int, int]] = []
+        for shot_name, start_frame, end_frame in shot_frame_ranges:
+            frames_count = end_frame - start_frame
+            ranges_count = max(math.ceil(frames_count / max_frames_per_task), 1)
+            bounds = [
+                start_frame + frames_count * i // ranges_count for i in range(ranges_count + 1)
+            ]
+            frame_ranges.extend(
+                (shot_name, range_start, range_end)
+                for range_start, range_end in zip(bounds, bounds[1:])
+            )
+        return frame_ranges
+
+    def _set_step_frame_range_parameters(
+        self, shot_frame_ranges: list[tuple[str, int, int]], max_frames_per_task: int
+    ):
+        """
+        Replace the "ChunkId" and "ChunkSize" parameters with the associated "ShotName",
+        "FrameStart" and "FrameEnd" parameters, one task per shot or per frame range
+        of the shot longer than max_frames_per_task.
+
+        The run data gets the shot_names list with the shot and the frame_range, so the task
+        renders the [start, end) frames of the shot with the custom playback range.
+        The shot name is substituted as is, see
+        :meth:`deadline.unreal_submitter.unreal_open_job.job_step.JobStep._run_data_string`
+
+        :param shot_frame_ranges: Names, start and end (exclusive) frames of the shots to render
+        :type shot_frame_ranges: list[tuple[str, int, int]]
+        :param max_frames_per_task: Maximum number of the frames rendered by one task
+        :type max_frames_per_task: int
+        """
+        frame_ranges = self.split_frame_ranges(shot_frame_ranges, max_frames_per_task)
+        self._check_run_data_strings("ShotName", [r[0] for r in frame_ranges])
+
+        parameter_space = self._job_step["parameterSpace"]
+        parameter_space["taskParameterDefinitions"] = [
+            param_definition
+            for param_definition in parameter_space["taskParameterDefinitions"]
+            if param_definition["name"] not in ["ChunkId", "ChunkIds", "ChunkSize"]
+        ] + [
+            {"name": "ShotName", "type": "STRING", "range": [r[0] for r in frame_ranges]},
+            {"name": "FrameStart", "type": "INT", "range": [r[1] for r in frame_ranges]},
+            {"name": "FrameEnd", "type": "INT", "range": [r[2] for r in frame_ranges]},
+        ]
+        # Associate the values by index instead of the cartesian product
+        parameter_space["combination"] = "(ShotName, FrameStart, FrameEnd)"
+
+        self._replace_run_data_line(
+            "chunk_id: {{Task.Param.ChunkId}}",
+            f"shot_names:\n  - {self._run_data_string('ShotName', indent=2)}",
+        )
+        self._replace_run_data_line(
+            "chunk_size: {{Task.Param.ChunkSize}}",
+            "frame_range: [{{Task.Param.FrameStart}}, {{Task.Param.FrameEnd}}]",
+        )
+
 
 @dataclass
 class JobStepDescriptor:
@@ -410,6 +803,11 @@ class JobStepFactory:
         shots_count: int,
         task_chunk_size: int,
         host_requirements,
+        chunks_per_task: int = 1,
+        shot_frame_ranges: Optional[list[tuple[str, int, int]]] = None,
+        max_frames_per_task: int = 0,
+        balance_chunks_by_frames: bool = False,
+        resume_existing_frames: bool = False,
     ) -> list[JobStep]:
         """
         Create the Job Steps list using the provided job settings and other parameters
@@ -424,6 +822,19 @@ class JobStepFactory:
         :type extra_cmd_args: str
         :param task_chunk_size: Task chunk size
         :type task_chunk_size: int
+        :param chunks_per_task: Number of the shots chunks rendered by one task
+        :type chunks_per_task: int
+        :param shot_frame_ranges: Names, start and end frames of the shots to render
+        :type shot_frame_ranges: Optional[list[tuple[str, int, int]]]
+        :param max_frames_per_task: Number of the frames above which the shot is split
+                                    into the frame ranges rendered by separate tasks, 0 disables
+        :type max_frames_per_task: int
+        :param balance_chunks_by_frames: Whether to pack the shots into the chunks
+                                         with the equal number of frames
+        :type balance_chunks_by_frames: bool
+        :param resume_existing_frames: Whether to skip the frames already rendered
+                                       to the output directory
+        :type resume_existing_frames: bool
 
         :return: list of the :class:`deadline.unreal_submitter.unreal_open_job.job_step.JobStep` instances
         :rtype: :class:`deadline.unreal_submitter.unreal_open_job.job_step.JobStep`
@@ -448,6 +859,11 @@ class JobStepFactory:
                             queue_manifest_path=queue_manifest_path,
                             shots_count=shots_count,
                             task_chunk_size=task_chunk_size,
+                            chunks_per_task=chunks_per_task,
+                            shot_frame_ranges=shot_frame_ranges,
+                            max_frames_per_task=max_frames_per_task,
+                            balance_chunks_by_frames=balance_chunks_by_frames,
+                            resume_existing_frames=resume_existing_frames,
                         )
                     )
 
@@ -460,6 +876,11 @@ class JobStepFactory:
                         queue_manifest_path=queue_manifest_path,
                         shots_count=shots_count,
                         task_chunk_size=task_chunk_size,
+                        chunks_per_task=chunks_per_task,
+                        shot_frame_ranges=shot_frame_ranges,
+                        max_frames_per_task=max_frames_per_task,
+                        balance_chunks_by_frames=balance_chunks_by_frames,
+                        resume_existing_frames=resume_existing_frames,
                     )
                 )
 
@@ -125,6 +125,12 @@ class OpenJobDescription:
     Represents a OpenJob description object
     """
 
+    #: Name of the job environment launching Unreal Editor
+    EDITOR_ENVIRONMENT_NAME = "LaunchUnrealEditor"
+
+    #: Name of the step environment launching the adaptor without Unreal Editor
+    SCRIPT_POOL_ENVIRONMENT_NAME = "LaunchPythonScriptPool"
+
     def __init__(self, mrq_job: unreal.MoviePipelineExecutorJob):
         """
         Build OpenJob with the given MovieP ipeline Executor Job and Queue Manifest path
@@ -187,6 +193,59 @@ class OpenJobDescription:
 
         return shots_to_render
 
+    @staticmethod
+    def get_enabled_shot_frame_ranges(
+        mrq_job: unreal.MoviePipelineExecutorJob,
+    ) -> list[tuple[str, int, int]]:
+        """
+        Returns the frame ranges of the enabled shots in MRQ Job, in the display rate frames
+        of the job's level sequence. The end frame is exclusive. If the job configuration
+        overrides the playback range, the shot ranges are clipped with it.
+
+        :param mrq_job: unreal.MoviePipelineExecutorJob instance
+        :type mrq_job: unreal.MoviePipelineExecutorJob
+
+        :return: list of the enabled shots names, start and end frames
+        :rtype: list[tuple[str, int, int]]
+        """
+
+        level_sequence = unreal.EditorAssetLibrary.load_asset(
+            soft_obj_path_to_str(mrq_job.sequence)
+        )
+        if level_sequence is None:
+            return []
+
+        section_ranges = {}
+        # Track lookup was renamed from the master tracks to the tracks in Unreal Engine 5.2
+        find_tracks = getattr(level_sequence, "find_tracks_by_type", None) or getattr(
+            level_sequence, "find_master_tracks_by_type"
+        )
+        for track in find_tracks(unreal.MovieSceneCinematicShotTrack):
+            for section in track.get_sections():
+                if section.is_active():
+                    section_ranges[section.get_shot_display_name()] = (
+                        section.get_start_frame(),
+                        section.get_end_frame(),
+                    )
+
+        playback_range = (level_sequence.get_playback_start(), level_sequence.get_playback_end())
+        output_setting = mrq_job.get_configuration().find_setting_by_class(
+            unreal.MoviePipelineOutputSetting
+        )
+        if output_setting is not None and output_setting.use_custom_playback_range:
+            playback_range = (output_setting.custom_start_frame, output_setting.custom_end_frame)
+
+        shot_frame_ranges = []
+        for shot_name in OpenJobDescription.get_enabled_shot_names(mrq_job):
+            # The sequence without the shot track is rendered as a single shot
+            start_frame, end_frame = section_ranges.get(shot_name, playback_range)
+            start_frame = max(start_frame, playback_range[0])
+            end_frame = min(end_frame, playback_range[1])
+            if end_frame > start_frame:
+                shot_frame_ranges.append((shot_name, start_frame, end_frame))
+
+        return shot_frame_ranges
+
     def _create_open_job_from_mrq_job(self, mrq_job: unreal.MoviePipelineExecutorJob) -> None:
         """
         Creates an OpenJob representation from the unreal.MoviePipelineExecutorJob.
@@ -215,6 +274,7 @@ class OpenJobDescription:
         self._save_manifest_file(mrq_job)
 
         self._build_steps(mrq_job)
+        OpenJobDescription.split_editor_environment(self._open_job, self._steps)
         self._open_job["steps"] = [step.as_dict() for step in self._steps]
 
         self._build_parameter_values_dict(mrq_job)
@@ -222,6 +282,62 @@ class OpenJobDescription:
 
         self._build_job_bundle()
 
+    @staticmethod
+    def split_editor_environment(open_job: dict, steps: list[JobStep]) -> None:
+        """
+        Move the Unreal Editor job environment to the steps that need the editor
+        if some of the job steps don't. Such steps get the environment that starts
+        the adaptor without the editor, so their tasks run the custom scripts
+        in the Python process pool.
+
+        The editor job environment stays unchanged if all the steps need the editor,
+        so the editor is kept running between the tasks of the different steps
+        of the session.
+
+        :param open_job: OpenJob template with the editor job environment
+        :type open_job: dict
+        :param steps: Steps of the job
+        :type steps: list[JobStep]
+        """
+        if all(step.requires_editor for step in steps):
+            return
+
+        job_environments = open_job.get("jobEnvironments", [])
+        editor_environment = next(
+            (
+                environment
+                for environment in job_environments
+                if environment["name"] == OpenJobDescription.EDITOR_ENVIRONMENT_NAME
+            ),
+            None,
+        )
+        if editor_environment is None:
+            return
+
+        job_environments.remove(editor_environment)
+        if not job_environments:
+            del open_job["jobEnvironments"]
+
+        script_pool_environment = deepcopy(editor_environment)
+        script_pool_environment["name"] = OpenJobDescription.SCRIPT_POOL_ENVIRONMENT_NAME
+        script_pool_environment["description"] = (
+            "Launch the Unreal adaptor without UnrealEditor to run the custom scripts "
+            "in the Python processes"
+        )
+        script_pool_environment["script"]["embeddedFiles"] = [
+            {
+                "name": "initData",
+                "filename": "init-data.yaml",
+                "type": "TEXT",
+                "data": "project_path: {{Param.ProjectFilePath}}\nrequires_editor: false\n",
+            }
+        ]
+
+        for step in steps:
+            step.add_step_environment(
+                deepcopy(editor_environment if step.requires_editor else script_pool_environment)
+            )
+
     def _collect_mrq_job_dependencies(self, mrq_job) -> list[str]:
         """
         Collects the dependencies of the Level and LevelSequence that used in MRQ Job.
@@ -404,6 +520,14 @@ class OpenJobDescription:
 
         shots_to_render = OpenJobDescription.get_enabled_shot_names(mrq_job)
 
+        max_frames_per_task = preset_overrides.job_shared_settings.max_frames_per_task
+        balance_chunks_by_frames = preset_overrides.job_shared_settings.balance_chunks_by_frames
+        shot_frame_ranges = (
+            OpenJobDescription.get_enabled_shot_frame_ranges(mrq_job)
+            if max_frames_per_task > 0 or balance_chunks_by_frames
+            else None
+        )
+
         try:
             self._steps = JobStepFactory.create_steps(
                 job_settings=mrq_job.get_configuration().get_all_settings(),
@@ -411,6 +535,11 @@ class OpenJobDescription:
                 queue_manifest_path=self._manifest_path,
                 shots_count=len(shots_to_render),
                 task_chunk_size=preset_overrides.job_shared_settings.task_chunk_size,
+                chunks_per_task=preset_overrides.job_shared_settings.chunks_per_task,
+                shot_frame_ranges=shot_frame_ranges,
+                max_frames_per_task=max_frames_per_task,
+                balance_chunks_by_frames=balance_chunks_by_frames,
+                resume_existing_frames=preset_overrides.job_shared_settings.resume_existing_frames,
             )
             return self._steps
 
@@ -39,6 +39,22 @@ struct UNREALDEADLINECLOUDSERVICE_API FDeadlineCloudJobSharedSettingsStruct
 	UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Job Shared Settings", meta=(DisplayPriority=5, ClampMin="1"))
 	int32 TaskChunkSize = 1;
 
+	/** Shots chunks rendered by one task in a single render pass */
+	UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Job Shared Settings", meta=(DisplayPriority=5, ClampMin="1"))
+	int32 ChunksPerTask = 1;
+
+	/** Shots longer than this number of frames are split into frame ranges rendered by separate tasks, 0 disables */
+	UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Job Shared Settings", meta=(DisplayPriority=5, ClampMin="0"))
+	int32 MaxFramesPerTask = 0;
+
+	/** Pack the shots into the chunks with equal number of frames instead of equal number of shots */
+	UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Job Shared Settings", meta=(DisplayPriority=5))
+	bool BalanceChunksByFrames = false;
+
+	/** Skip the frames already rendered to the output directory, e.g. when the task is retried */
+	UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Job Shared Settings", meta=(DisplayPriority=5))
+	bool ResumeExistingFrames = false;
+
 	/** Extra cmd args */
 	UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Job Shared Settings", meta=(DisplayPriority=5))
 	FString ExtraCmdArgs = "";
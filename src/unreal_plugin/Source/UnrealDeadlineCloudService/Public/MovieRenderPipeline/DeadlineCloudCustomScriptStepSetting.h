@@ -17,6 +17,22 @@ struct UNREALDEADLINECLOUDSERVICE_API FDeadlineCloudCustomScriptStepParameters :
 	/** Path to custom python script to execute */
 	UPROPERTY(EditAnywhere, BlueprintReadWrite, meta=(RelativeToGameDir, Category=Rendering))
 	FFilePath Script;
+
+	/** Run the script in Unreal Editor. Disable for the scripts that don't use the unreal module, so the step runs in a Python process without starting the editor */
+	UPROPERTY(EditAnywhere, BlueprintReadWrite, meta=(Category=Rendering))
+	bool bRequiresEditor = true;
+
+	/** Name of the keyword argument of the script main() that gets the value of the task. Set it with the integer range or the values to run one task per value in parallel */
+	UPROPERTY(EditAnywhere, BlueprintReadWrite, meta=(Category=Rendering))
+	FString TaskArgumentName;
+
+	/** Integer values of the tasks as the range expression, e.g. "1-100" or "1,5,10-20:2". Has priority over the task values */
+	UPROPERTY(EditAnywhere, BlueprintReadWrite, meta=(Category=Rendering))
+	FString TaskIntRange;
+
+	/** String values of the tasks, e.g. shot names or asset paths */
+	UPROPERTY(EditAnywhere, BlueprintReadWrite, meta=(Category=Rendering))
+	TArray<FString> TaskValues;
 };
 
 /**
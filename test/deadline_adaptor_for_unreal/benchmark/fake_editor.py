@@ -0,0 +1,64 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+"""
+Fake UnrealEditor-Cmd process for the adaptor benchmarks.
+
+Connects to the adaptor server defined by UNREAL_ADAPTOR_SOCKET_PATH like the UnrealClient does
+and prints the same stdout messages and sends the same events as the Unreal step handlers,
+without launching Unreal.
+"""
+
+import os
+import sys
+import json
+import time
+
+from openjd.adaptor_runtime_client import ClientInterface
+
+
+class FakeUnrealClient(ClientInterface):
+
+    def __init__(self, server_path: str) -> None:
+        super().__init__(server_path)
+        self.actions.update(
+            {
+                "client_loaded": self.client_loaded,
+                "set_handler": self.set_handler,
+                "run_script": self.run_script,
+                "wait_result": self.wait_result,
+            }
+        )
+        self.task_id = None
+
+    def _send_event(self, event: dict) -> None:
+        if self.task_id is not None:
+            event = dict(event, task_id=self.task_id)
+        self._send_request("PUT", "/event", query_string_params={"event": json.dumps(event)})
+
+    def client_loaded(self, args=None) -> None:
+        print("FakeUnrealClient loaded", flush=True)
+        self._send_event({"type": "client_loaded"})
+
+    def set_handler(self, args=None) -> None:
+        self.task_id = (args or {}).get("task_id")
+        print(f"Step Handler: Task {self.task_id} started", flush=True)
+
+    def run_script(self, args=None) -> None:
+        time.sleep(float(os.environ.get("FAKE_UNREAL_RENDER_SECONDS", 0)))
+        print("Render Executor: Progress: 100.0", flush=True)
+        self._send_event({"type": "progress", "progress": 100.0, "frame": 1, "total_frames": 1})
+        print("Render Executor: Rendering is complete", flush=True)
+        self._send_event({"type": "complete"})
+
+    def wait_result(self, args=None) -> None:
+        pass
+
+    def close(self, args=None) -> None:
+        print("Quit the Editor: normal shutdown", flush=True)
+
+    def graceful_shutdown(self, signum, frame) -> None:
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    FakeUnrealClient(os.environ["UNREAL_ADAPTOR_SOCKET_PATH"]).poll()
@@ -0,0 +1,107 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import importlib
+from pathlib import Path
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealClient.script_loader import ScriptLoader
+from deadline.unreal_adaptor.UnrealClient.step_handlers.unreal_custom_step_handler import (
+    UnrealCustomStepHandler,
+)
+
+
+pytestmark = pytest.mark.benchmark
+
+TASKS_COUNT = 1000
+MISSING_IMPORTS_COUNT = 200
+
+SCRIPT = "def main(task):\n    return task * 2\n"
+
+
+def _legacy_validate_script(script_path: str):
+    """Script loading of the custom step handler before the ScriptLoader"""
+    _script_path = Path(script_path)
+    sys.path.append(str(_script_path.parent))
+    return importlib.import_module(_script_path.stem)
+
+
+def _missing_imports_seconds() -> float:
+    """Time of the imports that are not found, they search every sys.path entry"""
+    importlib.invalidate_caches()
+    start_time = time.perf_counter()
+    for index in range(MISSING_IMPORTS_COUNT):
+        try:
+            importlib.import_module(f"deadline_benchmark_missing_module_{index}")
+        except ImportError:
+            pass
+    return time.perf_counter() - start_time
+
+
+def _run_tasks(load) -> float:
+    start_time = time.perf_counter()
+    for task in range(TASKS_COUNT):
+        assert load().main(task=task) == task * 2
+    return time.perf_counter() - start_time
+
+
+def test_custom_script_loading(tmp_path, monkeypatch) -> None:
+    """
+    Compares 1000 sequential custom script tasks of the legacy loading, which appends
+    the script directory to sys.path on every task, with the ScriptLoader, and the time
+    of the later imports in both cases.
+    """
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    legacy_script = tmp_path / "legacy" / "benchmark_legacy_script.py"
+    cached_script = tmp_path / "cached" / "benchmark_cached_script.py"
+    for script_path in [legacy_script, cached_script]:
+        script_path.parent.mkdir()
+        script_path.write_text(SCRIPT)
+    sys_path_length = len(sys.path)
+    baseline_imports_time = _missing_imports_seconds()
+
+    try:
+        legacy_time = _run_tasks(lambda: _legacy_validate_script(str(legacy_script)))
+        legacy_sys_path_growth = len(sys.path) - sys_path_length
+        legacy_imports_time = _missing_imports_seconds()
+    finally:
+        monkeypatch.setattr(sys, "path", sys.path[:sys_path_length])
+        sys.modules.pop(legacy_script.stem, None)
+
+    loader = ScriptLoader()
+    monkeypatch.setattr(UnrealCustomStepHandler, "script_loader", loader)
+    try:
+        cached_time = _run_tasks(
+            lambda: UnrealCustomStepHandler.validate_script(str(cached_script))
+        )
+        cached_sys_path_growth = len(sys.path) - sys_path_length
+        cached_imports_time = _missing_imports_seconds()
+
+        # The changed script is loaded again by the next task
+        cached_script.write_text(SCRIPT.replace("task * 2", "task * 3"))
+        stat = os.stat(cached_script)
+        os.utime(cached_script, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert UnrealCustomStepHandler.validate_script(str(cached_script)).main(task=1) == 3
+    finally:
+        loader.clear()
+
+    print(
+        f"{TASKS_COUNT} custom script tasks: "
+        f"legacy {legacy_time * 1000:.1f} ms (sys.path +{legacy_sys_path_growth}), "
+        f"ScriptLoader {cached_time * 1000:.1f} ms (sys.path +{cached_sys_path_growth}, "
+        f"{loader.loads} loads, {loader.hits} hits). "
+        f"{MISSING_IMPORTS_COUNT} later imports: baseline {baseline_imports_time * 1000:.1f} ms, "
+        f"after legacy {legacy_imports_time * 1000:.1f} ms, "
+        f"after ScriptLoader {cached_imports_time * 1000:.1f} ms"
+    )
+
+    assert legacy_sys_path_growth == TASKS_COUNT
+    assert cached_sys_path_growth == 0
+    assert loader.loads == 2
+    assert loader.hits == TASKS_COUNT - 1
+    assert cached_imports_time < legacy_imports_time
@@ -0,0 +1,77 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import statistics
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealAdaptor.adaptor import (
+    UnrealActionsQueue,
+    UnrealAdaptor,
+    UnrealSubprocessWithLogs,
+)
+from deadline.unreal_adaptor.UnrealAdaptor.regex_handler import PrefilteredRegexHandler
+
+
+pytestmark = pytest.mark.benchmark
+
+FAKE_EDITOR_PATH = str(Path(__file__).parent / "fake_editor.py")
+TASKS_COUNT = 20
+
+
+class FakeEditorUnrealAdaptor(UnrealAdaptor):
+    """UnrealAdaptor that launches the fake editor process instead of UnrealEditor-Cmd"""
+
+    def _start_unreal_client(self) -> None:
+        regexhandler = PrefilteredRegexHandler(
+            self._get_regex_callbacks(), keywords=self._get_regex_keywords()
+        )
+        self._unreal_client = UnrealSubprocessWithLogs(
+            args=[sys.executable, FAKE_EDITOR_PATH],
+            stdout_handler=regexhandler,
+            stderr_handler=regexhandler,
+            on_exit=self._handle_unreal_exit,
+        )
+
+
+@pytest.mark.skipif(os.name != "posix", reason="The adaptor server uses UNIX sockets")
+@patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+@patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client")
+def test_on_run_latency(mock_telemetry_client, mock_update_status, monkeypatch, tmp_path) -> None:
+    """
+    Measures the time between the task start and the on_run return when the fake editor
+    reports completion immediately. Before the event driven wait every task took at least 1s.
+    """
+    # GIVEN
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PYTHONPATH", os.environ.get("PYTHONPATH", ""))
+    monkeypatch.setenv("UNREAL_ADAPTOR_SOCKET_PATH", "")
+    adaptor = FakeEditorUnrealAdaptor({"project_path": "FakeProject.uproject"})
+    adaptor._action_queue = UnrealActionsQueue()
+    monkeypatch.setattr(UnrealAdaptor, "_is_rendering", False)
+
+    latencies = []
+    try:
+        adaptor.on_start()
+
+        # WHEN
+        for _ in range(TASKS_COUNT):
+            start = time.perf_counter()
+            adaptor.on_run({"handler": "render"})
+            latencies.append(time.perf_counter() - start)
+    finally:
+        adaptor.on_cleanup()
+
+    # THEN
+    median = statistics.median(latencies)
+    print(
+        f"on_run latency over {TASKS_COUNT} tasks: median {median * 1000:.1f} ms, "
+        f"max {max(latencies) * 1000:.1f} ms"
+    )
+    assert median < 0.5
@@ -0,0 +1,102 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import time
+import random
+import logging
+from typing import Iterator
+from unittest.mock import Mock
+
+import pytest
+from openjd.adaptor_runtime.app_handlers import RegexCallback, RegexHandler
+
+from deadline.unreal_adaptor.UnrealAdaptor.adaptor import UnrealAdaptor
+from deadline.unreal_adaptor.UnrealAdaptor.regex_handler import PrefilteredRegexHandler
+
+
+pytestmark = pytest.mark.benchmark
+
+#: Path of a recorded Unreal log to replay. No recorded log is shipped with the tests,
+#: so if not set, a synthetic log of the render log lines is generated and the measured
+#: throughput is only indicative of the one of the real render
+UNREAL_LOG_PATH_ENV = "UNREAL_ADAPTOR_BENCHMARK_LOG"
+SYNTHETIC_LINES_COUNT = 200_000
+
+SYNTHETIC_NOISE = [
+    "LogShaderCompilers: Display: Shaders left to compile {n}",
+    "LogDerivedDataCache: Display: Pak: Performance: Hits={n} Misses=0",
+    "LogStreaming: Display: FlushAsyncLoading({n}): 1 QueuedPackages, 0 AsyncPackages",
+    "LogMovieRenderPipeline: Display: [{n}] Shot 1/1 Frame {n} rendering, sample 1/1",
+    "LogRenderer: Warning: [VSM] Non-Nanite Marking Job Queue overflow. Performance may be affected.",
+    "LogTexture: Display: Building textures: T_Rock_{n} (BC7, 2048X2048) took 0.{n}s",
+    "LogPython: Render Executor started frame {n}",
+]
+SYNTHETIC_SIGNALS = [
+    "LogPython: Render Executor: Progress: {n}.0",
+    "LogPython: Custom Step Executor: Progress: {n}.0",
+]
+
+
+def _read_log_lines() -> Iterator[str]:
+    log_path = os.environ.get(UNREAL_LOG_PATH_ENV)
+    if log_path:
+        with open(log_path, encoding="utf-8", errors="replace") as log_file:
+            for line in log_file:
+                yield line.rstrip("\n")
+        return
+
+    rng = random.Random(0)
+    yield "[2024.01.01-00.00.00:000][  0]LogPython: Step Handler: Task 1 started"
+    for index in range(SYNTHETIC_LINES_COUNT):
+        templates = SYNTHETIC_SIGNALS if index % 1000 == 0 else SYNTHETIC_NOISE
+        line = rng.choice(templates).format(n=rng.randint(0, 99))
+        yield f"[2024.01.01-00.00.00:{index % 1000:03d}][{index % 1000:3d}]{line}"
+    yield "[2024.01.01-00.00.00:999][999]LogPython: Render Executor: Rendering is complete"
+
+
+def _lines_per_second(handler: logging.Handler, records: list[logging.LogRecord]) -> float:
+    start_time = time.perf_counter()
+    for record in records:
+        handler.emit(record)
+    return len(records) / (time.perf_counter() - start_time)
+
+
+def test_stdout_throughput() -> None:
+    """
+    Compares the Unreal stdout dispatch throughput of the default RegexHandler with the
+    PrefilteredRegexHandler used by the adaptor.
+    The default input is a synthetic log, set UNREAL_ADAPTOR_BENCHMARK_LOG to the path of
+    a recorded Unreal log to measure the throughput on the real one.
+    """
+    adaptor = UnrealAdaptor({"project_path": "C:/LocalProjects/AWS_RND/AWS_RND.uproject"})
+    callback = Mock()
+    regex_callbacks = [
+        RegexCallback(regex_callback.regex_list, callback)
+        for regex_callback in adaptor._get_regex_callbacks()
+    ]
+
+    records = [
+        logging.LogRecord("UnrealEditor", logging.INFO, __file__, 0, line, None, None)
+        for line in _read_log_lines()
+    ]
+
+    default_rate = _lines_per_second(RegexHandler(regex_callbacks), records)
+    default_calls = callback.call_count
+    callback.reset_mock()
+
+    prefiltered_rate = _lines_per_second(
+        PrefilteredRegexHandler(regex_callbacks, keywords=adaptor._get_regex_keywords()), records
+    )
+    prefiltered_calls = callback.call_count
+
+    print(
+        f"Unreal stdout dispatch of {len(records)} lines: "
+        f"RegexHandler {default_rate:.0f} lines/s, "
+        f"PrefilteredRegexHandler {prefiltered_rate:.0f} lines/s "
+        f"(x{prefiltered_rate / default_rate:.1f})"
+    )
+
+    assert prefiltered_calls == default_calls
+    assert prefiltered_rate > default_rate
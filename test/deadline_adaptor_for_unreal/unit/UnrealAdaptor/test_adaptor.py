@@ -2,17 +2,41 @@
 
 from __future__ import annotations
 
+import os
 import re
+import gzip
+import json
+import logging
 import ast
 import sys
-from unittest.mock import Mock, PropertyMock, patch, mock_open
+import threading
+from unittest.mock import Mock, PropertyMock, call, patch, mock_open
 
 import pytest
 import jsonschema  # type: ignore
 
 
 from deadline.unreal_adaptor.UnrealAdaptor import UnrealAdaptor
-from deadline.unreal_adaptor.UnrealAdaptor.adaptor import UnrealNotRunningError
+from openjd.adaptor_runtime_client import Action
+
+from deadline.unreal_adaptor.UnrealAdaptor.adaptor import (
+    UnrealActionsQueue,
+    UnrealNotRunningError,
+    UnrealSubprocessWithLogs,
+)
+from deadline.unreal_adaptor.UnrealAdaptor.ddc import LocalDerivedDataCache
+from deadline.unreal_adaptor.UnrealAdaptor.memory_guard import MemoryGuard
+from deadline.unreal_adaptor.UnrealAdaptor.watchdog import StallWatchdog
+
+
+@pytest.fixture(autouse=True)
+def session_working_dir(tmp_path, monkeypatch):
+    """
+    Pytest Fixture to run each test in the temporary directory, as the adaptor writes
+    the startup timings to the session working directory
+    """
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
 
 
 @pytest.fixture()
@@ -51,14 +75,18 @@ class TestUnrealAdaptor_on_start:
     @patch(
         "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
     )
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._unreal_client_loaded",
+        new_callable=PropertyMock,
+        return_value=True,
+    )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
     def test_no_error(
         self,
         mock_server: Mock,
         mock_logging_subprocess: Mock,
-        mock_actions_queue: Mock,
+        mock_client_loaded: Mock,
         mock_telemetry_client: Mock,
         init_data: dict,
     ) -> None:
@@ -71,31 +99,35 @@ class TestUnrealAdaptor_on_start:
     @patch(
         "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
     )
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._unreal_client_loaded",
+        new_callable=PropertyMock,
+        return_value=True,
+    )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
     def test__wait_for_socket(
         self,
         mock_server: Mock,
         mock_logging_subprocess: Mock,
-        mock_actions_queue: Mock,
+        mock_client_loaded: Mock,
         mock_telemetry_client: Mock,
         mock_sleep: Mock,
         init_data: dict,
     ) -> None:
-        """Tests that the _wait_for_socket method sleeps until a socket is available"""
+        """Tests that the _wait_for_socket method waits for the server to be bound without sleeping"""
         # GIVEN
         adaptor = UnrealAdaptor(init_data)
-        socket_mock = PropertyMock(
-            side_effect=[None, None, None, "/tmp/9999", "/tmp/9999", "/tmp/9999"]
-        )
-        type(mock_server.return_value).server_path = socket_mock
+        mock_server.return_value.server_path = "/tmp/9999"
 
         # WHEN
         adaptor.on_start()
 
         # THEN
-        assert mock_sleep.call_count == 3
+        mock_sleep.assert_not_called()
+        assert adaptor._server_ready_event.is_set()
+        assert "adaptor_server_start" in adaptor._startup_profiler.phases
+        assert "unreal_start" in adaptor._startup_profiler.phases
 
     @patch("threading.Thread")
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
@@ -120,14 +152,18 @@ class TestUnrealAdaptor_on_start:
     @patch(
         "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
     )
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=1)
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._unreal_client_loaded",
+        new_callable=PropertyMock,
+        return_value=False,
+    )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
     def test_unreal_init_timeout(
         self,
         mock_server: Mock,
         mock_logging_subprocess: Mock,
-        mock_actions_queue: Mock,
+        mock_client_loaded: Mock,
         mock_telemetry_client: Mock,
         init_data: dict,
     ) -> None:
@@ -158,14 +194,18 @@ class TestUnrealAdaptor_on_start:
     @patch(
         "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
     )
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=1)
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._unreal_client_loaded",
+        new_callable=PropertyMock,
+        return_value=False,
+    )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
     def test_unreal_init_fail(
         self,
         mock_server: Mock,
         mock_logging_subprocess: Mock,
-        mock_actions_queue: Mock,
+        mock_client_loaded: Mock,
         mock_telemetry_client: Mock,
         init_data: dict,
     ) -> None:
@@ -187,14 +227,18 @@ class TestUnrealAdaptor_on_start:
         assert str(exc_info.value) == error_msg
 
     @patch.object(UnrealAdaptor, "_unreal_is_running", False)
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=1)
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._unreal_client_loaded",
+        new_callable=PropertyMock,
+        return_value=False,
+    )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
     def test_init_data_wrong_schema(
         self,
         mock_server: Mock,
         mock_logging_subprocess: Mock,
-        mock_actions_queue: Mock,
+        mock_client_loaded: Mock,
     ) -> None:
         """
         Tests that an RuntimeError is raised if the unreal client encounters an exception
@@ -302,6 +346,34 @@ class TestUnrealAdaptor_on_start:
         assert extra_cmd_arg in launch_args
         assert unreal_client_path in launch_args[-1]
 
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.unreal_client_path",
+        new_callable=PropertyMock,
+        return_value="UnrealClient.py",
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    def test__start_unreal_client_with_ddc(
+        self,
+        mock_subprocess: Mock,
+        mock_unreal_client_path: Mock,
+        init_data: dict,
+        tmp_path,
+    ):
+        """Tests that UE is started with the prepared worker local DerivedDataCache"""
+        # GIVEN
+        ddc_path = str(tmp_path / "DDC")
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._ddc = LocalDerivedDataCache(ddc_path, max_size=LocalDerivedDataCache.BYTES_IN_GB)
+
+        # WHEN
+        adaptor._start_unreal_client()
+
+        # THEN
+        launch_args = mock_subprocess.call_args.kwargs["args"]
+        assert f"-LocalDataCachePath={ddc_path}" in launch_args
+        assert "UnrealClient.py" in launch_args[-1]
+        assert os.path.isdir(ddc_path)
+
     @patch("os.path.exists", return_value=True)
     @patch(
         "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.unreal_client_path",
@@ -376,14 +448,18 @@ class TestUnrealAdaptor_on_run:
     @patch(
         "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
     )
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._unreal_client_loaded",
+        new_callable=PropertyMock,
+        return_value=True,
+    )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
     def test_on_run(
         self,
         mock_server: Mock,
         mock_logging_subprocess: Mock,
-        mock_actions_queue: Mock,
+        mock_client_loaded: Mock,
         mock_telemetry_client: Mock,
         mock_sleep: Mock,
         init_data: dict,
@@ -397,12 +473,110 @@ class TestUnrealAdaptor_on_run:
         is_rendering_mock = PropertyMock(side_effect=[None, True, False])
         UnrealAdaptor._is_rendering = is_rendering_mock
         adaptor.on_start()
+        adaptor._unreal_state_event = mock_unreal_state_event = Mock()
+        mock_unreal_state_event.wait.return_value = False
+
+        # WHEN
+        adaptor.on_run(run_data)
+
+        # THEN
+        mock_unreal_state_event.clear.assert_called_once()
+        mock_unreal_state_event.wait.assert_called_once_with(timeout=1)
+        mock_sleep.assert_not_called()
+
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._unreal_client_loaded",
+        new_callable=PropertyMock,
+        return_value=True,
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    def test_on_run_reports_startup_timings(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        mock_client_loaded: Mock,
+        mock_telemetry_client: Mock,
+        init_data: dict,
+        run_data: dict,
+        session_working_dir,
+    ) -> None:
+        """
+        Tests that the startup timings are reported once after the first task
+        to the telemetry and to the JSON file in the session working directory
+        """
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        mock_server.return_value.server_path = "/tmp/9999"
+        UnrealAdaptor._is_rendering = PropertyMock(side_effect=[None, False, None, False])
+        adaptor.on_start()
+        adaptor._unreal_state_event = Mock()
+        adaptor._startup_profiler.observe_line("LogShaderCompilers: Display: Compiling shaders")
+        adaptor.handle_client_event(
+            {"type": "timing", "phase": "asset_registry_wait", "duration": 1.5}
+        )
+        adaptor._handle_run_script_taken(Action("run_script", run_data))
 
         # WHEN
         adaptor.on_run(run_data)
+        adaptor.on_run(run_data)
+
+        # THEN
+        report_path = session_working_dir / UnrealAdaptor._STARTUP_REPORT_FILE_NAME
+        report = json.loads(report_path.read_text())
+        assert {
+            "adaptor_server_start",
+            "pythonpath_setup",
+            "unreal_spawn",
+            "first_stdout_line",
+            "unreal_start",
+            "asset_registry_wait",
+        } == set(report["phases"])
+        assert report["phases"]["asset_registry_wait"] == 1.5
+        assert set(report["milestones"]) == {"first_run_script"}
+        assert report["log_markers"]["shader_compilation"]["lines"] == 1
+        mock_telemetry_client.return_value.record_event.assert_called_once_with(
+            event_type="com.amazon.rum.deadline.adaptor.runtime.start",
+            event_details={"startup_timings": report},
+        )
+
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._is_rendering",
+        new_callable=PropertyMock,
+    )
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._unreal_is_running",
+        new_callable=PropertyMock,
+        return_value=True,
+    )
+    def test_on_run_enqueues_constant_actions(
+        self,
+        mock_unreal_is_running: Mock,
+        mock_is_rendering: Mock,
+        init_data: dict,
+        run_data: dict,
+    ) -> None:
+        """Tests that on_run doesn't enqueue more actions while the render is in progress"""
+        # GIVEN
+        mock_is_rendering.side_effect = [None] + [True] * 100 + [False]
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._unreal_state_event = mock_unreal_state_event = Mock()
+        mock_unreal_state_event.wait.return_value = False
+
+        # WHEN
+        with patch.object(adaptor, "_action_queue") as mock_action_queue:
+            adaptor.on_run(run_data)
 
         # THEN
-        mock_sleep.assert_called_once_with(1)
+        assert mock_unreal_state_event.wait.call_count == 100
+        assert [call.args[0].name for call in mock_action_queue.enqueue_action.call_args_list] == [
+            "set_handler",
+            "run_script",
+            "wait_result",
+        ]
 
     @patch("time.sleep")
     @patch(
@@ -416,14 +590,18 @@ class TestUnrealAdaptor_on_run:
     @patch(
         "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
     )
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._unreal_client_loaded",
+        new_callable=PropertyMock,
+        return_value=True,
+    )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
     def test_on_run_render_fail(
         self,
         mock_server: Mock,
         mock_logging_subprocess: Mock,
-        mock_actions_queue: Mock,
+        mock_client_loaded: Mock,
         mock_telemetry_client: Mock,
         mock_unreal_is_running: Mock,
         mock_is_rendering: Mock,
@@ -439,13 +617,15 @@ class TestUnrealAdaptor_on_run:
         adaptor = UnrealAdaptor(init_data)
         mock_server.return_value.server_path = "/tmp/9999"
         adaptor.on_start()
+        adaptor._unreal_state_event = mock_unreal_state_event = Mock()
+        mock_unreal_state_event.wait.return_value = False
 
         # WHEN
         with pytest.raises(RuntimeError) as exc_info:
             adaptor.on_run(run_data)
 
         # THEN
-        mock_sleep.assert_called_once_with(1)
+        mock_unreal_state_event.wait.assert_called_once_with(timeout=1)
         assert str(exc_info.value) == (
             "Unreal exited early and did not render successfully, "
             "please check render logs. "
@@ -456,14 +636,18 @@ class TestUnrealAdaptor_on_run:
     @patch(
         "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
     )
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._unreal_client_loaded",
+        new_callable=PropertyMock,
+        return_value=True,
+    )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
     def test_run_data_wrong_schema(
         self,
         mock_server: Mock,
         mock_logging_subprocess: Mock,
-        mock_actions_queue: Mock,
+        mock_client_loaded: Mock,
         mock_telemetry_client: Mock,
         mock_sleep: Mock,
         init_data: dict,
@@ -486,20 +670,259 @@ class TestUnrealAdaptor_on_run:
         error_msg = " is a required property"
         assert error_msg in exc_info.value.message
 
+    @patch("time.sleep")
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._unreal_client_loaded",
+        new_callable=PropertyMock,
+        return_value=True,
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    def test_run_data_wrong_shot_chunks(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        mock_client_loaded: Mock,
+        mock_telemetry_client: Mock,
+        mock_sleep: Mock,
+        init_data: dict,
+        run_data: dict,
+    ) -> None:
+        """Tests that on_run rejects the shot chunks that are not the lists of the shot names"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        mock_server.return_value.server_path = "/tmp/9999"
+        is_rendering_mock = PropertyMock(side_effect=[None, True, False])
+        UnrealAdaptor._is_rendering = is_rendering_mock
+        adaptor.on_start()
+        run_data["shot_chunks"] = ["Shot1", "Shot2"]
+
+        with pytest.raises(jsonschema.exceptions.ValidationError) as exc_info:
+            # WHEN
+            adaptor.on_run(run_data)
+
+        # THEN
+        assert exc_info.value.message == "'Shot1' is not of type 'array'"
+
+
+class TestUnrealAdaptor_without_editor:
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    def test_custom_script_without_editor(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        init_data: dict,
+        run_data: dict,
+        tmp_path,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Tests that the custom script runs in the script pool and the editor is not started"""
+        # GIVEN
+        caplog.set_level(logging.INFO)
+        script_path = tmp_path / "editorless_script.py"
+        script_path.write_text("def main(foo, bar):\n    return foo + int(bar)\n")
+        init_data["requires_editor"] = False
+        run_data.update({"handler": "custom", "script_path": str(script_path)})
+        adaptor = UnrealAdaptor(init_data)
+
+        # WHEN
+        adaptor.on_start()
+        try:
+            adaptor.on_run(run_data)
+        finally:
+            adaptor.on_cleanup()
+
+        # THEN
+        mock_server.assert_not_called()
+        mock_logging_subprocess.assert_not_called()
+        assert "Custom Step Executor: Complete: 3" in caplog.text
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ScriptProcessPool.cancel")
+    def test_cancel_without_editor(self, mock_cancel: Mock, init_data: dict) -> None:
+        """Tests that cancel interrupts the custom script running without the editor"""
+        # GIVEN
+        init_data["requires_editor"] = False
+        adaptor = UnrealAdaptor(init_data)
+        adaptor.on_start()
+
+        # WHEN
+        try:
+            adaptor.on_cancel()
+        finally:
+            adaptor.on_cleanup()
+
+        # THEN
+        mock_cancel.assert_called_once()
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_custom_script_progress_without_editor(
+        self, mock_update_status: Mock, init_data: dict, run_data: dict, tmp_path
+    ) -> None:
+        """Tests that the progress reported by the script is sent to the worker agent"""
+        # GIVEN
+        script_path = tmp_path / "editorless_progress_script.py"
+        script_path.write_text("def main(context):\n    context.report_progress(40)\n")
+        init_data["requires_editor"] = False
+        run_data.update({"handler": "custom", "script_path": str(script_path), "script_args": {}})
+        adaptor = UnrealAdaptor(init_data)
+
+        # WHEN
+        adaptor.on_start()
+        try:
+            adaptor.on_run(run_data)
+        finally:
+            adaptor.on_cleanup()
+
+        # THEN
+        assert mock_update_status.call_args_list[-2:] == [call(progress=40), call(progress=100)]
+
+    def test_render_without_editor(self, init_data: dict, run_data: dict) -> None:
+        """Tests that the render step can't run without the editor"""
+        # GIVEN
+        init_data["requires_editor"] = False
+        adaptor = UnrealAdaptor(init_data)
+        adaptor.on_start()
+
+        # WHEN
+        try:
+            with pytest.raises(RuntimeError) as exc_info:
+                adaptor.on_run(run_data)
+        finally:
+            adaptor.on_cleanup()
+
+        # THEN
+        assert "requires Unreal Editor" in str(exc_info.value)
+
+
+class TestUnrealActionsQueue:
+    def test_on_dequeue_called(self) -> None:
+        """Tests that the on_dequeue callback is called only when its action is dequeued"""
+        # GIVEN
+        queue = UnrealActionsQueue()
+        on_dequeue = Mock()
+        client_loaded = Action("client_loaded")
+        queue.enqueue_action(Action("set_handler"))
+        queue.enqueue_action(client_loaded, on_dequeue=on_dequeue)
+
+        # WHEN
+        queue.dequeue_action()
+
+        # THEN
+        on_dequeue.assert_not_called()
+
+        # WHEN
+        queue.dequeue_action()
+
+        # THEN
+        on_dequeue.assert_called_once_with(client_loaded)
+        assert len(queue) == 0
+
+    def test_client_loaded_wakes_up_start(self, init_data: dict) -> None:
+        """Tests that dequeuing the client_loaded action marks the UnrealClient as loaded"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._action_queue = UnrealActionsQueue()
+        adaptor._populate_client_loaded_action()
+        adaptor._unreal_state_event.clear()
+
+        # WHEN
+        action = adaptor._action_queue.dequeue_action()
+
+        # THEN
+        assert action is not None and action.name == "client_loaded"
+        assert adaptor._unreal_client_loaded
+        assert adaptor._unreal_state_event.is_set()
+
+    def test_client_loaded_with_preload(self, init_data: dict) -> None:
+        """
+        Tests that the client_loaded action carries the enabled preload and dequeuing it marks
+        the UnrealClient as loaded, the events sent after the preload are extra information
+        """
+        # GIVEN
+        init_data["preload"] = {
+            "enabled": True,
+            "level_path": "/Game/Maps/Main.Main",
+            "level_sequence_path": "/Game/Cinematics/Shot.Shot",
+            "job_configuration_path": "",
+        }
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._action_queue = UnrealActionsQueue()
+        adaptor._populate_client_loaded_action()
+
+        # WHEN
+        action = adaptor._action_queue.dequeue_action()
+
+        # THEN
+        assert action is not None and action.args == {
+            "preload": {
+                "level_path": "/Game/Maps/Main.Main",
+                "level_sequence_path": "/Game/Cinematics/Shot.Shot",
+            }
+        }
+        assert adaptor._unreal_client_loaded
+
+        # WHEN
+        adaptor.handle_client_event({"type": "timing", "phase": "level_preload", "duration": 12.5})
+        adaptor.handle_client_event({"type": "client_loaded"})
+
+        # THEN
+        assert adaptor._unreal_client_loaded
+        assert adaptor._startup_profiler.phases["level_preload"] == 12.5
+
+    def test_client_loaded_preload_disabled(self, init_data: dict) -> None:
+        """Tests that the client_loaded action doesn't ask to preload unless it is enabled"""
+        # GIVEN
+        init_data["preload"] = {"enabled": False, "level_path": "/Game/Maps/Main.Main"}
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._action_queue = UnrealActionsQueue()
+        adaptor._populate_client_loaded_action()
+
+        # WHEN
+        action = adaptor._action_queue.dequeue_action()
+
+        # THEN
+        assert action is not None and action.args is None
+        assert adaptor._unreal_client_loaded
+
+
+class TestUnrealSubprocessWithLogs:
+    def test_on_exit_called(self) -> None:
+        """Tests that the exit callback is called as soon as the Unreal process exits"""
+        # GIVEN
+        exited = threading.Event()
+
+        # WHEN
+        process = UnrealSubprocessWithLogs(
+            args=[sys.executable, "-c", "print('Unreal is running')"], on_exit=exited.set
+        )
+
+        # THEN
+        assert exited.wait(timeout=10)
+        assert not process.is_running
+        assert process.returncode == 0
+
 
 class TestUnrealAdaptor_on_stop:
     @patch("time.sleep")
     @patch(
         "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
     )
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._unreal_client_loaded",
+        new_callable=PropertyMock,
+        return_value=True,
+    )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
     def test_on_stop(
         self,
         mock_server: Mock,
         mock_logging_subprocess: Mock,
-        mock_actions_queue: Mock,
+        mock_client_loaded: Mock,
         mock_telemetry_client: Mock,
         mock_sleep: Mock,
         init_data: dict,
@@ -574,14 +997,18 @@ class TestUnrealAdaptor_on_cleanup:
     @patch(
         "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
     )
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._unreal_client_loaded",
+        new_callable=PropertyMock,
+        return_value=True,
+    )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
     def test_on_cleanup(
         self,
         mock_server: Mock,
         mock_logging_subprocess: Mock,
-        mock_actions_queue: Mock,
+        mock_client_loaded: Mock,
         mock_telemetry_client: Mock,
         mock_sleep: Mock,
         init_data: dict,
@@ -605,32 +1032,560 @@ class TestUnrealAdaptor_on_cleanup:
             # WHEN
             adaptor.on_cleanup()
 
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
-    def test_handle_complete(self, mock_update_status: Mock, init_data: dict):
-        """Tests that the _handle_complete method updates the progress correctly"""
+    @pytest.mark.parametrize("unreal_is_running, expected_stores", [(False, 1), (True, 0)])
+    def test_on_cleanup_stores_asset_registry_cache(
+        self, init_data: dict, unreal_is_running: bool, expected_stores: int
+    ) -> None:
+        """Tests that the asset registry state is cached only after the clean editor shutdown"""
         # GIVEN
         adaptor = UnrealAdaptor(init_data)
-        regex_callbacks = adaptor._get_regex_callbacks()
-        complete_regex = regex_callbacks[1].regex_list[0]
+        adaptor._unreal_client = Mock()
+        adaptor._asset_registry_cache = mock_cache = Mock()
 
         # WHEN
-        match = complete_regex.search("Render Executor: Rendering is complete")
-        if match:
-            adaptor._handle_complete(match)
+        with (
+            patch.object(
+                UnrealAdaptor, "_unreal_is_running", new_callable=PropertyMock
+            ) as mock_is_running,
+            patch.object(UnrealAdaptor, "get_timer", return_value=lambda: False),
+        ):
+            mock_is_running.return_value = unreal_is_running
+            adaptor.on_cleanup()
 
         # THEN
-        assert match is not None
-        mock_update_status.assert_called_once_with(progress=100)
-
-    handle_progress_params = [(0, "Render Executor: Progress: 99.0", 99)]
+        assert mock_cache.store.call_count == expected_stores
+        assert adaptor._unreal_client.terminate.call_count == 1 - expected_stores
 
-    @pytest.mark.parametrize("regex_index, stdout, expected_progress", handle_progress_params)
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
-    def test_handle_progress(
-        self,
-        mock_update_status: Mock,
-        regex_index: int,
-        stdout: str,
+    @patch("time.sleep")
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._unreal_client_loaded",
+        new_callable=PropertyMock,
+        return_value=True,
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    def test_log_policy(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        mock_client_loaded: Mock,
+        mock_telemetry_client: Mock,
+        mock_sleep: Mock,
+        init_data: dict,
+        session_working_dir,
+    ) -> None:
+        """
+        Tests that the log policy filters the Unreal output forwarded to the worker log,
+        while the regex callbacks and the archive get every line
+        """
+        # GIVEN
+        init_data["log_policy"] = {
+            "verbosity": "Warning",
+            "category_verbosity": {"LogPython": "Log"},
+            "archive_path": "unreal_output.log.gz",
+        }
+        adaptor = UnrealAdaptor(init_data)
+        mock_server.return_value.server_path = "/tmp/9999"
+        adaptor.on_start()
+        regexhandler = mock_logging_subprocess.call_args.kwargs["stdout_handler"]
+        output_logger = mock_logging_subprocess.call_args.kwargs["logger"]
+        lines = [
+            "LogShaderCompilers: Display: Shaders left to compile 10",
+            "LogPython: Render Executor: Error: Something Bad Happened!",
+        ]
+        stdout_level = logging.getLevelName("STDOUT")
+
+        # WHEN
+        forwarded_lines = [
+            line
+            for line in lines
+            if output_logger.filter(
+                logging.LogRecord(output_logger.name, stdout_level, __file__, 0, line, None, None)
+            )
+        ]
+        for line in lines:
+            regexhandler.emit(
+                logging.LogRecord("stdout", stdout_level, __file__, 0, line, None, None)
+            )
+
+        with patch(
+            "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._unreal_is_running",
+            new_callable=lambda: False,
+        ):
+            adaptor.on_cleanup()
+
+        # THEN
+        assert forwarded_lines == ["LogPython: Render Executor: Error: Something Bad Happened!"]
+        assert isinstance(adaptor._exc_info, RuntimeError)
+        assert not output_logger.filters
+        with gzip.open(session_working_dir / "unreal_output.log.gz", "rt") as f:
+            assert f.read().splitlines() == lines
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_handle_complete(self, mock_update_status: Mock, init_data: dict):
+        """Tests that the _handle_complete method updates the progress correctly"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        regex_callbacks = adaptor._get_regex_callbacks()
+        complete_regex = regex_callbacks[1].regex_list[0]
+
+        # WHEN
+        match = complete_regex.search("Render Executor: Rendering is complete")
+        if match:
+            adaptor._handle_complete(match)
+
+        # THEN
+        assert match is not None
+        mock_update_status.assert_called_once_with(progress=100)
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_handle_complete_wakes_up_task(self, mock_update_status: Mock, init_data: dict):
+        """Tests that the _handle_complete method wakes up the task waiting for the result"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._unreal_state_event.clear()
+
+        # WHEN
+        adaptor._handle_complete(Mock())
+
+        # THEN
+        assert adaptor._unreal_state_event.is_set()
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_handle_progress_coalesced(self, mock_update_status: Mock, init_data: dict):
+        """Tests that the per frame progress is not sent to the worker agent for every frame"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        progress_regex = adaptor._get_regex_callbacks()[0].regex_list[0]
+
+        # WHEN
+        for progress in range(50):
+            adaptor._handle_progress(
+                progress_regex.search(f"Render Executor: Progress: {progress}")  # type: ignore
+            )
+
+        # THEN
+        mock_update_status.assert_called_once_with(progress=0)
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_handle_error_flushes_progress(self, mock_update_status: Mock, init_data: dict):
+        """Tests that the pending progress is sent immediately when an error occurs"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        progress_regex = adaptor._get_regex_callbacks()[0].regex_list[0]
+        for progress in (10, 20):
+            adaptor._handle_progress(
+                progress_regex.search(f"Render Executor: Progress: {progress}")  # type: ignore
+            )
+
+        # WHEN
+        adaptor._handle_error(re.search("Exception:.*", "Exception: Something Bad Happened!"))  # type: ignore
+
+        # THEN
+        assert mock_update_status.call_args_list == [call(progress=10), call(progress=20)]
+
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._unreal_client_loaded",
+        new_callable=PropertyMock,
+        return_value=True,
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    def test_progress_report_init_data(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        mock_client_loaded: Mock,
+        mock_telemetry_client: Mock,
+        init_data: dict,
+    ):
+        """Tests that the progress report rate limits are taken from the init_data"""
+        # GIVEN
+        init_data["progress_report_interval"] = 5
+        init_data["progress_report_min_delta"] = 2
+        adaptor = UnrealAdaptor(init_data)
+        mock_server.return_value.server_path = "/tmp/9999"
+
+        # WHEN
+        adaptor.on_start()
+
+        # THEN
+        assert adaptor._progress_coalescer._min_interval == 5
+        assert adaptor._progress_coalescer._min_delta == 2
+
+    def test_handle_error_wakes_up_task(self, init_data: dict):
+        """Tests that the _handle_error method wakes up the task waiting for the result"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._unreal_state_event.clear()
+        match = re.search(".*Exception:.*", "Exception: Something Bad Happened!")
+
+        # WHEN
+        adaptor._handle_error(match)  # type: ignore[arg-type]
+
+        # THEN
+        assert adaptor._unreal_state_event.is_set()
+
+    def test_handle_unreal_exit_wakes_up_task(self, init_data: dict):
+        """Tests that the Unreal process exit wakes up the task waiting for the result"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._unreal_state_event.clear()
+
+        # WHEN
+        adaptor._handle_unreal_exit()
+
+        # THEN
+        assert adaptor._unreal_state_event.is_set()
+
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch.object(UnrealAdaptor, "_unreal_is_running", True)
+    def test_handle_stall(self, mock_telemetry_client: Mock, init_data: dict):
+        """Tests that the stalled editor fails the task and is terminated"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._unreal_client = Mock()
+        adaptor._unreal_state_event.clear()
+
+        # WHEN
+        adaptor._handle_stall(
+            "no progress for 3600 seconds during the rendering phase",
+            {"phase": "rendering", "recent_lines": ["LogPython: Render Executor: Progress: 50"]},
+        )
+
+        # THEN
+        assert adaptor._unreal_state_event.is_set()
+        with pytest.raises(RuntimeError, match="Unreal Editor stalled: no progress"):
+            adaptor._has_exception
+        adaptor._unreal_client.terminate.assert_called_once_with(grace_time_s=0)
+        mock_telemetry_client.return_value.record_error.assert_called_once()
+
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch.object(UnrealAdaptor, "on_start")
+    @patch.object(UnrealAdaptor, "on_cleanup")
+    @pytest.mark.parametrize("memory_usage, expected_recycles", [(2048, 1), (1024, 0), (None, 0)])
+    def test_recycle_if_memory_exceeded(
+        self,
+        mock_on_cleanup: Mock,
+        mock_on_start: Mock,
+        mock_telemetry_client: Mock,
+        init_data: dict,
+        memory_usage: int | None,
+        expected_recycles: int,
+    ):
+        """Tests that the editor over the memory ceiling is restarted and the recycle counted"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._memory_guard = MemoryGuard(memory_usage=lambda: memory_usage, max_memory=1024)
+
+        # WHEN
+        adaptor._recycle_if_memory_exceeded()
+
+        # THEN
+        assert adaptor._recycle_count == expected_recycles
+        assert mock_on_cleanup.call_count == expected_recycles
+        assert mock_on_start.call_count == expected_recycles
+        assert mock_telemetry_client.return_value.record_event.call_count == expected_recycles
+
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch.object(UnrealAdaptor, "on_start")
+    def test_recycle_drops_pending_close(
+        self, mock_on_start: Mock, mock_telemetry_client: Mock, init_data: dict
+    ):
+        """
+        Tests that the close action left by on_cleanup of the recycled editor and the client
+        state are not carried over to the new UnrealClient
+        """
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._action_queue = UnrealActionsQueue()
+        adaptor._memory_guard = MemoryGuard(memory_usage=lambda: 2048, max_memory=1024)
+        adaptor._client_events = True
+        adaptor._client_loaded_event.set()
+
+        def on_cleanup() -> None:
+            adaptor._action_queue.enqueue_action(Action("wait_result", {}))
+            adaptor._action_queue.enqueue_action(Action("close"), front=True)
+
+        # WHEN
+        with patch.object(adaptor, "on_cleanup", side_effect=on_cleanup):
+            adaptor._recycle_if_memory_exceeded()
+
+        # THEN
+        mock_on_start.assert_called_once()
+        assert len(adaptor._action_queue) == 0
+        assert not adaptor._client_events
+        assert not adaptor._unreal_client_loaded
+
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._unreal_client_loaded",
+        new_callable=PropertyMock,
+        return_value=True,
+    )
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    def test_memory_guard_init_data(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        mock_client_loaded: Mock,
+        mock_telemetry_client: Mock,
+        init_data: dict,
+    ):
+        """Tests that the memory ceiling and the sample interval are taken from the init_data"""
+        # GIVEN
+        init_data["memory_guard"] = {"max_memory_mb": 512, "sample_interval": 5}
+        adaptor = UnrealAdaptor(init_data)
+        mock_server.return_value.server_path = "/tmp/9999"
+
+        # WHEN
+        adaptor.on_start()
+
+        # THEN
+        assert adaptor._memory_guard.max_memory == 512 * MemoryGuard.BYTES_IN_MB
+        assert adaptor._memory_guard._sample_interval == 5
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_watchdog_phases(self, mock_update_status: Mock, init_data: dict):
+        """Tests that the task progress is passed to the watchdog and the complete pauses it"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._watchdog = StallWatchdog(on_stall=Mock(), thresholds={})
+        adaptor._watchdog.set_phase(StallWatchdog.ASSET_LOADING)
+
+        # WHEN
+        adaptor.handle_client_event({"type": "progress", "progress": 0.5})
+        rendering_phase = adaptor._watchdog.phase
+        adaptor.handle_client_event({"type": "complete"})
+
+        # THEN
+        assert rendering_phase == StallWatchdog.RENDERING
+        assert adaptor._watchdog.phase is None
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_handle_client_event_progress(self, mock_update_status: Mock, init_data: dict):
+        """Tests that the progress event updates the progress"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+
+        # WHEN
+        adaptor.handle_client_event(
+            {"type": "progress", "progress": 42.5, "frame": 17, "shot": "sh010", "elapsed": 3.2}
+        )
+
+        # THEN
+        mock_update_status.assert_called_once_with(progress=42)
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_task_metrics(
+        self, mock_update_status: Mock, init_data: dict, caplog: pytest.LogCaptureFixture
+    ):
+        """Tests that the frames of the progress events are counted in the task metrics"""
+        # GIVEN
+        caplog.set_level(logging.DEBUG)
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._task_metrics_sampler.start_task()
+
+        # WHEN
+        for frame in [1, 2, 2, 3]:
+            adaptor.handle_client_event(
+                {"type": "progress", "progress": frame * 10, "frame": frame, "shot": "sh010"}
+            )
+        task_metrics = adaptor._task_metrics_sampler.finish_task()
+        assert task_metrics is not None
+        adaptor._report_task_metrics(task_metrics)
+
+        # THEN
+        assert task_metrics.frames_rendered == 3
+        assert "frames rendered 3" in caplog.text
+        assert '"frames_rendered": 3' in caplog.text
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_handle_client_event_complete(self, mock_update_status: Mock, init_data: dict):
+        """Tests that the complete event completes the task"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._unreal_state_event.clear()
+
+        # WHEN
+        adaptor.handle_client_event({"type": "complete"})
+
+        # THEN
+        mock_update_status.assert_called_once_with(progress=100)
+        assert adaptor._unreal_state_event.is_set()
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_handle_client_event_chunk_complete(self, mock_update_status: Mock, init_data: dict):
+        """Tests that the chunk complete event updates the status and doesn't complete the task"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._unreal_state_event.clear()
+
+        # WHEN
+        adaptor.handle_client_event(
+            {"type": "chunk_complete", "chunk": 3, "chunks_done": 1, "chunks_total": 2}
+        )
+
+        # THEN
+        mock_update_status.assert_called_once_with(status_message="Rendered chunk 3 (1/2)")
+        assert not adaptor._unreal_state_event.is_set()
+
+    def test_handle_client_event_error(self, init_data: dict):
+        """Tests that the error event halts the adaptor"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._unreal_state_event.clear()
+
+        # WHEN
+        adaptor.handle_client_event({"type": "error", "message": "Something Bad Happened!"})
+
+        # THEN
+        assert str(adaptor._exc_info) == "Unreal Encountered an Error: Something Bad Happened!"
+        assert adaptor._unreal_state_event.is_set()
+
+    @pytest.mark.parametrize(
+        "event", [{"type": "foo"}, {"type": "progress"}, {"type": "progress", "progress": "bar"}]
+    )
+    def test_handle_client_event_invalid(self, init_data: dict, event: dict):
+        """Tests that the invalid events are rejected"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+
+        # WHEN
+        with pytest.raises(ValueError):
+            adaptor.handle_client_event(event)
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_regex_fallback_with_client_events(self, mock_update_status: Mock, init_data: dict):
+        """
+        Tests that the regex callbacks stay active when the UnrealClient sends the structured
+        events, so the lost complete event doesn't hang the task, and the task is completed once
+        """
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        regex_callbacks = adaptor._get_regex_callbacks()
+        adaptor.handle_client_event({"type": "client_loaded"})
+        adaptor._unreal_state_event.clear()
+
+        # WHEN
+        adaptor._handle_complete(
+            regex_callbacks[1].regex_list[0].search("Render Executor: Rendering is complete")  # type: ignore
+        )
+        adaptor.handle_client_event({"type": "complete"})
+
+        # THEN
+        mock_update_status.assert_called_once_with(progress=100)
+        assert adaptor._unreal_state_event.is_set()
+        assert adaptor._task_completed
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_previous_task_log_ignored(self, mock_update_status: Mock, init_data: dict):
+        """
+        Tests that the complete log line of the previous task, read after the next task started,
+        doesn't complete the next task
+        """
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        regex_callbacks = adaptor._get_regex_callbacks()
+        complete_regex = regex_callbacks[1].regex_list[0]
+        task_started_regex = regex_callbacks[-1].regex_list[0]
+        adaptor._handle_task_started(
+            task_started_regex.search("LogPython: Step Handler: Task 1 started")  # type: ignore
+        )
+        adaptor._task_id = 2
+        adaptor._unreal_state_event.clear()
+
+        # WHEN
+        adaptor._handle_complete(
+            complete_regex.search("Render Executor: Rendering is complete")  # type: ignore
+        )
+
+        # THEN
+        mock_update_status.assert_not_called()
+        assert not adaptor._unreal_state_event.is_set()
+
+        # WHEN
+        adaptor._handle_task_started(
+            task_started_regex.search("LogPython: Step Handler: Task 2 started")  # type: ignore
+        )
+        adaptor._handle_complete(
+            complete_regex.search("Render Executor: Rendering is complete")  # type: ignore
+        )
+
+        # THEN
+        mock_update_status.assert_called_once_with(progress=100)
+        assert adaptor._unreal_state_event.is_set()
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_previous_task_events_ignored(self, mock_update_status: Mock, init_data: dict):
+        """Tests that the events of the previous task don't affect the current task"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._task_id = 2
+        adaptor._unreal_state_event.clear()
+
+        # WHEN
+        adaptor.handle_client_event({"type": "progress", "progress": 50.0, "task_id": 1})
+        adaptor.handle_client_event({"type": "complete", "task_id": 1})
+        adaptor.handle_client_event({"type": "error", "message": "Late", "task_id": 1})
+
+        # THEN
+        mock_update_status.assert_not_called()
+        assert not adaptor._unreal_state_event.is_set()
+        assert adaptor._exc_info is None
+
+        # WHEN
+        adaptor.handle_client_event({"type": "complete", "task_id": 2})
+
+        # THEN
+        mock_update_status.assert_called_once_with(progress=100)
+        assert adaptor._unreal_state_event.is_set()
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_complete_once_per_task(self, mock_update_status: Mock, init_data: dict):
+        """Tests that the completion of the previous task doesn't complete the next one"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        adaptor.handle_client_event({"type": "complete"})
+        adaptor._unreal_state_event.clear()
+
+        # WHEN
+        adaptor.handle_client_event({"type": "complete"})
+
+        # THEN
+        assert not adaptor._unreal_state_event.is_set()
+
+        # WHEN
+        adaptor._task_completed = False
+        adaptor.handle_client_event({"type": "complete"})
+
+        # THEN
+        assert adaptor._unreal_state_event.is_set()
+
+    handle_progress_params = [(0, "Render Executor: Progress: 99.0", 99)]
+
+    @pytest.mark.parametrize("regex_index, stdout, expected_progress", handle_progress_params)
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_handle_progress(
+        self,
+        mock_update_status: Mock,
+        regex_index: int,
+        stdout: str,
         expected_progress: float,
         init_data: dict,
     ) -> None:
@@ -655,7 +1610,11 @@ class TestUnrealAdaptor_on_cleanup:
             (
                 "Render Executor: Error: Error encountered when initializing Unreal - Please check the logs.",
                 re.compile(".*Exception:.*|.*Render Executor: Error:.*"),
-            )
+            ),
+            (
+                "[2024.01.01-00.00.00:000][  1]LogPython: Render Executor: Error: Can't load the map",
+                re.compile("Exception:.*|Render Executor: Error:.*"),
+            ),
         ],
     )
     def test_handle_error(self, init_data: dict, stdout: str, error_regex: re.Pattern) -> None:
@@ -674,6 +1633,25 @@ class TestUnrealAdaptor_on_cleanup:
         assert match is not None
         assert str(adaptor._exc_info) == f"Unreal Encountered an Error: {stdout}"
 
+    @patch("deadline.unreal_adaptor.UnrealClient.step_handlers.get_step_handler_class")
+    def test_regex_keywords_of_handler_without_keywords(
+        self, mock_get_step_handler_class: Mock, init_data: dict
+    ) -> None:
+        """Tests that the prefilter is disabled if any step handler has no regex keywords"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        mock_get_step_handler_class.side_effect = lambda handler_name: Mock(
+            regex_keywords=Mock(
+                return_value=["Render Executor"] if handler_name == "render" else []
+            )
+        )
+
+        # WHEN
+        keywords = adaptor._get_regex_keywords()
+
+        # THEN
+        assert keywords == []
+
     @pytest.mark.parametrize("adaptor_exc_info", [RuntimeError("Something Bad Happened!"), None])
     def test_has_exception(self, init_data: dict, adaptor_exc_info: Exception | None) -> None:
         """
@@ -0,0 +1,119 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import json
+import threading
+from http import HTTPStatus
+from unittest.mock import Mock
+
+import pytest
+
+from openjd.adaptor_runtime.application_ipc import ActionsQueue
+from openjd.adaptor_runtime_client import ClientInterface
+
+from deadline.unreal_adaptor.UnrealAdaptor.adaptor_server import (
+    AdaptorServer,
+    handle_event_request,
+)
+
+
+class EventClient(ClientInterface):
+    """Client that only sends the events"""
+
+    def close(self, args=None) -> None:
+        pass
+
+    def graceful_shutdown(self, signum, frame) -> None:
+        pass
+
+    def send_event(self, event: dict):
+        return self._send_request("PUT", "/event", query_string_params={"event": json.dumps(event)})
+
+
+class TestHandleEventRequest:
+    """
+    Tests for the handle_event_request
+    """
+
+    def test_event_passed_to_adaptor(self) -> None:
+        """Tests that the event is parsed and passed to the adaptor"""
+        # GIVEN
+        server = Mock()
+        event = {"type": "progress", "progress": 10.0, "frame": 1}
+
+        # WHEN
+        status, body = handle_event_request(server, {"event": [json.dumps(event)]})
+
+        # THEN
+        assert status == HTTPStatus.OK
+        server.adaptor.handle_client_event.assert_called_once_with(event)
+
+    @pytest.mark.parametrize(
+        "query_string_params",
+        [{}, {"event": []}, {"event": ["{not json"]}, {"event": ["[1, 2]"]}, {"event": ["{}"]}],
+    )
+    def test_bad_request(self, query_string_params: dict) -> None:
+        """Tests that the invalid events are rejected and not passed to the adaptor"""
+        # GIVEN
+        server = Mock()
+
+        # WHEN
+        status, body = handle_event_request(server, query_string_params)
+
+        # THEN
+        assert status == HTTPStatus.BAD_REQUEST
+        server.adaptor.handle_client_event.assert_not_called()
+
+    def test_adaptor_rejects_event(self) -> None:
+        """Tests that the event the adaptor can't handle is responded with the bad request"""
+        # GIVEN
+        server = Mock()
+        server.adaptor.handle_client_event.side_effect = ValueError("Unknown client event type")
+
+        # WHEN
+        status, body = handle_event_request(server, {"event": ['{"type": "foo"}']})
+
+        # THEN
+        assert status == HTTPStatus.BAD_REQUEST
+        assert body == "Unknown client event type"
+
+    def test_adaptor_without_events(self) -> None:
+        """Tests that the events are not accepted by the adaptor that doesn't handle them"""
+        # GIVEN
+        server = Mock()
+        server.adaptor = object()
+
+        # WHEN
+        status, body = handle_event_request(server, {"event": ['{"type": "complete"}']})
+
+        # THEN
+        assert status == HTTPStatus.NOT_IMPLEMENTED
+
+
+@pytest.mark.skipif(os.name != "posix", reason="The adaptor server uses UNIX sockets")
+class TestEventEndpoint:
+    """
+    Tests for the /event requests sent to the running AdaptorServer
+    """
+
+    def test_event_sent_over_socket(self) -> None:
+        """Tests that the event sent by the client over the socket reaches the adaptor"""
+        # GIVEN
+        adaptor = Mock()
+        server = AdaptorServer(ActionsQueue(), adaptor)
+        server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+        server_thread.start()
+        event = {"type": "progress", "progress": 50.0, "frame": 5, "shot": "sh010"}
+
+        try:
+            # WHEN
+            response = EventClient(server.server_path).send_event(event)
+        finally:
+            server.shutdown()
+            server_thread.join()
+
+        # THEN
+        assert response.status == HTTPStatus.OK
+        adaptor.handle_client_event.assert_called_once_with(event)
@@ -0,0 +1,121 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealAdaptor.asset_registry_cache import AssetRegistryCache
+
+
+def write_file(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+class TestAssetRegistryCache:
+    """
+    Tests for the AssetRegistryCache
+    """
+
+    @pytest.fixture
+    def project_dir(self, tmp_path) -> str:
+        project_dir = str(tmp_path / "Project")
+        write_file(os.path.join(project_dir, "Project.uproject"), b"{}")
+        write_file(os.path.join(project_dir, "Content", "Maps", "Main.umap"), b"map")
+        write_file(os.path.join(project_dir, "Content", "Props", "Chair.uasset"), b"chair")
+        write_file(os.path.join(project_dir, "Plugins", "Tools", "Content", "Tool.uasset"), b"tool")
+        return project_dir
+
+    @pytest.fixture
+    def cache(self, tmp_path, project_dir: str) -> AssetRegistryCache:
+        return AssetRegistryCache(
+            cache_path=str(tmp_path / "Cache"),
+            project_path=os.path.join(project_dir, "Project.uproject"),
+        )
+
+    def test_store_and_restore(self, tmp_path, project_dir: str, cache: AssetRegistryCache) -> None:
+        """Tests that the stored asset registry state is restored to the next session"""
+        # GIVEN
+        registry_file = os.path.join(project_dir, "Intermediate", "CachedAssetRegistry_0.bin")
+        assert not cache.restore()
+        write_file(registry_file, b"registry")
+        assert cache.store()
+        os.remove(registry_file)
+
+        # WHEN
+        next_session_cache = AssetRegistryCache(
+            cache_path=str(tmp_path / "Cache"),
+            project_path=os.path.join(project_dir, "Project.uproject"),
+        )
+        restored = next_session_cache.restore()
+
+        # THEN
+        assert restored
+        with open(registry_file, "rb") as f:
+            assert f.read() == b"registry"
+
+    def test_content_change_is_miss(self, project_dir: str, cache: AssetRegistryCache) -> None:
+        """Tests that the changed content doesn't restore the state of the previous content"""
+        # GIVEN
+        manifest_hash = cache.get_manifest_hash()
+        write_file(os.path.join(project_dir, "Intermediate", "CachedAssetRegistry_0.bin"), b"r")
+        assert cache.store()
+
+        # WHEN
+        write_file(os.path.join(project_dir, "Content", "Props", "Table.uasset"), b"table")
+        write_file(os.path.join(project_dir, "Content", "Readme.txt"), b"not an asset")
+
+        # THEN
+        assert cache.get_manifest_hash() != manifest_hash
+        assert not cache.restore()
+
+    def test_content_changed_during_session(
+        self, project_dir: str, cache: AssetRegistryCache
+    ) -> None:
+        """Tests that nothing is stored if the content changed since the restore"""
+        # GIVEN
+        cache.restore()
+        write_file(os.path.join(project_dir, "Intermediate", "CachedAssetRegistry_0.bin"), b"r")
+
+        # WHEN
+        write_file(os.path.join(project_dir, "Content", "Props", "Chair.uasset"), b"new chair")
+
+        # THEN
+        assert not cache.store()
+
+    def test_project_key(self, tmp_path, project_dir: str) -> None:
+        """Tests that the projects with the same name in the other directories don't share the cache"""
+        # GIVEN
+        other_project_dir = str(tmp_path / "Other" / "Project")
+
+        # WHEN
+        cache = AssetRegistryCache(str(tmp_path), os.path.join(project_dir, "Project.uproject"))
+        other_cache = AssetRegistryCache(
+            str(tmp_path), os.path.join(other_project_dir, "Project.uproject")
+        )
+
+        # THEN
+        assert cache.project_cache_path != other_cache.project_cache_path
+        assert os.path.basename(cache.project_cache_path).startswith("Project-")
+
+    def test_evict_entries(self, tmp_path, project_dir: str) -> None:
+        """Tests that only the most recently used entries are kept"""
+        # GIVEN
+        cache = AssetRegistryCache(
+            str(tmp_path / "Cache"), os.path.join(project_dir, "Project.uproject"), max_entries=2
+        )
+        write_file(os.path.join(project_dir, "Intermediate", "CachedAssetRegistry_0.bin"), b"r")
+
+        # WHEN
+        for version in range(3):
+            write_file(os.path.join(project_dir, "Content", "Version.uasset"), b"v" * version)
+            cache.restore()
+            assert cache.store()
+            entry_path = os.path.join(cache.project_cache_path, cache.get_manifest_hash())
+            os.utime(entry_path, (1000 + version, 1000 + version))
+
+        # THEN
+        assert len(os.listdir(cache.project_cache_path)) == 2
@@ -0,0 +1,144 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealAdaptor.ddc import DerivedDataCacheStats, LocalDerivedDataCache
+
+
+def write_file(path: str, size: int, last_use: float) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"0" * size)
+    os.utime(path, (last_use, last_use))
+
+
+class TestLocalDerivedDataCache:
+    """
+    Tests for the LocalDerivedDataCache
+    """
+
+    def test_from_init_data(self, monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+        """Tests that the settings are read from the init_data and the path is expanded"""
+        # GIVEN
+        monkeypatch.setenv("DDC_ROOT", str(tmp_path))
+        init_data = {"ddc": {"path": "$DDC_ROOT/DDC", "max_size_gb": 2, "graph": "NoShared"}}
+
+        # WHEN
+        ddc = LocalDerivedDataCache.from_init_data(init_data)
+
+        # THEN
+        assert ddc is not None
+        assert ddc.path == os.path.join(str(tmp_path), "DDC")
+        assert ddc.max_size == 2 * LocalDerivedDataCache.BYTES_IN_GB
+        assert ddc.get_command_line_args() == [
+            f"-LocalDataCachePath={os.path.join(str(tmp_path), 'DDC')}",
+            "-ddc=NoShared",
+        ]
+        assert LocalDerivedDataCache.from_init_data({}) is None
+
+    def test_stats_log_cmds(self, tmp_path) -> None:
+        """Tests that the stats option enables the cache requests log of the editor"""
+        # WHEN
+        ddc = LocalDerivedDataCache.from_init_data(
+            {"ddc": {"path": str(tmp_path / "DDC"), "stats": True}}
+        )
+
+        # THEN
+        assert ddc is not None
+        assert ddc.get_command_line_args()[-1] == "-LogCmds=LogDerivedDataCache Verbose"
+
+    def test_prepare_creates_directory(self, tmp_path) -> None:
+        """Tests that the missing directory is created"""
+        # GIVEN
+        ddc = LocalDerivedDataCache(str(tmp_path / "DDC"), max_size=1000)
+
+        # WHEN
+        ddc.prepare()
+
+        # THEN
+        assert os.path.isdir(ddc.path)
+        assert ddc.get_size() == 0
+
+    def test_prepare_evicts_least_recently_used(self, tmp_path) -> None:
+        """Tests that the least recently used files are evicted down to the target ratio"""
+        # GIVEN
+        ddc = LocalDerivedDataCache(str(tmp_path), max_size=800)
+        write_file(str(tmp_path / "a" / "oldest.udd"), 300, last_use=1000)
+        write_file(str(tmp_path / "b" / "old.udd"), 300, last_use=2000)
+        write_file(str(tmp_path / "b" / "recent.udd"), 300, last_use=3000)
+        write_file(str(tmp_path / "c" / "newest.udd"), 300, last_use=4000)
+
+        # WHEN
+        ddc.prepare()
+
+        # THEN
+        assert not os.path.exists(tmp_path / "a")
+        assert not os.path.exists(tmp_path / "b" / "old.udd")
+        assert os.path.exists(tmp_path / "b" / "recent.udd")
+        assert os.path.exists(tmp_path / "c" / "newest.udd")
+        assert ddc.get_size() == 600
+
+    def test_prepare_within_budget(self, tmp_path) -> None:
+        """Tests that nothing is evicted within the budget or without the budget"""
+        # GIVEN
+        write_file(str(tmp_path / "a.udd"), 500, last_use=1000)
+        write_file(str(tmp_path / "b.udd"), 500, last_use=2000)
+
+        # WHEN
+        LocalDerivedDataCache(str(tmp_path), max_size=1000).prepare()
+        LocalDerivedDataCache(str(tmp_path)).prepare()
+
+        # THEN
+        assert sorted(os.listdir(tmp_path)) == ["a.udd", "b.udd"]
+
+
+class TestDerivedDataCacheStats:
+    """
+    Tests for the DerivedDataCacheStats
+    """
+
+    def test_observe_line(self) -> None:
+        """Tests that the hits and the misses are counted from the editor log"""
+        # GIVEN
+        stats = DerivedDataCacheStats()
+
+        # WHEN
+        for line in [
+            "LogDerivedDataCache: Verbose: Local: Cache hit on SHADERCACHE_1",
+            "LogDerivedDataCache: Verbose: Local: Cache hit on SHADERCACHE_2",
+            "LogDerivedDataCache: Verbose: Local: Cache miss on SHADERCACHE_3",
+            "LogDerivedDataCache: Display: Maintenance finished",
+            "LogShaderCompilers: Display: Cache hit is not a DDC line",
+        ]:
+            stats.observe_line(line)
+
+        # THEN
+        assert stats.hits == 2
+        assert stats.misses == 1
+        assert "2 hits, 1 misses (hit rate 66.7%)" in stats.summary()
+
+    def test_reset(self) -> None:
+        """Tests that the statistics after the reset cover only the later requests"""
+        # GIVEN
+        stats = DerivedDataCacheStats()
+        stats.observe_line("LogDerivedDataCache: Verbose: Local: Cache miss on SHADERCACHE_1")
+
+        # WHEN
+        stats.reset()
+        stats.observe_line("LogDerivedDataCache: Verbose: Local: Cache hit on SHADERCACHE_1")
+
+        # THEN
+        assert (stats.hits, stats.misses) == (1, 0)
+        assert (
+            stats.summary("task") == "DerivedDataCache (task): 1 hits, 0 misses (hit rate 100.0%)"
+        )
+
+    def test_no_requests(self) -> None:
+        """Tests the summary without the cache requests"""
+        stats = DerivedDataCacheStats()
+        assert stats.hit_rate is None
+        assert "no cache requests" in stats.summary()
@@ -0,0 +1,130 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import gzip
+import logging
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealAdaptor.log_policy import UnrealLogArchive, UnrealLogPolicy
+
+
+STDOUT_LEVEL = logging.getLevelName("STDOUT")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+def make_record(line: str, level: int = STDOUT_LEVEL) -> logging.LogRecord:
+    return logging.LogRecord("unreal_output", level, __file__, 0, line, None, None)
+
+
+class TestUnrealLogPolicy:
+    """
+    Tests for the UnrealLogPolicy
+    """
+
+    @pytest.mark.parametrize(
+        "line, expected",
+        [
+            ("LogShaderCompilers: Display: Shaders left to compile 10", False),
+            ("[2024.01.01-12.00.00:000][  0]LogShaderCompilers: Warning: Slow shader", False),
+            ("LogShaderCompilers: Error: Shader failed", True),
+            ("LogStreaming: Display: Flushing async loaders", False),
+            ("LogStreaming: Warning: Failed to read file", True),
+            ("LogMovieRenderPipeline: Render Executor: Frame 1/10", True),
+            ("LogMovieRenderPipeline: Verbose: Tick", False),
+            ("Signal 11 caught.", True),
+        ],
+    )
+    def test_category_verbosity(self, line: str, expected: bool) -> None:
+        """Tests that the lines are filtered by the category verbosity and errors always pass"""
+        # GIVEN
+        policy = UnrealLogPolicy(
+            verbosity="Warning",
+            category_verbosity={"LogShaderCompilers": "NoLogging", "LogMovieRenderPipeline": "Log"},
+        )
+
+        # WHEN
+        passed = policy.filter(make_record(line))
+
+        # THEN
+        assert passed == expected
+        assert policy.dropped_lines == (0 if expected else 1)
+
+    def test_other_records_not_filtered(self) -> None:
+        """Tests that the records not from the Unreal output always pass"""
+        # GIVEN
+        policy = UnrealLogPolicy(verbosity="NoLogging")
+
+        # WHEN
+        passed = policy.filter(make_record("LogInit: Running command", level=logging.INFO))
+
+        # THEN
+        assert passed
+
+    def test_unknown_verbosity(self) -> None:
+        """Tests that the unknown verbosity is rejected"""
+        with pytest.raises(ValueError):
+            UnrealLogPolicy(category_verbosity={"LogInit": "Loud"})
+
+    def test_sampling(self) -> None:
+        """Tests that the similar lines are suppressed in the sample interval and counted"""
+        # GIVEN
+        clock = FakeClock()
+        policy = UnrealLogPolicy(sample_interval=10, clock=clock)
+        passed_lines = []
+
+        # WHEN
+        for time, line in [
+            (0, "LogRenderer: Display: Reallocating scene render targets to 1920x1080"),
+            (1, "LogRenderer: Display: Reallocating scene render targets to 1920x1088"),
+            (2, "LogInit: Display: Engine is initialized"),
+            (3, "LogRenderer: Display: Reallocating scene render targets to 3840x2160"),
+            (11, "LogRenderer: Display: Reallocating scene render targets to 1920x1080"),
+        ]:
+            clock.time = time
+            record = make_record(line)
+            if policy.filter(record):
+                passed_lines.append(record.getMessage())
+
+        # THEN
+        assert passed_lines == [
+            "LogRenderer: Display: Reallocating scene render targets to 1920x1080",
+            "LogInit: Display: Engine is initialized",
+            "LogRenderer: Display: Reallocating scene render targets to 1920x1080 "
+            "(suppressed 2 similar lines)",
+        ]
+        assert policy.sampled_lines == 2
+        assert "suppressed 2 lines" in policy.summary()
+
+
+class TestUnrealLogArchive:
+    """
+    Tests for the UnrealLogArchive
+    """
+
+    def test_write_lines(self, tmp_path) -> None:
+        """Tests that the lines are written to the gzip file and ignored after close"""
+        # GIVEN
+        path = str(tmp_path / "unreal_output.log.gz")
+        archive = UnrealLogArchive(path)
+
+        # WHEN
+        archive.write_line("LogInit: Display: Engine is initialized")
+        archive.write_line("LogPython: UnrealClient loaded")
+        archive.close()
+        archive.write_line("LogExit: Exiting.")
+
+        # THEN
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            assert f.read().splitlines() == [
+                "LogInit: Display: Engine is initialized",
+                "LogPython: UnrealClient loaded",
+            ]
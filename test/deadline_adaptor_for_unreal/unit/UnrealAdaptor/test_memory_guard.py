@@ -0,0 +1,118 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealAdaptor.memory_guard import MemoryGuard
+from deadline.unreal_adaptor.UnrealAdaptor.process_stats import get_memory_usage
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+class FakeMemoryUsage:
+    def __init__(self) -> None:
+        self.memory_usage: Optional[int] = 0
+        self.calls = 0
+
+    def __call__(self) -> Optional[int]:
+        self.calls += 1
+        return self.memory_usage
+
+
+class TestMemoryGuard:
+    """
+    Tests for the MemoryGuard
+    """
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def memory_usage(self) -> FakeMemoryUsage:
+        return FakeMemoryUsage()
+
+    def test_sample_if_due(self, clock: FakeClock, memory_usage: FakeMemoryUsage) -> None:
+        """Tests that the memory is sampled at the bounded rate and the peak is tracked"""
+        # GIVEN
+        guard = MemoryGuard(memory_usage=memory_usage, sample_interval=30, clock=clock)
+
+        # WHEN
+        for time, usage in [(0, 100), (10, 500), (30, 300), (59, 700), (60, 200)]:
+            clock.time = time
+            memory_usage.memory_usage = usage
+            guard.sample_if_due()
+
+        # THEN
+        assert memory_usage.calls == 3
+        assert guard.last_usage == 200
+        assert guard.peak_usage == 300
+
+    @pytest.mark.parametrize(
+        "max_memory, usage, expected",
+        [(None, 4096, False), (1024, 1024, False), (1024, 1025, True), (1024, None, False)],
+    )
+    def test_is_exceeded(
+        self,
+        memory_usage: FakeMemoryUsage,
+        max_memory: Optional[int],
+        usage: Optional[int],
+        expected: bool,
+    ) -> None:
+        """Tests that the fresh sample is compared to the ceiling and no ceiling is never exceeded"""
+        # GIVEN
+        guard = MemoryGuard(memory_usage=memory_usage, max_memory=max_memory)
+        memory_usage.memory_usage = usage
+
+        # WHEN
+        exceeded = guard.is_exceeded()
+
+        # THEN
+        assert exceeded == expected
+
+    def test_reset(self, memory_usage: FakeMemoryUsage) -> None:
+        """Tests that the reset forgets the samples"""
+        # GIVEN
+        guard = MemoryGuard(memory_usage=memory_usage)
+        memory_usage.memory_usage = 2048
+        guard.sample()
+
+        # WHEN
+        guard.reset()
+
+        # THEN
+        assert guard.last_usage is None
+        assert guard.peak_usage is None
+
+    def test_to_mb(self) -> None:
+        """Tests the conversion of bytes to megabytes"""
+        assert MemoryGuard.to_mb(3 * MemoryGuard.BYTES_IN_MB // 2) == 1.5
+        assert MemoryGuard.to_mb(None) is None
+
+
+class TestGetMemoryUsage:
+    """
+    Tests for the get_memory_usage
+    """
+
+    @pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="Requires /proc")
+    def test_current_process(self) -> None:
+        """Tests that the memory of the running process is read, children included or not"""
+        own_usage = get_memory_usage(os.getpid(), include_children=False)
+        total_usage = get_memory_usage(os.getpid())
+        assert own_usage is not None and own_usage > 0
+        assert total_usage is not None and total_usage > 0
+
+    def test_not_existing_process(self) -> None:
+        """Tests that None is returned for the process that doesn't exist"""
+        assert get_memory_usage(2**31 - 1) is None
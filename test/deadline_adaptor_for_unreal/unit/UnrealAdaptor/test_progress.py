@@ -0,0 +1,145 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealAdaptor.progress import ProgressCoalescer
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+class TestProgressCoalescer:
+    """
+    Tests for the ProgressCoalescer
+    """
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def report(self) -> Mock:
+        return Mock()
+
+    @pytest.fixture
+    def coalescer(self, report: Mock, clock: FakeClock) -> ProgressCoalescer:
+        return ProgressCoalescer(report, min_interval=1.0, min_delta=1.0, clock=clock)
+
+    def test_first_update_reported(self, coalescer: ProgressCoalescer, report: Mock) -> None:
+        """Tests that the first progress of the task is reported immediately"""
+        # WHEN
+        coalescer.update(5)
+
+        # THEN
+        report.assert_called_once_with(5)
+
+    def test_updates_within_interval_coalesced(
+        self, coalescer: ProgressCoalescer, report: Mock, clock: FakeClock
+    ) -> None:
+        """Tests that the progress reported every frame is sent at most once per interval"""
+        # WHEN
+        for frame in range(600):
+            clock.time = frame / 60
+            coalescer.update(frame // 6)
+
+        # THEN
+        assert report.call_count == 10
+        assert [call.args[0] for call in report.call_args_list] == [
+            0,
+            10,
+            20,
+            30,
+            40,
+            50,
+            60,
+            70,
+            80,
+            90,
+        ]
+
+    def test_repeated_progress_not_reported(
+        self, coalescer: ProgressCoalescer, report: Mock, clock: FakeClock
+    ) -> None:
+        """Tests that the same progress value is not reported twice"""
+        # WHEN
+        coalescer.update(5)
+        clock.time = 10
+        coalescer.update(5)
+        coalescer.flush_if_due()
+        coalescer.flush()
+
+        # THEN
+        report.assert_called_once_with(5)
+
+    def test_small_delta_not_reported(self, report: Mock, clock: FakeClock) -> None:
+        """Tests that the progress is not reported until it changes by the minimum delta"""
+        # GIVEN
+        coalescer = ProgressCoalescer(report, min_interval=0, min_delta=5, clock=clock)
+
+        # WHEN
+        for progress in range(8):
+            coalescer.update(progress)
+
+        # THEN
+        assert [call.args[0] for call in report.call_args_list] == [0, 5]
+
+    def test_complete_reported_immediately(
+        self, coalescer: ProgressCoalescer, report: Mock
+    ) -> None:
+        """Tests that 100% is reported regardless of the interval"""
+        # WHEN
+        coalescer.update(99)
+        coalescer.update(100)
+
+        # THEN
+        assert [call.args[0] for call in report.call_args_list] == [99, 100]
+
+    def test_flush_if_due(
+        self, coalescer: ProgressCoalescer, report: Mock, clock: FakeClock
+    ) -> None:
+        """Tests that the pending progress is reported once the interval passed"""
+        # GIVEN
+        coalescer.update(1)
+        coalescer.update(2)
+
+        # WHEN
+        coalescer.flush_if_due()
+        clock.time = 1
+        coalescer.flush_if_due()
+
+        # THEN
+        assert [call.args[0] for call in report.call_args_list] == [1, 2]
+
+    def test_flush(self, coalescer: ProgressCoalescer, report: Mock) -> None:
+        """Tests that the pending progress is reported immediately on flush"""
+        # GIVEN
+        coalescer.update(1)
+        coalescer.update(2)
+
+        # WHEN
+        coalescer.flush()
+        coalescer.flush()
+
+        # THEN
+        assert [call.args[0] for call in report.call_args_list] == [1, 2]
+
+    def test_reset(self, coalescer: ProgressCoalescer, report: Mock) -> None:
+        """Tests that the next task progress is reported immediately after reset"""
+        # GIVEN
+        coalescer.update(100)
+
+        # WHEN
+        coalescer.reset()
+        coalescer.update(0)
+
+        # THEN
+        assert [call.args[0] for call in report.call_args_list] == [100, 0]
@@ -0,0 +1,200 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import logging
+import re
+from unittest.mock import Mock
+
+import pytest
+
+from openjd.adaptor_runtime.app_handlers import RegexCallback, RegexHandler
+
+from deadline.unreal_adaptor.UnrealAdaptor.adaptor import UnrealAdaptor
+from deadline.unreal_adaptor.UnrealAdaptor.regex_handler import PrefilteredRegexHandler
+
+
+def _record(msg: str) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 0, msg, None, None)
+
+
+class TestPrefilteredRegexHandler:
+    """
+    Tests for the PrefilteredRegexHandler
+    """
+
+    @pytest.fixture
+    def callbacks(self) -> tuple[Mock, Mock, Mock]:
+        return Mock(), Mock(), Mock()
+
+    @pytest.fixture
+    def handler(self, callbacks: tuple[Mock, Mock, Mock]) -> PrefilteredRegexHandler:
+        progress, complete, error = callbacks
+        return PrefilteredRegexHandler(
+            [
+                RegexCallback([re.compile("Render Executor: Progress: ([0-9.]+)")], progress),
+                RegexCallback(
+                    [
+                        re.compile("Render Executor: Rendering is complete"),
+                        re.compile(" finished ([0-9]+) jobs in .*"),
+                    ],
+                    complete,
+                ),
+                RegexCallback([re.compile("Exception:.*|LogPython: Error:.*")], error),
+                RegexCallback([re.compile("Exception:.*|LogPython: Error:.*")], error),
+            ],
+            keywords=["Render Executor", " finished ", "Exception:", "LogPython: Error:"],
+        )
+
+    @pytest.mark.parametrize(
+        "msg, callback_index, expected_group",
+        [
+            ("[2024.01.01-00.00.00:000][  1]LogPython: Render Executor: Progress: 42.5", 0, "42.5"),
+            ("LogPython: Render Executor: Rendering is complete", 1, None),
+            ("LogMoviePipeline: Remote executor finished 3 jobs in 10.0s", 1, "3"),
+            ("LogPython: Error: Exception: Something Bad Happened!", 2, None),
+        ],
+    )
+    def test_emit_calls_matched_callback(
+        self,
+        handler: PrefilteredRegexHandler,
+        callbacks: tuple[Mock, Mock, Mock],
+        msg: str,
+        callback_index: int,
+        expected_group: str | None,
+    ) -> None:
+        """Tests that only the matched callback is called once with its own regex match"""
+        # WHEN
+        handler.emit(_record(msg))
+
+        # THEN
+        for index, callback in enumerate(callbacks):
+            if index == callback_index:
+                callback.assert_called_once()
+                match = callback.call_args.args[0]
+                if expected_group is not None:
+                    assert match.groups()[0] == expected_group
+            else:
+                callback.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "msg",
+        [
+            "LogShaderCompilers: Display: Shaders left to compile 1234",
+            "LogPython: Render Executor started",
+            "",
+        ],
+    )
+    def test_emit_skips_unmatched_lines(
+        self, handler: PrefilteredRegexHandler, callbacks: tuple[Mock, Mock, Mock], msg: str
+    ) -> None:
+        """Tests that lines without keywords or matches do not call any callback"""
+        # WHEN
+        handler.emit(_record(msg))
+
+        # THEN
+        for callback in callbacks:
+            callback.assert_not_called()
+
+    def test_duplicated_patterns_are_combined_once(self, handler: PrefilteredRegexHandler) -> None:
+        """Tests that the same pattern is added to the combined pattern only once"""
+        # THEN
+        assert handler._combined_pattern is not None
+        assert handler._combined_pattern.pattern.count("LogPython: Error:") == 1
+
+    def test_emit_calls_all_matched_callbacks(
+        self, handler: PrefilteredRegexHandler, callbacks: tuple[Mock, Mock, Mock]
+    ) -> None:
+        """Tests that the line matched by the patterns of several callbacks is dispatched to all of them"""
+        # GIVEN
+        progress, complete, error = callbacks
+        msg = "LogPython: Render Executor: Progress: 100 Exception: Something Bad Happened!"
+
+        # WHEN
+        handler.emit(_record(msg))
+
+        # THEN
+        assert progress.call_args.args[0].groups()[0] == "100"
+        complete.assert_not_called()
+        error.assert_called_once()
+        assert error.call_args.args[0].string == msg
+
+    def test_dispatches_like_regex_handler(self) -> None:
+        """Tests that the adaptor callbacks get the same matches as with the default RegexHandler"""
+        # GIVEN
+        adaptor = UnrealAdaptor({"project_path": "C:/LocalProjects/AWS_RND/AWS_RND.uproject"})
+        lines = [
+            "LogShaderCompilers: Display: Shaders left to compile 1234",
+            "LogPython: Render Executor started frame 10",
+            "LogPython: Render Executor: Progress: 10.0",
+            "LogPython: Custom Step Executor: Progress: 20.0",
+            "LogPython: Render Executor: Rendering is complete",
+            "LogMoviePipeline: Remote executor finished 3 jobs in 10.0s",
+            "LogPython: Custom Step Executor: Complete: None",
+            "LogPython: Error: Exception: Something Bad Happened!",
+        ]
+
+        def dispatch(handler_class: type, **kwargs) -> list[list[tuple[str, tuple]]]:
+            callbacks = [Mock() for _ in adaptor._get_regex_callbacks()]
+            handler = handler_class(
+                [
+                    RegexCallback(regex_callback.regex_list, callback)
+                    for regex_callback, callback in zip(adaptor._get_regex_callbacks(), callbacks)
+                ],
+                **kwargs,
+            )
+            for line in lines:
+                handler.emit(_record(line))
+            return [
+                [(c.args[0].group(0), c.args[0].groups()) for c in callback.call_args_list]
+                for callback in callbacks
+            ]
+
+        # WHEN
+        default_calls = dispatch(RegexHandler)
+        prefiltered_calls = dispatch(
+            PrefilteredRegexHandler, keywords=adaptor._get_regex_keywords()
+        )
+
+        # THEN
+        assert prefiltered_calls == default_calls
+        assert any(default_calls)
+
+    def test_emit_without_callbacks(self) -> None:
+        """Tests that the handler without callbacks ignores any line"""
+        # GIVEN
+        handler = PrefilteredRegexHandler([], keywords=[])
+
+        # WHEN
+        handler.emit(_record("Render Executor: Progress: 1"))
+
+        # THEN
+        assert handler._combined_pattern is None
+
+    @pytest.mark.parametrize(
+        "msg",
+        [
+            "LogPython: Render Executor: Progress: 10",
+            "LogPython: Render Executor: Rendering is complete",
+            "LogPython: Custom Step Executor: Progress: 10",
+            "LogPython: Custom Step Executor: Complete",
+            "LogPython: Error: Exception: Something Bad Happened!",
+            "LogPython: Custom Step Executor: Error: Something Bad Happened!",
+        ],
+    )
+    def test_step_handler_keywords_cover_patterns(self, msg: str) -> None:
+        """Tests that the step handler keywords let through every line the step handler patterns match"""
+        # GIVEN
+        adaptor = UnrealAdaptor({"project_path": "C:/LocalProjects/AWS_RND/AWS_RND.uproject"})
+        callback = Mock()
+        regex_callbacks = [
+            RegexCallback(regex_callback.regex_list, callback)
+            for regex_callback in adaptor._get_regex_callbacks()
+        ]
+        handler = PrefilteredRegexHandler(regex_callbacks, keywords=adaptor._get_regex_keywords())
+
+        # WHEN
+        handler.emit(_record(msg))
+
+        # THEN
+        callback.assert_called_once()
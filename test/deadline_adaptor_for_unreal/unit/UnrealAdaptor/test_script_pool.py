@@ -0,0 +1,124 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import time
+import threading
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealAdaptor.script_pool import ScriptProcessPool
+
+
+class TestScriptProcessPool:
+    """
+    Tests for the ScriptProcessPool
+    """
+
+    @pytest.fixture
+    def pool(self):
+        pool = ScriptProcessPool(workers=1)
+        yield pool
+        pool.stop()
+
+    def test_from_init_data(self) -> None:
+        """Tests that the pool is created only for the sessions without the editor"""
+        # WHEN
+        editor_pool = ScriptProcessPool.from_init_data({"project_path": "Game.uproject"})
+        script_pool = ScriptProcessPool.from_init_data(
+            {
+                "project_path": "Game.uproject",
+                "requires_editor": False,
+                "script_pool": {"workers": 2},
+            }
+        )
+
+        # THEN
+        assert editor_pool is None
+        assert script_pool is not None
+        assert script_pool.workers == 2
+
+    def test_run(self, pool: ScriptProcessPool, tmp_path) -> None:
+        """Tests that the main of the script runs in the pool process with the arguments"""
+        # GIVEN
+        script_path = tmp_path / "pool_pid_script.py"
+        script_path.write_text(
+            "import os\n\ndef main(prefix):\n    return f'{prefix}{os.getpid()}'\n"
+        )
+
+        # WHEN
+        first_result = pool.run(str(script_path), {"prefix": "pid:"})
+        second_result = pool.run(str(script_path), {"prefix": "pid:"})
+
+        # THEN
+        assert first_result.startswith("pid:")
+        assert first_result != f"pid:{os.getpid()}"
+        assert first_result == second_result
+
+    @pytest.mark.parametrize(
+        "script, error",
+        [
+            ("def main():\n    raise ValueError('Broken script')\n", "Broken script"),
+            ("def not_main():\n    pass\n", "'main' method"),
+        ],
+    )
+    def test_run_error(self, pool: ScriptProcessPool, tmp_path, script: str, error: str) -> None:
+        """Tests that the script errors are raised by the adaptor process"""
+        # GIVEN
+        script_path = tmp_path / f"pool_error_script_{len(script)}.py"
+        script_path.write_text(script)
+
+        # WHEN
+        with pytest.raises(RuntimeError) as exc_info:
+            pool.run(str(script_path))
+
+        # THEN
+        assert error in str(exc_info.value)
+        assert str(script_path) in str(exc_info.value)
+
+    def test_run_progress(self, pool: ScriptProcessPool, tmp_path) -> None:
+        """Tests that the progress reported by the script is passed to the adaptor process"""
+        # GIVEN
+        script_path = tmp_path / "pool_progress_script.py"
+        script_path.write_text(
+            "def main(context):\n"
+            "    context.report_progress(25)\n"
+            "    context.report_progress(50)\n"
+            "    return 'done'\n"
+        )
+        progress: list[float] = []
+
+        # WHEN
+        result = pool.run(str(script_path), on_progress=progress.append)
+
+        # THEN
+        assert result == "done"
+        assert progress == [25.0, 50.0]
+
+    def test_cancel(self, pool: ScriptProcessPool, tmp_path) -> None:
+        """Tests that cancel interrupts the running script and the next run starts the pool again"""
+        # GIVEN
+        script_path = tmp_path / "pool_sleep_script.py"
+        script_path.write_text("import time\n\ndef main(seconds):\n    time.sleep(seconds)\n")
+        errors: list[Exception] = []
+
+        def run() -> None:
+            try:
+                pool.run(str(script_path), {"seconds": 60})
+            except RuntimeError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        time.sleep(0.5)
+
+        # WHEN
+        pool.cancel()
+        thread.join(timeout=10)
+
+        # THEN
+        assert not thread.is_alive()
+        assert len(errors) == 1
+        assert "cancelled" in str(errors[0])
+        assert pool.run(str(script_path), {"seconds": 0}) == "None"
@@ -0,0 +1,108 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealAdaptor.startup_profiler import StartupProfiler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+class TestStartupProfiler:
+    """
+    Tests for the StartupProfiler
+    """
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def profiler(self, clock: FakeClock) -> StartupProfiler:
+        profiler = StartupProfiler(clock=clock)
+        profiler.start()
+        return profiler
+
+    def test_phase(self, profiler: StartupProfiler, clock: FakeClock) -> None:
+        """Tests that the phase duration is recorded once"""
+        # WHEN
+        with profiler.phase("pythonpath_setup"):
+            clock.time += 2
+        profiler.record_phase("pythonpath_setup", 10)
+
+        # THEN
+        assert profiler.report()["phases"] == {"pythonpath_setup": 2}
+
+    def test_mark(self, profiler: StartupProfiler, clock: FakeClock) -> None:
+        """Tests that the milestone is counted from the start and recorded once"""
+        # WHEN
+        clock.time = 5
+        profiler.mark("first_run_script")
+        clock.time = 7
+        profiler.mark("first_run_script")
+
+        # THEN
+        assert profiler.report()["milestones"] == {"first_run_script": 5}
+
+    def test_observe_line(self, profiler: StartupProfiler, clock: FakeClock) -> None:
+        """Tests that the first stdout line and the log marker windows are recorded"""
+        # GIVEN
+        clock.time = 1
+        profiler.mark_spawn()
+
+        # WHEN
+        for time, line in [
+            (4, "LogInit: Display: Running engine for game: AWS_RND"),
+            (10, "LogShaderCompilers: Display: Shaders left to compile 1200"),
+            (12, "LogDerivedDataCache: Display: Maintenance finished"),
+            (30, "LogShaderCompilers: Display: Shaders left to compile 0"),
+            (31, "LogPython: UnrealClient loaded"),
+        ]:
+            clock.time = time
+            profiler.observe_line(line)
+
+        # THEN
+        report = profiler.report()
+        assert report["phases"] == {"first_stdout_line": 3}
+        assert report["log_markers"] == {
+            "shader_compilation": {"seconds": 20, "lines": 2},
+            "ddc": {"seconds": 0, "lines": 1},
+        }
+
+    def test_nothing_recorded_after_finish(
+        self, profiler: StartupProfiler, clock: FakeClock
+    ) -> None:
+        """Tests that the report doesn't change after the profiling is finished"""
+        # GIVEN
+        profiler.mark_spawn()
+        profiler.finish()
+
+        # WHEN
+        profiler.record_phase("asset_registry_wait", 1)
+        profiler.mark("first_run_script")
+        profiler.observe_line("LogShaderCompilers: Display: Shaders left to compile 0")
+
+        # THEN
+        assert profiler.finished
+        assert profiler.report() == {"phases": {}, "milestones": {}, "log_markers": {}}
+
+    def test_start_resets(self, profiler: StartupProfiler) -> None:
+        """Tests that the start forgets the previous session timings"""
+        # GIVEN
+        profiler.record_phase("unreal_start", 1)
+        profiler.finish()
+
+        # WHEN
+        profiler.start()
+
+        # THEN
+        assert profiler.started
+        assert not profiler.finished
+        assert profiler.report()["phases"] == {}
@@ -0,0 +1,178 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import sys
+import subprocess
+from typing import Optional
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealAdaptor.process_stats import (
+    ProcessTreeStats,
+    get_process_tree_stats,
+)
+from deadline.unreal_adaptor.UnrealAdaptor.task_metrics import TaskMetricsSampler
+
+
+# Fake editor: allocates the memory, writes the file and starts the child process
+# like the shader compile worker, then waits for the stdin to close
+FAKE_EDITOR_SCRIPT = """
+import os, sys, subprocess
+memory = bytearray(64 * 1024 * 1024)
+with open(sys.argv[1], "wb") as f:
+    f.write(os.urandom(1024 * 1024))
+    f.flush()
+    os.fsync(f.fileno())
+worker = subprocess.Popen([sys.executable, "-c", "import sys; sys.stdin.read()"], stdin=subprocess.PIPE)
+print("ready", flush=True)
+sys.stdin.read()
+worker.stdin.close()
+worker.wait()
+"""
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+class FakeProcessStats:
+    def __init__(self) -> None:
+        self.stats: Optional[ProcessTreeStats] = None
+
+    def set(self, cpu_time: float, rss: int, read_bytes: int, write_bytes: int) -> None:
+        self.stats = ProcessTreeStats(
+            cpu_time=cpu_time,
+            rss=rss,
+            read_bytes=read_bytes,
+            write_bytes=write_bytes,
+            process_count=2,
+        )
+
+    def __call__(self) -> Optional[ProcessTreeStats]:
+        return self.stats
+
+
+class TestTaskMetricsSampler:
+    """
+    Tests for the TaskMetricsSampler
+    """
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def process_stats(self) -> FakeProcessStats:
+        return FakeProcessStats()
+
+    def test_task_metrics(self, clock: FakeClock, process_stats: FakeProcessStats) -> None:
+        """Tests that the task metrics are the difference of the samples and the peak memory"""
+        # GIVEN
+        sampler = TaskMetricsSampler(process_stats=process_stats, clock=clock)
+        process_stats.set(cpu_time=10, rss=1000, read_bytes=100, write_bytes=50)
+        sampler.sample()
+
+        # WHEN
+        clock.time = 5
+        process_stats.set(cpu_time=12, rss=1500, read_bytes=300, write_bytes=50)
+        sampler.start_task()
+        for time, rss in [(10, 4000), (20, 2500)]:
+            clock.time = time
+            process_stats.set(cpu_time=30, rss=rss, read_bytes=800, write_bytes=450)
+            sampler.sample()
+        for shot, frame in [("sh010", 1), ("sh010", 2), ("sh010", 2), ("sh020", 1)]:
+            sampler.observe_frame(shot, frame)
+        clock.time = 25
+        metrics = sampler.finish_task()
+
+        # THEN
+        assert metrics is not None
+        assert metrics.wall_time == 20
+        assert metrics.cpu_time == 18
+        assert metrics.peak_rss == 4000
+        assert metrics.read_bytes == 500
+        assert metrics.write_bytes == 400
+        assert metrics.frames_rendered == 3
+        assert sampler.tasks_completed == 1
+
+    def test_finish_without_task(self, process_stats: FakeProcessStats) -> None:
+        """Tests that nothing is reported when no task was started"""
+        # GIVEN
+        sampler = TaskMetricsSampler(process_stats=process_stats)
+
+        # WHEN
+        sampler.observe_frame("sh010", 1)
+        metrics = sampler.finish_task()
+
+        # THEN
+        assert metrics is None
+        assert sampler.tasks_completed == 0
+
+    def test_textfile(self, tmp_path, clock: FakeClock, process_stats: FakeProcessStats) -> None:
+        """Tests that the Prometheus textfile is updated during the task and after it"""
+        # GIVEN
+        textfile_path = str(tmp_path / "unreal_adaptor.prom")
+        sampler = TaskMetricsSampler(
+            process_stats=process_stats, textfile_path=textfile_path, clock=clock
+        )
+        process_stats.set(cpu_time=0, rss=1000, read_bytes=0, write_bytes=0)
+
+        # WHEN
+        sampler.start_task()
+        clock.time = 3
+        sampler.sample()
+        with open(textfile_path) as f:
+            during_task = f.read().splitlines()
+        clock.time = 7
+        sampler.finish_task()
+        with open(textfile_path) as f:
+            after_task = f.read().splitlines()
+
+        # THEN
+        assert "unreal_adaptor_task_running 1" in during_task
+        assert "unreal_adaptor_task_wall_seconds 3.0" in during_task
+        assert "# TYPE unreal_adaptor_tasks_completed_total counter" in during_task
+        assert "unreal_adaptor_task_running 0" in after_task
+        assert "unreal_adaptor_tasks_completed_total 1" in after_task
+        assert "unreal_adaptor_task_wall_seconds 7.0" in after_task
+        assert "unreal_adaptor_rss_bytes 1000" in after_task
+        assert os.listdir(tmp_path) == ["unreal_adaptor.prom"]
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Requires /proc")
+    def test_fake_editor_process(self, tmp_path) -> None:
+        """Tests the metrics of the fake editor process tree read from /proc"""
+        # GIVEN
+        fake_editor = subprocess.Popen(
+            [sys.executable, "-c", FAKE_EDITOR_SCRIPT, str(tmp_path / "output.bin")],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        sampler = TaskMetricsSampler(process_stats=lambda: get_process_tree_stats(fake_editor.pid))
+
+        # WHEN
+        try:
+            sampler.start_task()
+            assert fake_editor.stdout is not None
+            assert fake_editor.stdout.readline().strip() == "ready"
+            stats = get_process_tree_stats(fake_editor.pid)
+            metrics = sampler.finish_task()
+        finally:
+            assert fake_editor.stdin is not None
+            fake_editor.stdin.close()
+            fake_editor.wait(timeout=30)
+
+        # THEN
+        assert stats is not None
+        assert stats.process_count == 2
+        assert stats.rss > 64 * 1024 * 1024
+        assert metrics is not None
+        assert metrics.peak_rss > 64 * 1024 * 1024
+        assert metrics.wall_time > 0
+        assert get_process_tree_stats(fake_editor.pid) is None
@@ -0,0 +1,178 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Optional
+from unittest.mock import Mock
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealAdaptor.process_stats import get_cpu_time
+from deadline.unreal_adaptor.UnrealAdaptor.watchdog import StallWatchdog
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+class FakeCpuTime:
+    def __init__(self) -> None:
+        self.cpu_time: Optional[float] = 0.0
+
+    def __call__(self) -> Optional[float]:
+        return self.cpu_time
+
+
+THRESHOLDS: dict[str, float] = {
+    StallWatchdog.STARTUP: 100,
+    StallWatchdog.ASSET_LOADING: 50,
+    StallWatchdog.RENDERING: 10,
+}
+
+
+class TestStallWatchdog:
+    """
+    Tests for the StallWatchdog
+    """
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def cpu_time(self) -> FakeCpuTime:
+        return FakeCpuTime()
+
+    @pytest.fixture
+    def watchdog(self, clock: FakeClock, cpu_time: FakeCpuTime) -> StallWatchdog:
+        return StallWatchdog(on_stall=Mock(), thresholds=THRESHOLDS, cpu_time=cpu_time, clock=clock)
+
+    def test_startup_stall(self, watchdog: StallWatchdog, clock: FakeClock) -> None:
+        """Tests that the editor without output and CPU activity is stalled after the threshold"""
+        # GIVEN
+        watchdog.set_phase(StallWatchdog.STARTUP)
+        watchdog.check()
+
+        # WHEN
+        clock.time = 99
+        not_stalled = watchdog.check()
+        clock.time = 100
+        stalled = watchdog.check()
+
+        # THEN
+        assert not_stalled is None
+        assert stalled is not None
+        assert "startup" in stalled
+
+    def test_output_and_cpu_activity(
+        self, watchdog: StallWatchdog, clock: FakeClock, cpu_time: FakeCpuTime
+    ) -> None:
+        """Tests that both the output lines and the CPU activity keep the editor alive"""
+        # GIVEN
+        watchdog.set_phase(StallWatchdog.STARTUP)
+        watchdog.check()
+
+        # WHEN
+        clock.time = 90
+        watchdog.observe_line("LogShaderCompilers: Display: Shaders left to compile 100")
+        clock.time = 180
+        cpu_time.cpu_time = 30.0
+        watchdog.check()
+        clock.time = 270
+        after_activity = watchdog.check()
+        clock.time = 280
+        stalled = watchdog.check()
+
+        # THEN
+        assert after_activity is None
+        assert stalled is not None
+        assert watchdog.diagnostics()["recent_lines"] == [
+            "LogShaderCompilers: Display: Shaders left to compile 100"
+        ]
+
+    def test_rendering_stall(
+        self, watchdog: StallWatchdog, clock: FakeClock, cpu_time: FakeCpuTime
+    ) -> None:
+        """
+        Tests that the first progress ends the asset loading and the rendering is stalled
+        when the progress doesn't change for the frame threshold, even if the CPU is busy
+        """
+        # GIVEN
+        watchdog.set_phase(StallWatchdog.ASSET_LOADING)
+
+        # WHEN
+        clock.time = 40
+        watchdog.observe_progress(1.5)
+        clock.time = 45
+        watchdog.observe_progress(3.0)
+        clock.time = 54
+        not_stalled = watchdog.check()
+        watchdog.observe_progress(3.0)
+        clock.time = 55
+        cpu_time.cpu_time = 100.0
+        stalled = watchdog.check()
+
+        # THEN
+        assert watchdog.phase == StallWatchdog.RENDERING
+        assert not_stalled is None
+        assert stalled is not None
+        assert "no progress" in stalled
+
+    @pytest.mark.parametrize("phase", [None, StallWatchdog.STARTUP])
+    def test_not_checked(self, clock: FakeClock, phase: Optional[str]) -> None:
+        """Tests that the paused watchdog and the phase with 0 threshold are not checked"""
+        # GIVEN
+        watchdog = StallWatchdog(
+            on_stall=Mock(), thresholds={StallWatchdog.STARTUP: 0}, clock=clock
+        )
+        watchdog.set_phase(phase)
+
+        # WHEN
+        clock.time = 10000
+
+        # THEN
+        assert watchdog.check() is None
+
+    def test_on_stall_called(self) -> None:
+        """Tests that the background thread reports the stall with the diagnostics once"""
+        # GIVEN
+        stalled = threading.Event()
+        on_stall = Mock(side_effect=lambda reason, diagnostics: stalled.set())
+        watchdog = StallWatchdog(
+            on_stall=on_stall, thresholds={StallWatchdog.STARTUP: 0.05}, check_interval=0.01
+        )
+        watchdog.set_phase(StallWatchdog.STARTUP)
+
+        # WHEN
+        watchdog.start()
+
+        # THEN
+        try:
+            assert stalled.wait(timeout=5)
+        finally:
+            watchdog.stop()
+        on_stall.assert_called_once()
+        assert on_stall.call_args.args[1]["phase"] == StallWatchdog.STARTUP
+
+
+class TestGetCpuTime:
+    """
+    Tests for the get_cpu_time
+    """
+
+    @pytest.mark.skipif(not os.path.exists("/proc/self/stat"), reason="Requires /proc")
+    def test_current_process(self) -> None:
+        """Tests that the CPU time of the running process is read"""
+        cpu_time = get_cpu_time(os.getpid())
+        assert cpu_time is not None
+        assert cpu_time >= 0
+
+    def test_not_existing_process(self) -> None:
+        """Tests that None is returned for the process that doesn't exist"""
+        assert get_cpu_time(2**31 - 1) is None
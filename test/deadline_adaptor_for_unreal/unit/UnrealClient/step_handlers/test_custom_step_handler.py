@@ -7,6 +7,7 @@ from types import ModuleType
 from unittest.mock import Mock
 
 
+from deadline.unreal_adaptor.UnrealClient.step_handlers.base_step_handler import BaseStepHandler
 from deadline.unreal_adaptor.UnrealClient.step_handlers.unreal_custom_step_handler import (
     UnrealCustomStepHandler,
 )
@@ -87,3 +88,35 @@ class TestUnrealCustomStepHandler:
         real_result = unreal_custom_step_handler.run_script(args=script_path_map["args"])
 
         assert real_result == script_path_map["expected_result"]
+
+    def test_run_script_with_context(
+        self, unreal_custom_step_handler: UnrealCustomStepHandler, tmp_path, monkeypatch
+    ) -> None:
+        # GIVEN
+        monkeypatch.setattr(UnrealCustomStepHandler, "session_context", None)
+        script_path = tmp_path / "context_script.py"
+        script_path.write_text(
+            "def main(context, name):\n"
+            "    calls = context.get_or_create('calls', list)\n"
+            "    calls.append(name)\n"
+            "    context.report_progress(50)\n"
+            "    return len(calls)\n"
+        )
+        events: list[dict] = []
+        monkeypatch.setattr(BaseStepHandler, "event_sender", events.append)
+
+        # WHEN
+        results = [
+            unreal_custom_step_handler.run_script(
+                args={"script_path": str(script_path), "script_args": {"name": name}}
+            )
+            for name in ["first", "second"]
+        ]
+
+        # THEN
+        context = UnrealCustomStepHandler.session_context
+        assert results == [True, True]
+        assert context is not None
+        assert context.tasks_count == 2
+        assert context.get("calls") == ["first", "second"]
+        assert events.count({"type": "progress", "progress": 50.0}) == 2
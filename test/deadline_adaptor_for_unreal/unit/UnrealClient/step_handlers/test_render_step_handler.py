@@ -1,5 +1,6 @@
 #  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
+import os
 import sys
 import pytest
 from unittest.mock import MagicMock, patch
@@ -24,12 +25,14 @@ class ShotInfoMock:
     def __init__(self, enabled: bool, outer_name: str):
         self.enabled = enabled
         self.outer_name = outer_name
+        self.inner_name = f"{outer_name}Camera"
 
 
 class RenderJobMock:
 
-    def __init__(self, shot_info: list[ShotInfoMock]):
+    def __init__(self, shot_info: list[ShotInfoMock], job_name: str = "MockedMrqJob"):
         self.shot_info = shot_info
+        self.job_name = job_name
 
 
 class TestUnrealRenderStepHandler:
@@ -93,3 +96,373 @@ class TestUnrealRenderStepHandler:
             log_mock.assert_called_once_with(
                 f"Shots in task: {[shot.outer_name for shot in enabled_shots]}"
             )
+
+    @patch(
+        "deadline.unreal_adaptor.UnrealClient.step_handlers."
+        "unreal_render_step_handler.RemoteRenderMoviePipelineEditorExecutor",
+        create=True,
+    )
+    @patch("deadline.unreal_adaptor.UnrealClient.step_handlers.unreal_render_step_handler.unreal")
+    def test_is_result_ready(self, unreal_mock, executor_mock, unreal_render_step_handler):
+        # GIVEN
+        handler_class = type(unreal_render_step_handler)
+
+        # WHEN
+        unreal_render_step_handler.run_script(args={"queue_manifest_path": "Manifest.utxt"})
+
+        # THEN
+        assert not unreal_render_step_handler.is_result_ready()
+
+        # WHEN
+        handler_class.executor_finished_callback()
+
+        # THEN
+        assert unreal_render_step_handler.is_result_ready()
+
+        # WHEN
+        unreal_render_step_handler.run_script(args={"queue_manifest_path": "Manifest.utxt"})
+        handler_class.executor_failed_callback(None, None, True, "Error")
+
+        # THEN
+        assert unreal_render_step_handler.is_result_ready()
+
+    def test_enable_shots_by_chunks(self, unreal_render_step_handler):
+        # GIVEN
+        render_job_mock = RenderJobMock(
+            shot_info=[ShotInfoMock(enabled=i != 2, outer_name=f"Shot{i}") for i in range(8)]
+        )
+
+        # WHEN
+        chunks = unreal_render_step_handler.enable_shots_by_chunks(
+            render_job_mock, task_chunk_size=2, task_chunk_ids=[0, 2]
+        )
+
+        # THEN
+        assert chunks == {0: ["Shot0", "Shot1"], 2: ["Shot5", "Shot6"]}
+        assert [shot.outer_name for shot in render_job_mock.shot_info if shot.enabled] == [
+            "Shot0",
+            "Shot1",
+            "Shot5",
+            "Shot6",
+        ]
+
+    def test_enable_shots_by_names(self, unreal_render_step_handler):
+        # GIVEN
+        render_job_mock = RenderJobMock(
+            shot_info=[ShotInfoMock(enabled=i != 2, outer_name=f"Shot{i}") for i in range(4)]
+        )
+
+        # WHEN
+        chunks = unreal_render_step_handler.enable_shots_by_names(
+            render_job_mock, shot_names=["Shot1", "Shot2", "Shot3"]
+        )
+
+        # THEN
+        assert chunks == {"Shot1": ["Shot1"], "Shot3": ["Shot3"]}
+        assert [shot.outer_name for shot in render_job_mock.shot_info if shot.enabled] == [
+            "Shot1",
+            "Shot3",
+        ]
+
+    @patch(
+        "deadline.unreal_adaptor.UnrealClient.step_handlers."
+        "unreal_render_step_handler.RemoteRenderMoviePipelineEditorExecutor",
+        create=True,
+    )
+    @patch("deadline.unreal_adaptor.UnrealClient.step_handlers.unreal_render_step_handler.unreal")
+    def test_chunk_complete_events(self, unreal_mock, executor_mock, unreal_render_step_handler):
+        # GIVEN
+        handler_class = type(unreal_render_step_handler)
+        render_job_mock = RenderJobMock(
+            shot_info=[ShotInfoMock(enabled=True, outer_name=f"Shot{i}") for i in range(6)]
+        )
+        subsystem = unreal_mock.get_editor_subsystem.return_value
+        subsystem.get_queue.return_value.get_jobs.return_value = [render_job_mock]
+        event_sender = MagicMock()
+
+        # WHEN
+        with patch(
+            "deadline.unreal_adaptor.UnrealClient.step_handlers.base_step_handler."
+            "BaseStepHandler.event_sender",
+            event_sender,
+        ):
+            unreal_render_step_handler.run_script(
+                args={"queue_manifest_path": "Manifest.utxt", "chunk_size": 2, "chunk_ids": [1, 2]}
+            )
+            for shot_name in ["Shot2", "Shot4", "Shot5", "Shot3"]:
+                shot_data = MagicMock()
+                shot_data.shot.outer_name = shot_name
+                output_data = MagicMock(job=render_job_mock, shot_data=[shot_data])
+                handler_class.executor_shot_finished_callback(output_data)
+
+        # THEN
+        executor_mock.return_value.on_individual_shot_work_finished_delegate.add_callable.assert_called_once_with(
+            handler_class.executor_shot_finished_callback
+        )
+        chunk_events = [
+            c.args[0] for c in event_sender.call_args_list if c.args[0]["type"] == "chunk_complete"
+        ]
+        assert chunk_events == [
+            {"type": "chunk_complete", "chunk": 2, "chunks_done": 1, "chunks_total": 2},
+            {"type": "chunk_complete", "chunk": 1, "chunks_done": 2, "chunks_total": 2},
+        ]
+
+    @patch(
+        "deadline.unreal_adaptor.UnrealClient.step_handlers."
+        "unreal_render_step_handler.RemoteRenderMoviePipelineEditorExecutor",
+        create=True,
+    )
+    @patch("deadline.unreal_adaptor.UnrealClient.step_handlers.unreal_render_step_handler.unreal")
+    def test_queue_reused_across_chunks(
+        self, unreal_mock, executor_mock, unreal_render_step_handler, tmp_path
+    ):
+        # GIVEN
+        handler_class = type(unreal_render_step_handler)
+        manifest_path = tmp_path / "Manifest.utxt"
+        manifest_path.write_text("manifest")
+        render_job_mock = RenderJobMock(
+            shot_info=[ShotInfoMock(enabled=i != 0, outer_name=f"Shot{i}") for i in range(5)]
+        )
+        subsystem = unreal_mock.get_editor_subsystem.return_value
+        subsystem.get_queue.return_value.get_jobs.return_value = [render_job_mock]
+        event_sender = MagicMock()
+        args = {"queue_manifest_path": str(manifest_path), "chunk_size": 2}
+
+        # WHEN
+        with (
+            patch.object(handler_class, "create_queue_from_manifest") as create_queue_mock,
+            patch(
+                "deadline.unreal_adaptor.UnrealClient.step_handlers.base_step_handler."
+                "BaseStepHandler.event_sender",
+                event_sender,
+            ),
+        ):
+            unreal_render_step_handler.run_script(args={**args, "chunk_ids": [0]})
+            unreal_render_step_handler.run_script(args={**args, "chunk_ids": [1]})
+            second_chunk_shots = [s.outer_name for s in render_job_mock.shot_info if s.enabled]
+            os.utime(manifest_path, (1000, 1000))
+            unreal_render_step_handler.run_script(args={**args, "chunk_ids": [1]})
+
+        # THEN
+        assert create_queue_mock.call_count == 2
+        assert second_chunk_shots == ["Shot3", "Shot4"]
+        queue_setup_events = [
+            c.args[0]
+            for c in event_sender.call_args_list
+            if c.args[0].get("phase") == "queue_setup"
+        ]
+        assert [event["cached"] for event in queue_setup_events] == [False, True, False]
+
+    @patch(
+        "deadline.unreal_adaptor.UnrealClient.step_handlers."
+        "unreal_render_step_handler.RemoteRenderMoviePipelineEditorExecutor",
+        create=True,
+    )
+    @patch("deadline.unreal_adaptor.UnrealClient.step_handlers.unreal_render_step_handler.unreal")
+    def test_shot_chunks(self, unreal_mock, executor_mock, unreal_render_step_handler, tmp_path):
+        # GIVEN
+        manifest_path = tmp_path / "Manifest.utxt"
+        manifest_path.write_text("manifest")
+        render_job_mock = RenderJobMock(
+            shot_info=[ShotInfoMock(enabled=True, outer_name=f'Shot "{i}"') for i in range(4)]
+        )
+        subsystem = unreal_mock.get_editor_subsystem.return_value
+        subsystem.get_queue.return_value.get_jobs.return_value = [render_job_mock]
+
+        # WHEN
+        unreal_render_step_handler.run_script(
+            args={
+                "queue_manifest_path": str(manifest_path),
+                "chunk_id": 1,
+                "shot_chunks": [['Shot "0"', 'Shot "3"'], ['Shot "1"', 'Shot "2"']],
+            }
+        )
+
+        # THEN
+        assert [s.outer_name for s in render_job_mock.shot_info if s.enabled] == [
+            'Shot "1"',
+            'Shot "2"',
+        ]
+
+    @patch(
+        "deadline.unreal_adaptor.UnrealClient.step_handlers."
+        "unreal_render_step_handler.RemoteRenderMoviePipelineEditorExecutor",
+        create=True,
+    )
+    @patch("deadline.unreal_adaptor.UnrealClient.step_handlers.unreal_render_step_handler.unreal")
+    def test_frame_range(self, unreal_mock, executor_mock, unreal_render_step_handler, tmp_path):
+        # GIVEN
+        manifest_path = tmp_path / "Manifest.utxt"
+        manifest_path.write_text("manifest")
+        render_job_mock = MagicMock(
+            job_name="MockedMrqJob",
+            shot_info=[ShotInfoMock(enabled=True, outer_name=f"Shot{i}") for i in range(3)],
+        )
+        output_settings = (
+            render_job_mock.get_configuration.return_value.find_or_add_setting_by_class.return_value
+        )
+        output_settings.use_custom_playback_range = False
+        output_settings.custom_start_frame = 0
+        output_settings.custom_end_frame = 0
+        subsystem = unreal_mock.get_editor_subsystem.return_value
+        subsystem.get_queue.return_value.get_jobs.return_value = [render_job_mock]
+        args = {"queue_manifest_path": str(manifest_path)}
+
+        # WHEN
+        unreal_render_step_handler.run_script(
+            args={**args, "shot_names": ["Shot1"], "frame_range": [500, 1000]}
+        )
+        frame_range_shots = [s.outer_name for s in render_job_mock.shot_info if s.enabled]
+        frame_range_settings = (
+            output_settings.use_custom_playback_range,
+            output_settings.custom_start_frame,
+            output_settings.custom_end_frame,
+        )
+        unreal_render_step_handler.run_script(args={**args, "shot_names": ["Shot2"]})
+
+        # THEN
+        assert frame_range_shots == ["Shot1"]
+        assert frame_range_settings == (True, 500, 1000)
+        assert [s.outer_name for s in render_job_mock.shot_info if s.enabled] == ["Shot2"]
+        assert output_settings.use_custom_playback_range is False
+        assert (output_settings.custom_start_frame, output_settings.custom_end_frame) == (0, 0)
+
+    @pytest.mark.parametrize(
+        "rendered_frames, expected_shots, expected_frame_range, expected_resume_jobs",
+        [
+            (set(range(0, 150)), ["Shot1", "Shot2"], (150, 300), []),
+            (
+                set(range(0, 100)) | {150, 250},
+                ["Shot1"],
+                (100, 150),
+                [(["Shot1", "Shot2"], (151, 250)), (["Shot2"], (251, 300))],
+            ),
+            (set(), ["Shot0", "Shot1", "Shot2"], None, []),
+        ],
+    )
+    @patch(
+        "deadline.unreal_adaptor.UnrealClient.step_handlers."
+        "unreal_render_step_handler.RemoteRenderMoviePipelineEditorExecutor",
+        create=True,
+    )
+    @patch("deadline.unreal_adaptor.UnrealClient.step_handlers.unreal_render_step_handler.unreal")
+    def test_resume(
+        self,
+        unreal_mock,
+        executor_mock,
+        unreal_render_step_handler,
+        rendered_frames,
+        expected_shots,
+        expected_frame_range,
+        expected_resume_jobs,
+    ):
+        # GIVEN
+        handler_class = type(unreal_render_step_handler)
+        render_job_mock = MagicMock(
+            job_name="MockedMrqJob",
+            shot_info=[ShotInfoMock(enabled=True, outer_name=f"Shot{i}") for i in range(3)],
+        )
+        duplicated_jobs: list[MagicMock] = []
+
+        def duplicate_job(job):
+            duplicated_job = MagicMock(
+                job_name=job.job_name,
+                shot_info=[ShotInfoMock(s.enabled, s.outer_name) for s in job.shot_info],
+            )
+            duplicated_jobs.append(duplicated_job)
+            return duplicated_job
+
+        output_settings = (
+            render_job_mock.get_configuration.return_value.find_or_add_setting_by_class.return_value
+        )
+        output_settings.use_custom_frame_rate = False
+        output_settings.use_custom_playback_range = False
+        output_settings.frame_number_offset = 0
+        level_sequence = unreal_mock.EditorAssetLibrary.load_asset.return_value
+        level_sequence.get_playback_start.return_value = 0
+        level_sequence.get_playback_end.return_value = 300
+        subsystem = unreal_mock.get_editor_subsystem.return_value
+        subsystem.get_queue.return_value.get_jobs.return_value = [render_job_mock]
+        subsystem.get_queue.return_value.duplicate_job.side_effect = duplicate_job
+        scanner_mock = MagicMock()
+        scanner_mock.scan.return_value = rendered_frames
+
+        # WHEN
+        with (
+            patch.object(handler_class, "get_output_frame_scanner", return_value=scanner_mock),
+            patch.object(
+                handler_class,
+                "get_shot_frame_ranges",
+                return_value={"Shot0": (0, 100), "Shot1": (100, 200), "Shot2": (200, 300)},
+            ),
+            patch.object(handler_class, "set_frame_range") as set_frame_range_mock,
+        ):
+            unreal_render_step_handler.run_script(
+                args={"queue_manifest_path": "Manifest.utxt", "resume": True}
+            )
+
+        # THEN
+        assert [s.outer_name for s in render_job_mock.shot_info if s.enabled] == expected_shots
+        if expected_frame_range is None:
+            set_frame_range_mock.assert_not_called()
+        else:
+            set_frame_range_mock.assert_called_once_with(0, render_job_mock, *expected_frame_range)
+        resume_jobs = [
+            (
+                [s.outer_name for s in job.shot_info if s.enabled],
+                (
+                    job.get_configuration().find_or_add_setting_by_class().custom_start_frame,
+                    job.get_configuration().find_or_add_setting_by_class().custom_end_frame,
+                ),
+            )
+            for job in duplicated_jobs
+        ]
+        assert resume_jobs == expected_resume_jobs
+        assert handler_class._resume_jobs == duplicated_jobs
+        subsystem.render_queue_with_executor_instance.assert_called_once()
+
+    @patch(
+        "deadline.unreal_adaptor.UnrealClient.step_handlers."
+        "unreal_render_step_handler.RemoteRenderMoviePipelineEditorExecutor",
+        create=True,
+    )
+    @patch("deadline.unreal_adaptor.UnrealClient.step_handlers.unreal_render_step_handler.unreal")
+    def test_resume_all_rendered(self, unreal_mock, executor_mock, unreal_render_step_handler):
+        # GIVEN
+        handler_class = type(unreal_render_step_handler)
+        render_job_mock = MagicMock(
+            job_name="MockedMrqJob",
+            shot_info=[ShotInfoMock(enabled=True, outer_name="Shot0")],
+        )
+        output_settings = (
+            render_job_mock.get_configuration.return_value.find_or_add_setting_by_class.return_value
+        )
+        output_settings.use_custom_frame_rate = False
+        output_settings.use_custom_playback_range = True
+        output_settings.custom_start_frame = 1000
+        output_settings.custom_end_frame = 1010
+        output_settings.frame_number_offset = 5
+        subsystem = unreal_mock.get_editor_subsystem.return_value
+        subsystem.get_queue.return_value.get_jobs.return_value = [render_job_mock]
+        scanner_mock = MagicMock()
+        scanner_mock.scan.return_value = set(range(1005, 1015))
+        event_sender = MagicMock()
+
+        # WHEN
+        with (
+            patch.object(handler_class, "get_output_frame_scanner", return_value=scanner_mock),
+            patch.object(handler_class, "get_shot_frame_ranges", return_value={}),
+            patch(
+                "deadline.unreal_adaptor.UnrealClient.step_handlers.base_step_handler."
+                "BaseStepHandler.event_sender",
+                event_sender,
+            ),
+        ):
+            unreal_render_step_handler.run_script(
+                args={"queue_manifest_path": "Manifest.utxt", "resume": True}
+            )
+
+        # THEN
+        subsystem.render_queue_with_executor_instance.assert_not_called()
+        assert unreal_render_step_handler.is_result_ready()
+        assert {"type": "complete"} in [c.args[0] for c in event_sender.call_args_list]
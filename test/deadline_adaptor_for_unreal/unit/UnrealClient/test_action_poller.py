@@ -0,0 +1,126 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import time
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealClient.action_poller import ActionPoller
+
+
+class FakeAdaptor:
+    """Answers the action requests with the given responses, then with no action"""
+
+    def __init__(self, responses: list) -> None:
+        self.responses = responses
+        self.request_times: list[float] = []
+        self.requested = threading.Semaphore(0)
+
+    def __call__(self) -> tuple:
+        self.request_times.append(time.monotonic())
+        self.requested.release()
+        if self.responses:
+            response = self.responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+        return 200, "OK", None
+
+    def wait_requests(self, count: int) -> None:
+        for _ in range(count):
+            assert self.requested.acquire(timeout=5)
+
+
+def wait_action(poller: ActionPoller):
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        action = poller.get_action()
+        if action is not None:
+            return action
+        time.sleep(0.001)
+    raise TimeoutError("No action received")
+
+
+class TestActionPoller:
+    """
+    Tests for the ActionPoller
+    """
+
+    def test_immediate_repoll(self) -> None:
+        """Tests that the next action is requested only after resume and without waiting"""
+        # GIVEN
+        adaptor = FakeAdaptor([(200, "OK", "run_script"), (200, "OK", "wait_result")])
+        poller = ActionPoller(adaptor, poll_interval=60)
+
+        # WHEN
+        poller.start()
+        try:
+            first_action = wait_action(poller)
+            time.sleep(0.05)
+            requests_before_resume = len(adaptor.request_times)
+            poller.resume()
+            second_action = wait_action(poller)
+        finally:
+            poller.stop(timeout=5)
+
+        # THEN
+        assert (first_action, second_action) == ("run_script", "wait_result")
+        assert requests_before_resume == 1
+        assert len(adaptor.request_times) == 2
+
+    def test_poll_interval(self) -> None:
+        """Tests that the poller waits the interval when there is no action or on errors"""
+        # GIVEN
+        adaptor = FakeAdaptor([(500, "Internal Server Error", None), ConnectionError("Broken")])
+        poller = ActionPoller(adaptor, poll_interval=0.05)
+
+        # WHEN
+        poller.start()
+        try:
+            adaptor.wait_requests(4)
+        finally:
+            poller.stop(timeout=5)
+
+        # THEN
+        intervals = [b - a for a, b in zip(adaptor.request_times, adaptor.request_times[1:])]
+        assert min(intervals) >= 0.04
+        assert poller.get_action() is None
+
+    def test_get_action_does_not_block(self) -> None:
+        """Tests that the game thread gets no action while the request is in progress"""
+        # GIVEN
+        release = threading.Event()
+        poller = ActionPoller(lambda: (release.wait(), (200, "OK", "close"))[1])
+
+        # WHEN
+        poller.start()
+        start_time = time.monotonic()
+        action = poller.get_action()
+        elapsed = time.monotonic() - start_time
+        release.set()
+        received_action = wait_action(poller)
+        poller.stop(timeout=5)
+
+        # THEN
+        assert action is None
+        assert elapsed < 0.1
+        assert received_action == "close"
+
+    @pytest.mark.parametrize(
+        "value, expected", [("0.25", 0.25), ("0", 1.0), ("fast", 1.0), (None, 1.0)]
+    )
+    def test_get_poll_interval(self, value, expected) -> None:
+        """Tests the poll interval from the environment"""
+        # GIVEN
+        environ = {} if value is None else {ActionPoller.POLL_INTERVAL_ENV: value}
+
+        # WHEN
+        with patch.dict(os.environ, environ, clear=True):
+            poll_interval = ActionPoller.get_poll_interval()
+
+        # THEN
+        assert poll_interval == expected
@@ -3,11 +3,15 @@
 import os
 import sys
 import pytest
+import threading
 from unittest import SkipTest
 from unittest.mock import Mock, patch
 
 try:
     from deadline.unreal_adaptor.UnrealClient.unreal_client import UnrealClient, main
+    from deadline.unreal_adaptor.UnrealClient.step_handlers.base_step_handler import (
+        BaseStepHandler,
+    )
 except ModuleNotFoundError:
     # TODO: properly mock out deps to ensure they work within and without unreal
     raise SkipTest(f"Most likely win32 is not available. Skipping {__file__}")
@@ -31,6 +35,179 @@ class TestUnrealClient:
         client.set_handler(handler_dict=dict(handler="render"))
         client.close()
 
+    @patch("deadline.unreal_adaptor.UnrealClient.unreal_client.WinClientInterface")
+    def test_set_handler_task_id(self, mock_winclient: Mock) -> None:
+        """Tests that the step handler events are tagged with the task id of set_handler"""
+        # GIVEN
+        client = UnrealClient(socket_path=str(999))
+        client._event_sender = mock_event_sender = Mock()
+
+        # WHEN
+        client.set_handler(handler_dict=dict(handler="render", task_id=3))
+        BaseStepHandler.send_event("complete")
+
+        # THEN
+        mock_event_sender.send.assert_called_once_with({"type": "complete", "task_id": 3})
+
+    @patch("deadline.unreal_adaptor.UnrealClient.unreal_client.WinClientInterface")
+    def test_poll_awaiting_result(self, mock_winclient: Mock) -> None:
+        """Tests that the unreal client doesn't request actions until the handler result is ready"""
+        # GIVEN
+        client = UnrealClient(socket_path=str(999))
+        client.handler = mock_handler = Mock()
+        mock_handler.is_result_ready.return_value = False
+        requested = threading.Event()
+
+        def request_next_action():
+            requested.set()
+            return 200, "OK", None
+
+        client._request_next_action = mock_request_next_action = Mock(  # type: ignore[method-assign]
+            side_effect=request_next_action
+        )
+
+        # WHEN
+        client.wait_result()
+        client.poll()
+        client.poll()
+
+        # THEN
+        mock_handler.wait_result.assert_called_once()
+        mock_request_next_action.assert_not_called()
+
+        # WHEN
+        mock_handler.is_result_ready.return_value = True
+        client.poll()
+
+        # THEN
+        assert requested.wait(timeout=5)
+        client._action_poller.stop(timeout=5)
+        mock_request_next_action.assert_called_once()
+        assert not client._awaiting_result
+
+    @patch("deadline.unreal_adaptor.UnrealClient.unreal_client.WinClientInterface")
+    def test_poll_wait_result_requests_next_action(self, mock_winclient: Mock) -> None:
+        """Tests that the client keeps one request for the next action open while it waits"""
+        # GIVEN
+        client = UnrealClient(socket_path=str(999))
+        client.handler = mock_handler = Mock()
+        mock_handler.is_result_ready.return_value = False
+        client._perform_action = Mock(  # type: ignore[method-assign]
+            side_effect=lambda action: client.wait_result()
+        )
+        action = Mock()
+        action.name = "wait_result"
+        client._action_poller = mock_poller = Mock()
+        mock_poller.get_action.return_value = action
+
+        # WHEN
+        client.poll()
+
+        # THEN
+        assert client._awaiting_result
+        mock_poller.resume.assert_called_once()
+
+    @patch("deadline.unreal_adaptor.UnrealClient.unreal_client.WinClientInterface")
+    def test_poll_close_while_awaiting_result(self, mock_winclient: Mock) -> None:
+        """Tests that the client closes while it waits for the result and defers other actions"""
+        # GIVEN
+        client = UnrealClient(socket_path=str(999))
+        client.handler = mock_handler = Mock()
+        mock_handler.is_result_ready.return_value = False
+        client._perform_action = mock_perform_action = Mock()  # type: ignore[method-assign]
+        run_script_action = Mock()
+        run_script_action.name = "run_script"
+        close_action = Mock()
+        close_action.name = "close"
+        client._action_poller = mock_poller = Mock()
+        mock_poller.get_action.return_value = run_script_action
+
+        # WHEN
+        client.wait_result()
+        client.poll()
+
+        # THEN
+        mock_perform_action.assert_not_called()
+        assert client._deferred_action is run_script_action
+
+        # WHEN
+        client._deferred_action = None
+        mock_poller.get_action.return_value = close_action
+        client.poll()
+
+        # THEN
+        mock_perform_action.assert_called_once_with(close_action)
+        mock_poller.resume.assert_not_called()
+        assert not client._awaiting_result
+
+    @patch("deadline.unreal_adaptor.UnrealClient.unreal_client.WinClientInterface")
+    def test_poll_deferred_action(self, mock_winclient: Mock) -> None:
+        """Tests that the action received while waiting is performed after the result"""
+        # GIVEN
+        client = UnrealClient(socket_path=str(999))
+        client.handler = mock_handler = Mock()
+        mock_handler.is_result_ready.return_value = False
+        client._perform_action = mock_perform_action = Mock()  # type: ignore[method-assign]
+        action = Mock()
+        action.name = "set_handler"
+        client._action_poller = mock_poller = Mock()
+        mock_poller.get_action.side_effect = [action, None]
+        client.wait_result()
+        client.poll()
+
+        # WHEN
+        mock_handler.is_result_ready.return_value = True
+        client.poll()
+
+        # THEN
+        mock_perform_action.assert_called_once_with(action)
+        mock_poller.resume.assert_called_once()
+        assert client._deferred_action is None
+
+    @patch("deadline.unreal_adaptor.UnrealClient.unreal_client.WinClientInterface")
+    def test_client_loaded_preload(self, mock_winclient: Mock) -> None:
+        """Tests that the client preloads the level and the assets before it reports loaded"""
+        # GIVEN
+        client = UnrealClient(socket_path=str(999))
+        client._event_sender = mock_event_sender = Mock()
+        unreal = sys.modules["unreal"]
+        unreal.EditorAssetLibrary.load_asset.side_effect = lambda path: f"asset:{path}"
+
+        # WHEN
+        client.client_loaded(
+            {
+                "preload": {
+                    "level_path": "/Game/Maps/Main.Main",
+                    "level_sequence_path": "/Game/Cinematics/Shot.Shot",
+                }
+            }
+        )
+
+        # THEN
+        unreal.get_editor_subsystem.return_value.load_level.assert_called_with("/Game/Maps/Main")
+        assert client._preloaded_assets == ["asset:/Game/Cinematics/Shot.Shot"]
+        sent_events = [c.args[0] for c in mock_event_sender.send.call_args_list]
+        assert sent_events[0]["phase"] == "level_preload"
+        assert sent_events[1] == {"type": "client_loaded"}
+
+    @patch("deadline.unreal_adaptor.UnrealClient.unreal_client.WinClientInterface")
+    def test_client_loaded_preload_failed(self, mock_winclient: Mock) -> None:
+        """Tests that the client sends the error event if the preload fails and still loads"""
+        # GIVEN
+        client = UnrealClient(socket_path=str(999))
+        client._event_sender = mock_event_sender = Mock()
+
+        # WHEN
+        with patch.object(client, "preload", side_effect=RuntimeError("Editor is busy")):
+            client.client_loaded({"preload": {"level_path": "/Game/Maps/Main.Main"}})
+
+        # THEN
+        sent_events = [c.args[0] for c in mock_event_sender.send.call_args_list]
+        assert sent_events == [
+            {"type": "error", "message": "Preload failed: Editor is busy"},
+            {"type": "client_loaded"},
+        ]
+
     @pytest.mark.skip(reason="mocks not set up properly")
     @patch("deadline.unreal_adaptor.UnrealClient.unreal_client.os.path.exists")
     @patch.dict(os.environ, {"UNREAL_ADAPTOR_SOCKET_PATH": "socket_path"})
@@ -0,0 +1,78 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import Mock
+
+from deadline.unreal_adaptor.UnrealClient.event_sender import ClientEventSender
+
+
+class TestClientEventSender:
+    """
+    Tests for the ClientEventSender
+    """
+
+    def test_events_sent_in_order(self) -> None:
+        """Tests that the events are sent from the background thread in the order they were added"""
+        # GIVEN
+        sent_events: list[dict] = []
+        sender_threads: set[str] = set()
+
+        def send_request(event: dict) -> None:
+            sender_threads.add(threading.current_thread().name)
+            sent_events.append(event)
+
+        sender = ClientEventSender(send_request)
+
+        # WHEN
+        sender.send({"type": "client_loaded"})
+        assert sender.flush(timeout=5)
+        sender.send({"type": "complete"})
+        assert sender.flush(timeout=5)
+
+        # THEN
+        assert sent_events == [{"type": "client_loaded"}, {"type": "complete"}]
+        assert sender_threads == {"UnrealClientEventSender"}
+
+    def test_pending_progress_replaced(self) -> None:
+        """Tests that the progress not sent yet is replaced by the newer one"""
+        # GIVEN
+        sent_events: list[dict] = []
+        unblock = threading.Event()
+
+        def send_request(event: dict) -> None:
+            unblock.wait(timeout=5)
+            sent_events.append(event)
+
+        sender = ClientEventSender(send_request)
+
+        # WHEN
+        sender.send({"type": "client_loaded"})
+        for progress in range(10):
+            sender.send({"type": "progress", "progress": progress})
+        sender.send({"type": "complete"})
+        unblock.set()
+
+        # THEN
+        assert sender.flush(timeout=5)
+        assert sent_events == [
+            {"type": "client_loaded"},
+            {"type": "progress", "progress": 9},
+            {"type": "complete"},
+        ]
+
+    def test_send_failure_doesnt_stop_sender(self) -> None:
+        """Tests that the events after the failed one are still sent"""
+        # GIVEN
+        send_request = Mock(side_effect=[ConnectionError("Adaptor is not available"), None])
+        sender = ClientEventSender(send_request)
+
+        # WHEN
+        sender.send({"type": "error", "message": "Something Bad Happened!"})
+        assert sender.flush(timeout=5)
+        sender.send({"type": "complete"})
+        assert sender.flush(timeout=5)
+
+        # THEN
+        assert send_request.call_count == 2
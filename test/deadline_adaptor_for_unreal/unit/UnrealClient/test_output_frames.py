@@ -0,0 +1,101 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealClient.output_frames import OutputFrameScanner
+
+
+PNG_HEADER = b"\x89PNG\r\n\x1a\n"
+
+
+class TestOutputFrameScanner:
+    """
+    Tests for the OutputFrameScanner
+    """
+
+    def test_scan(self, tmp_path) -> None:
+        """Tests that only the frames with the valid files are found"""
+        # GIVEN
+        output_dir = tmp_path / "Render" / "Seq"
+        output_dir.mkdir(parents=True)
+        (output_dir / "Seq.0100.png").write_bytes(PNG_HEADER + b"data")
+        (output_dir / "Seq.0101.png").write_bytes(PNG_HEADER + b"data")
+        (output_dir / "Seq.0102.png").write_bytes(b"")
+        (output_dir / "Seq.0103.png").write_bytes(b"truncated")
+        (output_dir / "Seq.0104.tga").write_bytes(b"data")
+        (output_dir / "Other.0105.png").write_bytes(PNG_HEADER)
+        (output_dir / "Seq.0106.FinalImage.png").write_bytes(PNG_HEADER)
+        scanner = OutputFrameScanner(
+            output_path_format=f"{tmp_path}/Render/{{sequence_name}}/{{sequence_name}}.{{frame_number}}",
+            format_args={"sequence_name": "Seq"},
+        )
+
+        # WHEN
+        frames = scanner.scan()
+
+        # THEN
+        assert frames == {100, 101, 104}
+        assert scanner.get_root_directory() == f"{tmp_path}/Render/Seq".replace("\\", "/")
+
+    def test_unknown_tokens(self, tmp_path) -> None:
+        """Tests that the unknown tokens match any part and the invalid pass marks the frame"""
+        # GIVEN
+        for render_pass, frame, data in [
+            ("FinalImage", 1, PNG_HEADER),
+            ("Depth", 1, PNG_HEADER),
+            ("FinalImage", 2, PNG_HEADER),
+            ("Depth", 2, b""),
+        ]:
+            pass_dir = tmp_path / render_pass
+            pass_dir.mkdir(exist_ok=True)
+            (pass_dir / f"sh010_{frame}.png").write_bytes(data)
+        scanner = OutputFrameScanner(
+            output_path_format=f"{tmp_path}/{{render_pass}}/{{shot_name}}_{{frame_number}}"
+        )
+
+        # WHEN
+        frames = scanner.scan()
+
+        # THEN
+        assert frames == {1}
+        assert scanner.get_root_directory() == str(tmp_path).replace("\\", "/")
+
+    def test_no_frame_number(self, tmp_path) -> None:
+        """Tests that the frames can't be found without the frame number in the format"""
+        # GIVEN
+        (tmp_path / "Seq.0001.png").write_bytes(PNG_HEADER)
+        scanner = OutputFrameScanner(output_path_format=f"{tmp_path}/Seq.{{frame_number_shot}}")
+
+        # WHEN
+        frames = scanner.scan()
+
+        # THEN
+        assert scanner.pattern is None
+        assert frames == set()
+
+    def test_get_missing_frames(self) -> None:
+        """Tests the frames of the range that are not rendered"""
+        # WHEN
+        missing_frames = OutputFrameScanner.get_missing_frames(10, 16, {9, 10, 11, 13})
+
+        # THEN
+        assert missing_frames == [12, 14, 15]
+
+    @pytest.mark.parametrize(
+        "frames, max_ranges, expected",
+        [
+            ([], None, []),
+            ([5, 3, 4, 10, 12, 11, 20], None, [(3, 6), (10, 13), (20, 21)]),
+            ([3, 4, 5, 10, 11, 12, 20], 2, [(3, 13), (20, 21)]),
+            ([1, 10, 12], 1, [(1, 13)]),
+        ],
+    )
+    def test_get_frame_ranges(self, frames, max_ranges, expected) -> None:
+        """Tests the contiguous ranges of the frames and the merge of the closest ones"""
+        # WHEN
+        frame_ranges = OutputFrameScanner.get_frame_ranges(frames, max_ranges=max_ranges)
+
+        # THEN
+        assert frame_ranges == expected
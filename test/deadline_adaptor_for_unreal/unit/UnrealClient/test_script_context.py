@@ -0,0 +1,110 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealClient.script_context import ScriptContext
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+class TestScriptContext:
+    """
+    Tests for the ScriptContext
+    """
+
+    def test_lru_eviction(self) -> None:
+        """Tests that the least recently used value is evicted over max_entries"""
+        # GIVEN
+        context = ScriptContext(max_entries=2)
+        context.set("level", 1)
+        context.set("table", 2)
+
+        # WHEN
+        context.get("level")
+        context.set("blueprint", 3)
+
+        # THEN
+        assert context.get("level") == 1
+        assert context.get("table") is None
+        assert context.get("blueprint") == 3
+        assert (context.hits, context.misses) == (3, 1)
+
+    def test_get_or_create(self) -> None:
+        """Tests that the value is created once and again when it is not valid"""
+        # GIVEN
+        context = ScriptContext()
+        factory = Mock(side_effect=["first", "second"])
+        valid = {"first": True}
+
+        # WHEN
+        values = [
+            context.get_or_create("key", factory, is_valid=lambda value: valid[value])
+            for _ in range(2)
+        ]
+        valid["first"] = False
+        values.append(context.get_or_create("key", factory, is_valid=lambda value: valid[value]))
+
+        # THEN
+        assert values == ["first", "first", "second"]
+        assert factory.call_count == 2
+
+    def test_load_asset(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Tests that the asset is loaded once and again after it was garbage collected"""
+        # GIVEN
+        unreal = Mock()
+        level, reloaded_level = Mock(), Mock()
+        unreal.EditorAssetLibrary.load_asset.side_effect = [level, reloaded_level]
+        unreal.SystemLibrary.is_valid.side_effect = [True, False]
+        monkeypatch.setitem(sys.modules, "unreal", unreal)
+        context = ScriptContext()
+
+        # WHEN
+        assets = [context.load_asset("/Game/Maps/Main") for _ in range(3)]
+
+        # THEN
+        assert assets == [level, level, reloaded_level]
+        unreal.EditorAssetLibrary.load_asset.assert_called_with("/Game/Maps/Main")
+        assert unreal.EditorAssetLibrary.load_asset.call_count == 2
+
+    def test_load_asset_failed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Tests that the asset that can't be loaded raises and is not cached"""
+        # GIVEN
+        unreal = Mock()
+        unreal.EditorAssetLibrary.load_asset.return_value = None
+        monkeypatch.setitem(sys.modules, "unreal", unreal)
+        context = ScriptContext()
+
+        # WHEN
+        with pytest.raises(RuntimeError):
+            context.load_asset("/Game/Missing")
+
+        # THEN
+        assert context.get(("asset", "/Game/Missing")) is None
+
+    def test_timer_and_progress(self) -> None:
+        """Tests that the timings are accumulated by name and the progress is clamped"""
+        # GIVEN
+        clock = FakeClock()
+        report_progress = Mock()
+        context = ScriptContext(report_progress=report_progress, clock=clock)
+
+        # WHEN
+        for duration in [2.0, 3.0]:
+            with context.timer("load_level"):
+                clock.time += duration
+        context.report_progress(150)
+
+        # THEN
+        assert context.get_timings() == {"load_level": (2, 5.0)}
+        report_progress.assert_called_once_with(100.0)
@@ -0,0 +1,103 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealClient.script_loader import ScriptLoader
+
+
+class TestScriptLoader:
+    """
+    Tests for the ScriptLoader
+    """
+
+    @pytest.fixture
+    def loader(self):
+        loader = ScriptLoader()
+        yield loader
+        loader.clear()
+
+    def test_load_cached(self, loader: ScriptLoader, tmp_path) -> None:
+        """Tests that the module is loaded once and sys.path is unchanged"""
+        # GIVEN
+        script_path = tmp_path / "cached_script.py"
+        script_path.write_text("def main():\n    return 1\n")
+        sys_path = list(sys.path)
+
+        # WHEN
+        modules = [loader.load(str(script_path)) for _ in range(3)]
+
+        # THEN
+        assert modules[0] is modules[1] is modules[2]
+        assert modules[0].main() == 1
+        assert sys.modules[loader.get_module_name(str(script_path))] is modules[0]
+        assert (loader.loads, loader.hits) == (1, 2)
+        assert sys.path == sys_path
+
+    def test_reload_changed(self, loader: ScriptLoader, tmp_path) -> None:
+        """Tests that the module is loaded again when the script changes"""
+        # GIVEN
+        script_path = tmp_path / "changed_script.py"
+        script_path.write_text("def main():\n    return 1\n")
+        first_module = loader.load(str(script_path))
+
+        # WHEN
+        script_path.write_text("def main():\n    return 2\n")
+        stat = os.stat(script_path)
+        os.utime(script_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        second_module = loader.load(str(script_path))
+
+        # THEN
+        assert second_module is not first_module
+        assert second_module.main() == 2
+
+    def test_same_name_scripts(self, loader: ScriptLoader, tmp_path) -> None:
+        """Tests that the scripts with the same name in different directories don't collide"""
+        # GIVEN
+        for value in ["first", "second"]:
+            (tmp_path / value).mkdir()
+            (tmp_path / value / "script.py").write_text(f"def main():\n    return '{value}'\n")
+
+        # WHEN
+        results = [
+            loader.load(str(tmp_path / value / "script.py")).main() for value in ["first", "second"]
+        ]
+
+        # THEN
+        assert results == ["first", "second"]
+
+    def test_sibling_import(self, loader: ScriptLoader, tmp_path) -> None:
+        """Tests that the script imports the modules of its directory"""
+        # GIVEN
+        (tmp_path / "loader_sibling_helper.py").write_text("VALUE = 42\n")
+        script_path = tmp_path / "sibling_script.py"
+        script_path.write_text(
+            "import loader_sibling_helper\n\ndef main():\n    return loader_sibling_helper.VALUE\n"
+        )
+
+        # WHEN
+        module = loader.load(str(script_path))
+
+        # THEN
+        assert module.main() == 42
+        assert str(tmp_path) not in sys.path
+
+    def test_load_error(self, loader: ScriptLoader, tmp_path) -> None:
+        """Tests that the failed script is not cached and the missing script raises"""
+        # GIVEN
+        script_path = tmp_path / "broken_script.py"
+        script_path.write_text("raise ValueError('Broken script')\n")
+
+        # WHEN
+        with pytest.raises(ValueError):
+            loader.load(str(script_path))
+        with pytest.raises(FileNotFoundError):
+            loader.load(str(tmp_path / "missing_script.py"))
+
+        # THEN
+        assert loader.get_module_name(str(script_path)) not in sys.modules
+        assert loader.loads == 0
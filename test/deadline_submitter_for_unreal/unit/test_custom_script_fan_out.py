@@ -0,0 +1,135 @@
+import sys
+import yaml
+import pytest
+from unittest.mock import MagicMock
+
+sys.modules["unreal"] = MagicMock()
+
+
+class TestCustomScriptFanOut:
+
+    @pytest.fixture
+    def step_template(self) -> dict:
+        from deadline.unreal_submitter.settings import DEFAULT_JOB_STEP_TEMPLATE_FILE_PATH
+
+        with open(DEFAULT_JOB_STEP_TEMPLATE_FILE_PATH) as f:
+            return next(
+                step for step in yaml.safe_load(f)["steps"] if step["name"] == "CustomScript"
+            )
+
+    def create_script_step(
+        self, step_template: dict, tmp_path, argument_name: str, int_range: str, values: list
+    ):
+        from deadline.unreal_submitter.unreal_open_job.job_step import CustomScriptJobStep
+
+        script_path = tmp_path / "custom_script.py"
+        script_path.write_text("def main(**kwargs):\n    pass\n")
+        step_settings = MagicMock()
+        step_settings.name = "FanOut"
+        step_settings.depends_on = []
+        step_settings.script.file_path = str(script_path)
+        step_settings.task_argument_name = argument_name
+        step_settings.task_int_range = int_range
+        step_settings.task_values = values
+
+        return CustomScriptJobStep(
+            step_template=step_template,
+            step_settings=step_settings,
+            host_requirements=MagicMock(),
+            queue_manifest_path=MagicMock(),
+            shots_count=1,
+            task_chunk_size=1,
+        )
+
+    @staticmethod
+    def render_run_data(step: dict, task_argument: str) -> dict:
+        """Substitute the task parameters into the run data like the worker does"""
+        run_data = step["script"]["embeddedFiles"][0]["data"]
+        return yaml.safe_load(
+            run_data.replace("{{Task.Param.Handler}}", "custom")
+            .replace("{{Task.Param.ScriptPath}}", "script.py")
+            .replace("{{Task.Param.TaskArgument}}", task_argument)
+        )
+
+    @pytest.mark.parametrize(
+        "argument_name, int_range, values, expected_definition, expected_args",
+        [
+            (
+                "frame",
+                "1-100:10, 200",
+                ["ignored"],
+                {"name": "TaskArgument", "type": "INT", "range": "1-100:10, 200"},
+                {"frame": 11},
+            ),
+            (
+                "shot_name",
+                "",
+                ["Shot010", 'Shot "020"'],
+                {"name": "TaskArgument", "type": "STRING", "range": ["Shot010", 'Shot "020"']},
+                {"shot_name": 'Shot "020"'},
+            ),
+            (
+                "asset path",
+                "",
+                ["  C:\\Assets\\#1: it's"],
+                {"name": "TaskArgument", "type": "STRING", "range": ["  C:\\Assets\\#1: it's"]},
+                {"asset path": "  C:\\Assets\\#1: it's"},
+            ),
+        ],
+    )
+    def test_task_argument(
+        self,
+        step_template: dict,
+        tmp_path,
+        argument_name: str,
+        int_range: str,
+        values: list,
+        expected_definition: dict,
+        expected_args: dict,
+    ):
+        # GIVEN
+        step = self.create_script_step(step_template, tmp_path, argument_name, int_range, values)
+
+        # WHEN
+        step_dict = step.as_dict()
+        task_argument = expected_definition["range"][-1] if values and not int_range else "11"
+        run_data = self.render_run_data(step_dict, task_argument)
+
+        # THEN
+        definitions = step_dict["parameterSpace"]["taskParameterDefinitions"]
+        assert [definition["name"] for definition in definitions] == [
+            "Handler",
+            "ScriptPath",
+            "TaskArgument",
+        ]
+        assert definitions[-1] == expected_definition
+        assert run_data["script_args"] == expected_args
+
+    def test_without_task_argument(self, step_template: dict, tmp_path):
+        # WHEN
+        step_dict = self.create_script_step(step_template, tmp_path, "", "", []).as_dict()
+
+        # THEN
+        assert (
+            step_dict == self.create_script_step(step_template, tmp_path, "", "1-10", []).as_dict()
+        )
+        assert "script_args" not in self.render_run_data(step_dict, "")
+
+    @pytest.mark.parametrize(
+        "int_range, values, expected_error",
+        [
+            ("", [], "has no integer range or values"),
+            ("1-", [], "is not valid"),
+            ("a-b", ["Shot010"], "is not valid"),
+            ("", ["Shot010", "Shot\n020"], "can't have the line breaks"),
+        ],
+    )
+    def test_invalid_task_argument(
+        self, step_template: dict, tmp_path, int_range: str, values: list, expected_error: str
+    ):
+        # WHEN
+        with pytest.raises(Exception) as exc_info:
+            self.create_script_step(step_template, tmp_path, "frame", int_range, values)
+
+        # THEN
+        assert expected_error in str(exc_info.value)
@@ -1,6 +1,7 @@
 import sys
+import yaml
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 sys.modules["unreal"] = MagicMock()
 
@@ -87,3 +88,355 @@ class TestShotChunks:
         chunk_id_param = next((p for p in parameters if p["name"] == "ChunkId"), None)
         assert chunk_id_param is not None
         assert chunk_id_param["range"] == expected_chunk_id
+
+    @pytest.mark.parametrize(
+        "chunk_size, shots_count, chunks_per_task, expected_chunk_ids",
+        [
+            (1, 5, 2, ["0,1", "2,3", "4"]),
+            (2, 15, 4, ["0,1,2,3", "4,5,6,7"]),
+            (5, 5, 3, ["0"]),
+        ],
+    )
+    def test_chunks_per_task(
+        self, chunk_size: int, shots_count: int, chunks_per_task: int, expected_chunk_ids: list
+    ):
+
+        from deadline.unreal_submitter.unreal_open_job.job_step import RenderJobStep
+
+        render_step = RenderJobStep(
+            step_template={
+                "parameterSpace": {
+                    "taskParameterDefinitions": [
+                        {"name": "ChunkSize", "type": "INT"},
+                        {"name": "ChunkId", "type": "INT"},
+                    ]
+                },
+                "script": {
+                    "embeddedFiles": [
+                        {
+                            "name": "runData",
+                            "data": "chunk_id: {{Task.Param.ChunkId}}\n"
+                            "chunk_size: {{Task.Param.ChunkSize}}\n",
+                        }
+                    ]
+                },
+            },
+            step_settings=MagicMock(),
+            host_requirements=MagicMock(),
+            queue_manifest_path=MagicMock(),
+            shots_count=shots_count,
+            task_chunk_size=chunk_size,
+            chunks_per_task=chunks_per_task,
+        )
+        parameters = render_step._job_step["parameterSpace"]["taskParameterDefinitions"]
+
+        assert next((p for p in parameters if p["name"] == "ChunkId"), None) is None
+        chunk_ids_param = next((p for p in parameters if p["name"] == "ChunkIds"), None)
+        assert chunk_ids_param == {
+            "name": "ChunkIds",
+            "type": "STRING",
+            "range": expected_chunk_ids,
+        }
+
+        run_data = render_step._job_step["script"]["embeddedFiles"][0]["data"]
+        assert (
+            run_data
+            == "chunk_ids: [{{Task.Param.ChunkIds}}]\nchunk_size: {{Task.Param.ChunkSize}}\n"
+        )
+
+    @pytest.mark.parametrize(
+        "shot_frame_ranges, max_frames_per_task, expected_frame_ranges",
+        [
+            ([("sh010", 0, 2000)], 500, [("sh010", i, i + 500) for i in range(0, 2000, 500)]),
+            (
+                [("sh010", 10, 17), ("sh020", 17, 20)],
+                3,
+                [("sh010", 10, 12), ("sh010", 12, 14), ("sh010", 14, 17), ("sh020", 17, 20)],
+            ),
+        ],
+    )
+    def test_frame_ranges(
+        self, shot_frame_ranges: list, max_frames_per_task: int, expected_frame_ranges: list
+    ):
+        # GIVEN
+        from deadline.unreal_submitter.unreal_open_job.job_step import RenderJobStep
+
+        step_template = {
+            "parameterSpace": {
+                "taskParameterDefinitions": [
+                    {"name": "Handler", "type": "STRING", "range": ["render"]},
+                    {"name": "ChunkId", "type": "INT"},
+                    {"name": "ChunkSize", "type": "INT"},
+                ]
+            },
+            "script": {
+                "embeddedFiles": [
+                    {
+                        "name": "runData",
+                        "data": "chunk_id: {{Task.Param.ChunkId}}\n"
+                        "chunk_size: {{Task.Param.ChunkSize}}\n",
+                    }
+                ]
+            },
+        }
+
+        # WHEN
+        render_step = RenderJobStep(
+            step_template=step_template,
+            step_settings=MagicMock(),
+            host_requirements=MagicMock(),
+            queue_manifest_path=MagicMock(),
+            shots_count=len(shot_frame_ranges),
+            task_chunk_size=1,
+            shot_frame_ranges=shot_frame_ranges,
+            max_frames_per_task=max_frames_per_task,
+        )
+
+        # THEN
+        parameter_space = render_step._job_step["parameterSpace"]
+        assert parameter_space["combination"] == "(ShotName, FrameStart, FrameEnd)"
+        assert parameter_space["taskParameterDefinitions"] == [
+            {"name": "Handler", "type": "STRING", "range": ["render"]},
+            {"name": "ShotName", "type": "STRING", "range": [r[0] for r in expected_frame_ranges]},
+            {"name": "FrameStart", "type": "INT", "range": [r[1] for r in expected_frame_ranges]},
+            {"name": "FrameEnd", "type": "INT", "range": [r[2] for r in expected_frame_ranges]},
+        ]
+        run_data = render_step._job_step["script"]["embeddedFiles"][0]["data"]
+        assert run_data == (
+            "shot_names:\n"
+            "  - |2-\n"
+            "    {{Task.Param.ShotName}}\n"
+            "frame_range: [{{Task.Param.FrameStart}}, {{Task.Param.FrameEnd}}]\n"
+        )
+        assert yaml.safe_load(
+            run_data.replace("{{Task.Param.ShotName}}", 'sh "010" \\ A')
+            .replace("{{Task.Param.FrameStart}}", "10")
+            .replace("{{Task.Param.FrameEnd}}", "12")
+        ) == {"shot_names": ['sh "010" \\ A'], "frame_range": [10, 12]}
+
+    @pytest.mark.parametrize(
+        "chunks_per_task, balance_chunks_by_frames, expected_warning",
+        [
+            (1, False, None),
+            (2, False, "so chunks per task (2) is ignored"),
+            (1, True, "so balance chunks by frames is ignored"),
+        ],
+    )
+    def test_frame_ranges_conflicting_settings(
+        self, chunks_per_task: int, balance_chunks_by_frames: bool, expected_warning
+    ):
+        # GIVEN
+        from deadline.unreal_submitter.unreal_open_job.job_step import RenderJobStep
+
+        step_template = {
+            "parameterSpace": {
+                "taskParameterDefinitions": [
+                    {"name": "ChunkId", "type": "INT"},
+                    {"name": "ChunkSize", "type": "INT"},
+                ]
+            },
+            "script": {
+                "embeddedFiles": [
+                    {
+                        "name": "runData",
+                        "data": "chunk_id: {{Task.Param.ChunkId}}\n"
+                        "chunk_size: {{Task.Param.ChunkSize}}\n",
+                    }
+                ]
+            },
+        }
+
+        # WHEN
+        with patch("deadline.unreal_submitter.unreal_open_job.job_step.logger") as logger_mock:
+            render_step = RenderJobStep(
+                step_template=step_template,
+                step_settings=MagicMock(),
+                host_requirements=MagicMock(),
+                queue_manifest_path=MagicMock(),
+                shots_count=2,
+                task_chunk_size=1,
+                chunks_per_task=chunks_per_task,
+                shot_frame_ranges=[("sh010", 0, 100), ("sh020", 100, 110)],
+                max_frames_per_task=50,
+                balance_chunks_by_frames=balance_chunks_by_frames,
+            )
+
+        # THEN
+        assert "ShotName" in [
+            definition["name"]
+            for definition in render_step._job_step["parameterSpace"]["taskParameterDefinitions"]
+        ]
+        if expected_warning is None:
+            logger_mock.warning.assert_not_called()
+        else:
+            assert expected_warning in logger_mock.warning.call_args.args[0]
+
+    def test_frame_ranges_without_chunk_run_data(self):
+        # GIVEN
+        from deadline.unreal_submitter.unreal_open_job.job_step import RenderJobStep
+
+        step_template = {
+            "parameterSpace": {"taskParameterDefinitions": [{"name": "ChunkId", "type": "INT"}]},
+            "script": {"embeddedFiles": [{"name": "runData", "data": "handler: render\n"}]},
+        }
+
+        # WHEN
+        with pytest.raises(Exception) as exc_info:
+            RenderJobStep(
+                step_template=step_template,
+                step_settings=MagicMock(),
+                host_requirements=MagicMock(),
+                queue_manifest_path=MagicMock(),
+                shots_count=1,
+                task_chunk_size=1,
+                shot_frame_ranges=[("sh010", 0, 100)],
+                max_frames_per_task=50,
+            )
+
+        # THEN
+        assert "has no line 'chunk_id: {{Task.Param.ChunkId}}'" in str(exc_info.value)
+
+    def test_frame_ranges_below_threshold(self):
+        # GIVEN
+        from deadline.unreal_submitter.unreal_open_job.job_step import RenderJobStep
+
+        # WHEN
+        render_step = RenderJobStep(
+            step_template={
+                "parameterSpace": {
+                    "taskParameterDefinitions": [
+                        {"name": "ChunkSize", "type": "INT"},
+                        {"name": "ChunkId", "type": "INT"},
+                    ]
+                }
+            },
+            step_settings=MagicMock(),
+            host_requirements=MagicMock(),
+            queue_manifest_path=MagicMock(),
+            shots_count=2,
+            task_chunk_size=1,
+            shot_frame_ranges=[("sh010", 0, 100), ("sh020", 100, 150)],
+            max_frames_per_task=100,
+        )
+
+        # THEN
+        parameter_space = render_step._job_step["parameterSpace"]
+        assert "combination" not in parameter_space
+        assert [p["name"] for p in parameter_space["taskParameterDefinitions"]] == [
+            "ChunkSize",
+            "ChunkId",
+        ]
+
+    @pytest.mark.parametrize(
+        "shot_lengths, chunks_count, expected_chunks",
+        [
+            ([1500, 12, 40, 30, 700, 800], 2, [["sh0", "sh2"], ["sh1", "sh3", "sh4", "sh5"]]),
+            ([100, 100, 100, 100], 2, [["sh0", "sh2"], ["sh1", "sh3"]]),
+            ([10, 20], 5, [["sh0"], ["sh1"]]),
+        ],
+    )
+    def test_balance_chunks(
+        self, shot_lengths: list[int], chunks_count: int, expected_chunks: list[list[str]]
+    ):
+        # GIVEN
+        from deadline.unreal_submitter.unreal_open_job.job_step import RenderJobStep
+
+        shot_frame_ranges = []
+        start_frame = 0
+        for i, length in enumerate(shot_lengths):
+            shot_frame_ranges.append((f"sh{i}", start_frame, start_frame + length))
+            start_frame += length
+
+        # WHEN
+        chunks = RenderJobStep.balance_chunks(shot_frame_ranges, chunks_count)
+
+        # THEN
+        assert chunks == expected_chunks
+
+    def test_balanced_chunk_parameters(self):
+        # GIVEN
+        from deadline.unreal_submitter.unreal_open_job.job_step import RenderJobStep
+
+        step_template = {
+            "parameterSpace": {
+                "taskParameterDefinitions": [
+                    {"name": "ChunkId", "type": "INT"},
+                    {"name": "ChunkSize", "type": "INT"},
+                ]
+            },
+            "script": {
+                "embeddedFiles": [
+                    {
+                        "name": "runData",
+                        "data": "handler: render\n"
+                        "chunk_id: {{Task.Param.ChunkId}}\n"
+                        "chunk_size: {{Task.Param.ChunkSize}}\n",
+                    }
+                ]
+            },
+        }
+
+        # WHEN
+        render_step = RenderJobStep(
+            step_template=step_template,
+            step_settings=MagicMock(),
+            host_requirements=MagicMock(),
+            queue_manifest_path=MagicMock(),
+            shots_count=4,
+            task_chunk_size=2,
+            shot_frame_ranges=[("sh010", 0, 12), ("sh020", 12, 1512), ('sh "030"', 1512, 1600)],
+            balance_chunks_by_frames=True,
+        )
+
+        # THEN
+        assert render_step._job_step["parameterSpace"]["taskParameterDefinitions"] == [
+            {"name": "ChunkId", "type": "INT", "range": [0, 1]}
+        ]
+        run_data = render_step._job_step["script"]["embeddedFiles"][0]["data"]
+        assert run_data == (
+            "handler: render\n"
+            "chunk_id: {{Task.Param.ChunkId}}\n"
+            'shot_chunks: [["sh010", "sh \\"030\\""], ["sh020"]]\n'
+        )
+        assert yaml.safe_load(run_data.replace("{{Task.Param.ChunkId}}", "0")) == {
+            "handler": "render",
+            "chunk_id": 0,
+            "shot_chunks": [["sh010", 'sh "030"'], ["sh020"]],
+        }
+
+    def test_resume_existing_frames(self):
+        # GIVEN
+        from deadline.unreal_submitter.unreal_open_job.job_step import RenderJobStep
+
+        # WHEN
+        render_step = RenderJobStep(
+            step_template={
+                "parameterSpace": {
+                    "taskParameterDefinitions": [
+                        {"name": "ChunkSize", "type": "INT"},
+                        {"name": "ChunkId", "type": "INT"},
+                    ]
+                },
+                "script": {
+                    "embeddedFiles": [
+                        {
+                            "name": "runData",
+                            "data": "chunk_id: {{Task.Param.ChunkId}}\n"
+                            "chunk_size: {{Task.Param.ChunkSize}}\n",
+                        }
+                    ]
+                },
+            },
+            step_settings=MagicMock(),
+            host_requirements=MagicMock(),
+            queue_manifest_path=MagicMock(),
+            shots_count=2,
+            task_chunk_size=1,
+            resume_existing_frames=True,
+        )
+
+        # THEN
+        run_data = render_step._job_step["script"]["embeddedFiles"][0]["data"]
+        assert run_data == (
+            "chunk_id: {{Task.Param.ChunkId}}\nchunk_size: {{Task.Param.ChunkSize}}\nresume: true\n"
+        )
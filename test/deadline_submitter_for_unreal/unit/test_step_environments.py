@@ -0,0 +1,87 @@
+import sys
+import yaml
+import pytest
+from unittest.mock import MagicMock
+
+sys.modules["unreal"] = MagicMock()
+
+
+class TestStepEnvironments:
+
+    @pytest.fixture
+    def job_template(self) -> dict:
+        from deadline.unreal_submitter.settings import DEFAULT_JOB_TEMPLATE_FILE_PATH
+
+        with open(DEFAULT_JOB_TEMPLATE_FILE_PATH) as f:
+            return yaml.safe_load(f)
+
+    @pytest.fixture
+    def step_templates(self) -> dict:
+        from deadline.unreal_submitter.settings import DEFAULT_JOB_STEP_TEMPLATE_FILE_PATH
+
+        with open(DEFAULT_JOB_STEP_TEMPLATE_FILE_PATH) as f:
+            return {step["name"]: step for step in yaml.safe_load(f)["steps"]}
+
+    def create_script_step(self, step_templates: dict, tmp_path, requires_editor: bool):
+        from deadline.unreal_submitter.unreal_open_job.job_step import CustomScriptJobStep
+
+        script_path = tmp_path / "custom_script.py"
+        script_path.write_text("def main():\n    pass\n")
+        step_settings = MagicMock()
+        step_settings.name = f"Script{requires_editor}"
+        step_settings.depends_on = []
+        step_settings.requires_editor = requires_editor
+        step_settings.task_argument_name = ""
+        step_settings.script.file_path = str(script_path)
+
+        return CustomScriptJobStep(
+            step_template=step_templates["CustomScript"],
+            step_settings=step_settings,
+            host_requirements=MagicMock(),
+            queue_manifest_path=MagicMock(),
+            shots_count=1,
+            task_chunk_size=1,
+        )
+
+    def test_all_steps_require_editor(self, job_template: dict, step_templates: dict, tmp_path):
+        # GIVEN
+        from deadline.unreal_submitter.unreal_open_job.open_job_description import (
+            OpenJobDescription,
+        )
+
+        steps = [self.create_script_step(step_templates, tmp_path, requires_editor=True)]
+
+        # WHEN
+        OpenJobDescription.split_editor_environment(job_template, steps)
+
+        # THEN
+        assert [env["name"] for env in job_template["jobEnvironments"]] == ["LaunchUnrealEditor"]
+        assert "stepEnvironments" not in steps[0].as_dict()
+
+    def test_step_without_editor(self, job_template: dict, step_templates: dict, tmp_path):
+        # GIVEN
+        from deadline.unreal_submitter.unreal_open_job.open_job_description import (
+            OpenJobDescription,
+        )
+
+        editor_environment = job_template["jobEnvironments"][0]
+        editor_step = self.create_script_step(step_templates, tmp_path, requires_editor=True)
+        script_step = self.create_script_step(step_templates, tmp_path, requires_editor=False)
+
+        # WHEN
+        OpenJobDescription.split_editor_environment(job_template, [editor_step, script_step])
+
+        # THEN
+        assert "jobEnvironments" not in job_template
+        assert editor_step.as_dict()["stepEnvironments"] == [editor_environment]
+
+        script_environments = script_step.as_dict()["stepEnvironments"]
+        assert [env["name"] for env in script_environments] == ["LaunchPythonScriptPool"]
+        assert (
+            script_environments[0]["script"]["actions"] == editor_environment["script"]["actions"]
+        )
+        init_data = script_environments[0]["script"]["embeddedFiles"][0]["data"]
+        assert yaml.safe_load(init_data.replace("{{Param.ProjectFilePath}}", "Game.uproject")) == {
+            "project_path": "Game.uproject",
+            "requires_editor": False,
+        }